@@ -9,6 +9,10 @@ from pathlib import Path
 from dotenv import load_dotenv
 from SynMem import SynMem
 
+from TechBook_Utils.MemoryWriter import MemoryWriter
+from TechBook_Utils.MemoryReader import MemoryReader
+from TechBook_Utils.MemoryCatalog import MemoryCatalog
+
 
 load_dotenv()
 logger = logging.getLogger(__name__)
@@ -45,6 +49,9 @@ class Database:
         # Long-term memory created image details directory (keep name consistent with STM)
         self.ltmCreatedImageDetails = self.getDir(self.baseMemoryDir, "LTM", "CreatedImageDetails")
 
+        # Index of every STM and LTM entry by user and date, used for date range lookups
+        self.memoryCatalog = self.getDir(self.baseMemoryDir, "Catalog.db")
+
     def getDir(self, *paths):
         """
         Get the absolute path for the given directory paths.
@@ -76,6 +83,12 @@ class Memory:
         self.db           = Database()
         self.synMem       = SynMem()
         self.sessionStart = datetime.now()
+        self.writer       = MemoryWriter()
+        self.writeBehind  = os.getenv("WRITE_BEHIND_MEMORY", "False") == "True"  # Queue turns and write them in batches off the response path.
+        self.reader       = MemoryReader()
+        self.pooledReads  = os.getenv("POOL_MEMORY_CONNECTIONS", "False") == "True"  # Read through cached per-thread database handles.
+        self.catalog      = MemoryCatalog()
+        self.indexedReads = os.getenv("INDEX_MEMORY", "False") == "True"  # Answer date range lookups from the STM+LTM catalog.
 
         self.sensoryLimit       = 10
         self.sensoryExpireUnit  = "days"
@@ -91,6 +104,8 @@ class Memory:
         self.cleanupExpireValue = 15
 
         self.perceptionLimit    = 10
+        self.changeHooks        = []
+        self.dirCache           = {}
         self._setSynMemDirs()
         self._setSynMemConfig()
         self._startAutoMaintenance()
@@ -187,9 +202,26 @@ class Memory:
     def getDir(self, *paths):
         """
         Get the absolute path for the given directory paths.
-        This method resolves the paths relative to the current working directory.
+        This method resolves the paths relative to the current working directory, once per set of paths.
         """
-        return str(Path(*paths).resolve())
+        path = self.dirCache.get(paths)
+        if path is None:
+            path = self.dirCache.setdefault(paths, str(Path(*paths).resolve()))
+        return path
+
+    def onChange(self, callback):
+        """
+        Register a callback that runs whenever the memory is saved to or cleared.
+        Use it to drop anything cached from the memory, like the info groups the Logic class builds prompts from.
+        """
+        self.changeHooks.append(callback)
+
+    def _notifyChange(self):
+        for callback in list(self.changeHooks):
+            try:
+                callback()
+            except Exception:
+                logger.error("Error running memory change hook:", exc_info=True)
 
     def getTimedelta(self, unit, value):
         """
@@ -211,10 +243,39 @@ class Memory:
         """
         Save the content and response to memory.
         This method saves sensory memory, conversation details, and interaction details.
+        With WRITE_BEHIND_MEMORY enabled they are queued and written in batches, so the response never waits on the disk.
         """
-        self.saveSensory(content, response)
-        self.saveConversationDetails(content, response)
-        self.saveInteractionDetails()
+        if self.writeBehind:
+            self._queueToMemory(content, response)
+        else:
+            self.saveSensory(content, response)
+            self.saveConversationDetails(content, response)
+            self.saveInteractionDetails()
+        self._notifyChange()
+
+    def _queueToMemory(self, content: str, response: str) -> None:
+        """
+        Queue the sensory, conversation and interaction records of a turn with the memory writer.
+        The user name and timestamp are looked up once for all three, and reads flush the queue first.
+        """
+        userName  = self.getCurrentUserName()
+        timestamp = datetime.now().isoformat()
+        content   = content.decode('utf-8', errors='replace') if isinstance(content, bytes) else str(content)
+        self.writer.write(
+            self.getDir(self.db.senDir, f"{userName}.db"),
+            {"dtStamp": timestamp, "content": content, "response": response},
+            self.synMem.createPersonalDatabase, limit=self.sensoryLimit
+        )
+        self.writer.write(
+            self.getDir(self.db.stmUserConversationDetails, "STM.db"),
+            {"user": userName, "dtStamp": timestamp, "content": content, "response": response},
+            self.synMem.createMemoryDatabase
+        )
+        self.writer.write(
+            self.getDir(self.db.stmUserInteractionDetails, "Details.db"),
+            {"dtStamp": timestamp, "content": userName},
+            self.synMem.createDetailsDatabase
+        )
 
     def saveSensory(self, ctx, response):
         """
@@ -256,7 +317,10 @@ class Memory:
         Retrieve the sensory memory for the current user.
         This method retrieves the sensory memory from the SynMem instance.
         """
+        self.writer.flush()
         senDb = self.getDir(self.db.senDir, f"{self.getCurrentUserName()}.db")
+        if self.pooledReads:
+            return self.reader.retrieveSensory(senDb)
         return self.synMem.retrieveSensory(senDb)
 
     def retrieveConversationDetails(self, user: str = None, startDate: str = None, endDate: str = None) -> str:
@@ -264,12 +328,22 @@ class Memory:
         Retrieve the conversation details for the specified user.
         If no user is specified, it retrieves the details for the current user.
         The startDate and endDate parameters can be used to filter the results.
+        With INDEX_MEMORY enabled the entries come from the catalog, oldest first across STM and LTM.
         """
+        self.writer.flush()
         user = user or self.getCurrentUserName()
         paths = [
             self.getDir(self.db.stmUserConversationDetails),
             self.getDir(self.db.ltmUserConversationDetails)
         ]
+        dbs = [self.getDir(paths[0], "STM.db"), self.getDir(paths[1], "LTM.db")]
+        if self.indexedReads:
+            sources = [("STM", dbs[0]), ("LTM", dbs[1])]
+            return list(self.catalog.query(
+                self.db.memoryCatalog, sources, "memory", user, self.synMem.formatIsoDate(startDate), self.synMem.formatIsoDate(endDate)
+            ))
+        if self.pooledReads:
+            return self.reader.retrieveConversationDetails(user, dbs, self.synMem.formatIsoDate(startDate), self.synMem.formatIsoDate(endDate))
         return self.synMem.retrieveConversationDetails(user, paths, startDate, endDate)
 
     def retrieveInteractionDetails(self, startDate: str = None, endDate: str = None) -> str:
@@ -277,10 +351,19 @@ class Memory:
         Retrieve the interaction details for the current user.
         The startDate and endDate parameters can be used to filter the results.
         """
+        self.writer.flush()
         paths = [
             self.getDir(self.db.stmUserInteractionDetails),
             self.getDir(self.db.ltmUserInteractionDetails)
         ]
+        dbs = [self.getDir(path, "Details.db") for path in paths]
+        if self.indexedReads:
+            sources = [("STM", dbs[0]), ("LTM", dbs[1])]
+            return list(self.catalog.query(
+                self.db.memoryCatalog, sources, "details", None, self.synMem.formatIsoDate(startDate), self.synMem.formatIsoDate(endDate)
+            ))
+        if self.pooledReads:
+            return self.reader.retrieveDetails(dbs, self.synMem.formatIsoDate(startDate), self.synMem.formatIsoDate(endDate))
         return self.synMem.retrieveInteractionDetails(paths, startDate, endDate)
 
     def retrieveImageDetails(self, startDate: str = None, endDate: str = None) -> str:
@@ -293,6 +376,14 @@ class Memory:
             self.getDir(self.db.stmCreatedImageDetails),
             self.getDir(self.db.ltmCreatedImageDetails)
         ]
+        dbs = [self.getDir(path, "Details.db") for path in paths]
+        if self.indexedReads:
+            sources = [("STM", dbs[0]), ("LTM", dbs[1])]
+            return list(self.catalog.query(
+                self.db.memoryCatalog, sources, "details", None, self.synMem.formatIsoDate(startDate), self.synMem.formatIsoDate(endDate)
+            ))
+        if self.pooledReads:
+            return self.reader.retrieveDetails(dbs, self.synMem.formatIsoDate(startDate), self.synMem.formatIsoDate(endDate))
         return self.synMem.retrieveImageDetails(paths, startDate, endDate)
 
     def retrieveLastInteractionDate(self, user: str = None) -> str:
@@ -301,6 +392,7 @@ class Memory:
         If no user is specified, it retrieves the date for the current user.
         The date is retrieved from the sensory memory, short-term memory, and long-term memory directories.
         """
+        self.writer.flush()
         user = user or self.getCurrentUserName()
         userName = user.capitalize()
         paths = [
@@ -308,6 +400,8 @@ class Memory:
             self.getDir(self.db.stmUserConversationDetails),
             self.getDir(self.db.ltmUserConversationDetails)
         ]
+        if self.pooledReads:
+            return self._retrieveLastTimestamp(userName, paths) or self.sessionStart
         return self.synMem.retrieveLastInteractionDate(userName, paths)
 
     def retrieveLastInteractionTime(self, user: str = None) -> str:
@@ -316,6 +410,7 @@ class Memory:
         If no user is specified, it retrieves the time for the current user.
         The time is retrieved from the sensory memory, short-term memory, and long-term memory directories.
         """
+        self.writer.flush()
         user = user or self.getCurrentUserName()
         userName = user.capitalize()
         paths = [
@@ -323,8 +418,21 @@ class Memory:
             self.getDir(self.db.stmUserConversationDetails),
             self.getDir(self.db.ltmUserConversationDetails)
         ]
+        if self.pooledReads:
+            return datetime.now() - (self._retrieveLastTimestamp(userName, paths) or self.sessionStart)
         return self.synMem.retrieveLastInteractionTime(userName, paths)
 
+    def _retrieveLastTimestamp(self, userName: str, paths: list):
+        """
+        Get the newest timestamp of userName from the sensory, short-term and long-term memory directories in paths.
+        """
+        return self.reader.retrieveLastTimestamp(
+            userName,
+            self.getDir(paths[0], f"{userName}.db"),
+            self.getDir(paths[1], "STM.db"),
+            self.getDir(paths[2], "LTM.db")
+        )
+
     # ─── Checks ────────────────────────────────────────────────────────
     def _startAutoMaintenance(self, interval=5*60):  # every 5 mins
         """
@@ -332,8 +440,17 @@ class Memory:
         This method starts a background thread that performs maintenance tasks at the specified interval.
         The interval is in seconds, defaulting to 5 minutes.
         This is for everything besides Sensory Memory. as if you run this on Sensory Memory it will create ERRORS.
-        """
-        self.synMem.startAutoMaintenance(interval)
+        Every check runs with the memory writer paused, see _runMaintenance.
+        """
+        def loop():
+            while True:
+                self._runMaintenance([
+                    lambda: self.synMem.archiveConversationDetails(self.synMem.memoryExpireUnit, self.synMem.memoryExpireValue),
+                    lambda: self.synMem.archiveInteractionDetails(self.synMem.memoryExpireUnit, self.synMem.memoryExpireValue),
+                    lambda: self.synMem.archiveImageDetails(self.synMem.memoryExpireUnit, self.synMem.memoryExpireValue),
+                ])
+                time.sleep(interval)
+        threading.Thread(target=loop, name="MemoryMaintenance", daemon=True).start()
 
     def _performStartupChecks(self, delay: int = 1):
         """
@@ -342,7 +459,23 @@ class Memory:
         This is For Sensory Memory only.
         The delay is in seconds, defaulting to 1 second.
         """
-        self.synMem.performStartupChecks(delay)
+        self._runMaintenance([
+            lambda: self.synMem.removeOldSensory(self.synMem.sensoryExpireUnit, self.synMem.sensoryExpireValue),
+        ], delay)
+
+    def _runMaintenance(self, checks, delay: int = 1):
+        """
+        Run maintenance checks one at a time inside writer.paused().
+        Queued records are written and every cached handle is checkpointed and closed before each check, and no
+        new writes start until it is done, so the databases it moves or deletes are complete and nothing is left open on them.
+        """
+        for check in checks:
+            try:
+                with self.writer.paused():
+                    check()
+            except Exception:
+                logger.error("Error running memory maintenance:", exc_info=True)
+            time.sleep(delay)
 
     # ─── Clear ────────────────────────────────────────────────────────
     def clearPerception(self):
@@ -357,21 +490,30 @@ class Memory:
         Clear the first entry in the Sensory Memory and Short-Term Memory per current user.
         This method clears the first entry in the sensory memory and short-term memory directories.
         """
-        return self.synMem.clearFirstEntry()
+        with self.writer.paused():
+            result = self.synMem.clearFirstEntry()
+        self._notifyChange()
+        return result
 
     def clearLastEntry(self):
         """
         Clear the last entry in the Sensory Memory and Short-Term Memory per current user.
         This method clears the last entry in the sensory memory and short-term memory directories.
         """
-        return self.synMem.clearLastEntry()
+        with self.writer.paused():
+            result = self.synMem.clearLastEntry()
+        self._notifyChange()
+        return result
 
     def clearAllEntries(self):
         """
         Clear all entries in the Sensory Memory, Short-Term Memory, and Long-Term Memory per current user.
         This method clears all entries in the sensory memory, short-term memory, and long-term memory directories.
         """
-        return self.synMem.clearAllEntries()
+        with self.writer.paused():
+            result = self.synMem.clearAllEntries()
+        self._notifyChange()
+        return result
 
     # ─── Image ────────────────────────────────────────────────────────
     def saveCreatedImage(self, imageSubject: str, imageData: str) -> None:
@@ -399,6 +541,7 @@ class Memory:
         This method retrieves and displays the database entries from the SynMem instance.
         The limit parameter can be used to limit the number of entries displayed.
         """
+        self.writer.flush()
         return self.synMem.viewDatabase(path, limit) 
 
     def viewDetailsDatabase(self, path: str, limit=None):
@@ -407,6 +550,7 @@ class Memory:
         This method retrieves and displays the details of the database entries from the SynMem instance.
         The limit parameter can be used to limit the number of entries displayed.
         """
+        self.writer.flush()
         return self.synMem.viewDetailsDatabase(path, limit) 
 
     # ─── Print ────────────────────────────────────────────────────────
@@ -426,12 +570,24 @@ class Memory:
 
 
 from TechBook_Utils.SkillGraph import SkillGraph
+from TechBook_Utils.SkillInstructions import CHARS_PER_TOKEN
 # The logic class was taken from another personal project and modified to fit this example.
 # A lot has been removed to simplify the example to show how you can use the Logic class to manage the information groups.
 class Logic:
     def __init__(self):
-        self.graph  = SkillGraph()
-        self.memory = Memory()
+        self.graph          = SkillGraph()
+        self.memory         = Memory()
+        self.groupLock      = threading.Lock()
+        self.groupCache     = {}  # group -> text, kept until the memory changes
+        self.sourceCache    = {}  # memory source -> value, so groups sharing a source read it once
+        self.groupVersion   = 0
+        self.volatileGroups = {"datetime"}  # Never memoized, they change on their own.
+        self.infoGroups     = self._createInfoProviders()
+        self.staticGroups   = ("identity", "personality", "objective")  # Same for the whole session, sent first.
+        self.dynamicGroups  = ("datetime", "interaction", "discussion")  # Refreshed every turn, sent last.
+        self.dynamicBudget  = int(os.getenv("PROMPT_DYNAMIC_TOKENS", 1000))  # Most tokens the dynamic groups may add.
+        self.staticPrefixes = {}  # prompt name -> (text, tokens)
+        self.memory.onChange(self.invalidateInfoGroups)
         #self._displayInfoGroup()
 
     def _getDateTime(self, mode="date"):
@@ -441,35 +597,77 @@ class Logic:
             return now.strftime("%I:%M %p")
         return now.strftime("%A, %B %d, %Y")
 
+    def _getMemoized(self, cache, key, provider):
+        """
+        Get a value from cache, calling provider only on a miss.
+        A value computed while the memory changed is returned but not kept.
+        """
+        with self.groupLock:
+            if key in cache:
+                return cache[key]
+            version = self.groupVersion
+        value = provider()
+        with self.groupLock:
+            if version == self.groupVersion:
+                cache[key] = value
+        return value
+
+    def _getSource(self, name, fetch):
+        return self._getMemoized(self.sourceCache, name, fetch)
+
+    def invalidateInfoGroups(self):
+        """
+        Drop the memoized info groups and memory sources so the next prompt reads them again.
+        Registered with Memory.onChange, so it runs after every saveToMemory and clear.
+        """
+        with self.groupLock:
+            self.groupVersion += 1
+            self.groupCache.clear()
+            self.sourceCache.clear()
+
     def _createInfoGroup(self, group):
-        groups = {
-            "identity": (
+        provider = self.infoGroups.get(group)
+        if provider is None:
+            return ""
+        if group in self.volatileGroups:
+            return provider()
+        return self._getMemoized(self.groupCache, group, provider)
+
+    def _createInfoProviders(self):
+        """
+        Build the info group providers. Each one is only called when its group is asked for,
+        and the memory sources they read are shared between them.
+        """
+        userName        = lambda: self._getSource("userName", self.memory.getCurrentUserName)
+        lastInteraction = lambda: self._getSource("lastInteraction", lambda: self.memory.retrieveLastInteractionDate(userName()))
+        sensory         = lambda: self._getSource("sensory", self.memory.retrieveSensory)
+        return {
+            "identity": lambda: (
                 f"You are a very helpful assistant named JAX. "
                 f"Your were created by Tristan McBride Sr.. "
             ),
-            "personality": (
+            "personality": lambda: (
                 f"Personality: A hint of sarcasm, and a cheeky attitude. "
                 f"Motto: I am the future of intelligence."
             ),
-            "interaction": (
+            "interaction": lambda: (
                 #f"Previously spoke with: {self._getUserName()}. "
-                f"Currently speaking with: {self.memory.getCurrentUserName()}. "
-                f"Last interaction with {self.memory.getCurrentUserName()} was on {self.memory.retrieveLastInteractionDate(self.memory.getCurrentUserName())}. "
+                f"Currently speaking with: {userName()}. "
+                f"Last interaction with {userName()} was on {lastInteraction()}. "
             ),
-            "discussion": f"Discussion Summary: {self.memory.retrieveSensory()}", # This will retrieve the sensory memory for the current user.
+            "discussion": lambda: f"Discussion Summary: {sensory()}", # This will retrieve the sensory memory for the current user.
 
-            "datetime": (
+            "datetime": lambda: (
                 f"Current date: {self._getDateTime("Date")}. "
                 f"Current time: {self._getDateTime("Time")}. "
             ),
-            "objective": (
+            "objective": lambda: (
                 "Primary objective: Assist in any way possible but if you dont know the answer be truthful and say you dont know. "
                 "Third objective: Keep a light-hearted tone, be a bit of a smartass, and enjoy the interaction. "
                 "Forth objective: Be unique with your responses and never repeat yourself or start your responses the same way. "
             ),
             # Removed the rest of this function as it was not needed for the example.
         }
-        return groups.get(group, "")
 
     def _displayInfoGroup(self, group=None):
         groups = [
@@ -529,16 +727,50 @@ class Logic:
     def decisionLogic(self):
         return self._coreLogic()
 
+    def _staticLogic(self, name, instructions):
+        """
+        Get the static prefix of a prompt and its token estimate, built once per prompt name.
+        """
+        cached = self.staticPrefixes.get(name)
+        if cached is None:
+            text   = self._logicCore(*self.staticGroups) + instructions
+            cached = self.staticPrefixes.setdefault(name, (text, self.graph.instructions.estimateTokens(text)))
+            logger.debug(f"Built {name} prompt prefix (~{cached[1]} tokens)")
+        return cached
+
+    def _dynamicLogic(self, budget: int = None):
+        """
+        Get the dynamic groups for this turn, in order, within budget tokens.
+        The group that crosses the budget is cut short and the ones after it are left out.
+        """
+        budget = self.dynamicBudget if budget is None else budget
+        parts, used = [], 0
+        for group in self.dynamicGroups:
+            info   = self._createInfoGroup(group)
+            tokens = self.graph.instructions.estimateTokens(info)
+            if used + tokens > budget:
+                parts.append(info[:(budget - used) * CHARS_PER_TOKEN])
+                logger.debug(f"Dynamic prompt groups cut at '{group}' to stay within {budget} tokens")
+                break
+            parts.append(info)
+            used += tokens
+        return ''.join(parts)
+
+    def _promptLogic(self, name, instructions):
+        """
+        Build a prompt for this turn: the static prefix first so provider prompt caching can reuse it,
+        then the dynamic groups, refreshed every turn.
+        """
+        prefix, _ = self._staticLogic(name, instructions)
+        return prefix + self._dynamicLogic()
+
     def thought(self):
         # This is not needed for the example, rather it is here to show how you can use the thoughtLogic method and others.
-        return (
-            self.thoughtLogic() +
-            f"Your logic here. "
-        )
+        return self._promptLogic("thought", f"Your logic here. ")
 
     def decision(self):
-        return (
-            self.decisionLogic() +
+        return self._promptLogic(
+            "decision",
             f"You are the decision process that compiles and delivers the final response using information received from all "
             f"internal cognitive processes: Thought, Clarification, Gathering, Definition, Execution, Refining, Reflecting. "
             "Your responsible for responding directly to the user with clarity, relevance, and a touch of personality. "
@@ -565,7 +797,7 @@ class Assistant:
         self.gptClient = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
         self.genClient = genai.Client(api_key=os.getenv("GOOGLE_API_KEY"))
 
-        self.systemInstructions = self.logic.decision()
+        # The system instructions are rebuilt every turn by self.logic.decision(), see processInput.
         self.actionInstructions = self.graph.skillInstructions()
 
     ## If you want to use OpenAI's chat completions, uncomment the following function and comment out the `getResponseOpenai` function below it.
@@ -602,11 +834,13 @@ class Assistant:
             raise ValueError("Invalid provider: choose 'openai' or 'google'")
 
     def callAction(self, ctx: str, verbose: bool = False):
+        # Only the skills relevant to ctx are described when SELECT_SKILLS is enabled, otherwise this is self.actionInstructions.
+        actionInstructions = self.graph.skillInstructions(ctx=ctx)
         if self.provider == "google":
-            message = self.actionInstructions + "\n" + ctx
+            message = actionInstructions + "\n" + ctx
             calledAction = self.getResponse(message)
         else:
-            action = self.graph.handleJsonFormat("system", self.actionInstructions)
+            action = self.graph.handleJsonFormat("system", actionInstructions)
             user = self.graph.handleJsonFormat("user", ctx)
             message = [action, user]
             calledAction = self.getResponse(message)
@@ -627,6 +861,12 @@ class Assistant:
         return None
 
     def processInput(self, ctx: str, verbose: bool = False) -> str:
+        # Plain user skill commands like "what is the time" are answered locally, skipping both model calls, when ROUTE_USER_SKILLS is enabled.
+        routed = self.graph.getRoutedActions(ctx)
+        if routed is not None:
+            if verbose:
+                print(f"Routed Result:\n{routed}\n")
+            return str(routed)
         if self.provider == "google":
             messages = []
             actionMessage = self.callAction(ctx, verbose)
@@ -636,7 +876,7 @@ class Assistant:
             fullMessage = "\n".join(messages)
             completion = self.getResponse(fullMessage)
         else:
-            system = self.graph.handleJsonFormat("system", self.systemInstructions)
+            system = self.graph.handleJsonFormat("system", self.logic.decision())
             user = self.graph.handleJsonFormat("user", ctx)
             messages = [system, user]
             actionMessage = self.callAction(ctx, verbose)
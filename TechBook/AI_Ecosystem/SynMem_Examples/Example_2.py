@@ -3,9 +3,9 @@
 # E.G., TechBook_Skills/Agent/MemoryManager.py
 import logging
 import threading
-import inspect
 from AI_Ecosystem.SynMem_Examples.Example_1 import Memory
-from SkillLink import SkillLink
+from TechBook_Utils.SkillDispatcher import SkillDispatcher
+from TechBook_Utils.ResultCache import ResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -28,8 +28,10 @@ class MemoryManager:
         self.initialized = True
 
     def _initComponents(self):
-        self.skillLink  = SkillLink()
+        self.dispatcher = SkillDispatcher()
         self.memory = Memory()
+        self.resultCache = ResultCache()
+        self.memory.onChange(lambda: self.resultCache.invalidate(self))  # Cached retrieve-* results go stale on every save and clear.
         self.actionMap = {
             **self.memory.actionMap, # by doing this, we can call the actionMap from within the Memory's actionMap,
             # allowing us to use the same actions defined in Memory the model can call.
@@ -38,17 +40,25 @@ class MemoryManager:
     def _metaData(self):
         return {
             "className": self.__class__.__name__,
-            "description": "Manage memory."
+            "description": "Manage memory.",
+            # Used when CACHE_RESULTS=True: lookups repeated within a turn or two are served from memory,
+            # and every save to or clear of the memory drops them.
+            "cache": {
+                "actions": {
+                    "retrieve-conversation-details": {"ttl": 30},
+                    "retrieve-interaction-details":  {"ttl": 30},
+                    "retrieve-image-details":        {"ttl": 30},
+                },
+                "mutating": ["clear-first-entry", "clear-last-entry", "clear-all-entries"],
+            }
         }
 
     def memorySkill(self, action: str, *args):
-        self.skillLink.calledActions(self, locals())
         try:
-            actionKey = self.actionMap.get(action.lower())
-            if actionKey is None:
+            # Arity is resolved once per action by the dispatch table instead of inspecting it on every call.
+            entry = self.dispatcher.getEntry('memorySkill', self.actionMap, action.lower())
+            if entry is None:
                 return f"Invalid {self.__class__.__name__.lower()}Action provided: {action}"
-
-            paramCount = len(inspect.signature(actionKey).parameters)
-            return actionKey(*args[:paramCount]) if paramCount > 0 else actionKey()
+            return entry.func(*entry.coerce(list(args)))
         except Exception as e:
             logger.error(f"Error executing {self.__class__.__name__.lower()}Action '{action}':", exc_info=True)
\ No newline at end of file
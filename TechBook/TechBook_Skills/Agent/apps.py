@@ -3,9 +3,9 @@ import logging
 import subprocess
 import os
 import threading
-import inspect
 
-from HoloAI import HoloLink
+from TechBook_Utils.SkillDispatcher import SkillDispatcher
+from TechBook_Utils.PhraseMatcher import PhraseMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -38,8 +38,9 @@ class Apps:
         self.initialized = True
 
     def _initComponents(self):
-        self.holoLink    = HoloLink()
+        self.dispatcher = SkillDispatcher()
         self.nameReplacements = NAME_REPLACEMENTS.copy()  # Copy to avoid modifying the original
+        self.nameMatcher      = PhraseMatcher(self.nameReplacements)
         self.actionMap = {
             "open-app":  self._openApp,
             "close-app": self._closeApp
@@ -52,16 +53,11 @@ class Apps:
         }
 
     def appSkill(self, action: str, *args):
-        self.holoLink.calledActions(self, locals())
-        name = inspect.currentframe().f_code.co_name
-        return self.holoLink.executeSkill('system', name, self.actionMap, action, *args)
+        return self.dispatcher.dispatch('appSkill', self.actionMap, action, *args)
 
     def _normalizeAppName(self, appName: str) -> str:
-        app = appName.lower()
-        return next(
-            (replacement for key, replacement in self.nameReplacements.items() if key in app),
-            appName
-        )
+        match = self.nameMatcher.find(appName)
+        return match.value if match else appName
 
     def _openApp(self, appName: str) -> str:
         app = self._normalizeAppName(appName)
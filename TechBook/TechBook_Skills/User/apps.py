@@ -2,7 +2,8 @@ import threading
 import logging
 import subprocess
 import os
-from HoloAI import HoloLink
+
+from TechBook_Utils.PhraseMatcher import PhraseMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -34,12 +35,13 @@ class AppManager:
         self.initialized = True
 
     def _initComponents(self):
-        self.holoLink = HoloLink()
         self.nameMap = APP_NAME_MAP.copy()
         self.actionMap = {
             "open": self._openApp,
             "close": self._closeApp,
         }
+        self.actionMatcher = PhraseMatcher(self.actionMap)
+        self.nameMatcher   = PhraseMatcher(self.nameMap)
 
     def _metaData(self):
         return {
@@ -51,21 +53,20 @@ class AppManager:
         """
         Description: Executes the requested action for application management based on context.
         """
-        self.holoLink.calledActions(self, locals())
         try:
             ctxLower = ctx.lower()
-            actionKey = next((key for key in self.actionMap if key in ctxLower), None)
-            if not actionKey:
+            match = self.actionMatcher.find(ctxLower)
+            if not match:
                 return None
-            args = ctxLower.replace(actionKey, "", 1).strip()
-            return self.actionMap[actionKey](args)
+            args = self.actionMatcher.remove(ctxLower, match)
+            return match.value(args)
         except Exception as e:
             logger.error(f"Error executing {self.__class__.__name__.lower()}Action '{ctx}':", exc_info=True)
             return f"Error: {e}"
 
     def _normalizeAppName(self, appName: str) -> str:
-        app = appName.lower()
-        return next((replacement for key, replacement in self.nameMap.items() if key in app), appName)
+        match = self.nameMatcher.find(appName)
+        return match.value if match else appName
 
     def _openApp(self, appName: str) -> str:
         app = self._normalizeAppName(appName)
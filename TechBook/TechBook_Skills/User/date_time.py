@@ -2,7 +2,8 @@
 from datetime import datetime
 import threading
 import logging
-from HoloAI import HoloLink
+
+from TechBook_Utils.PhraseMatcher import PhraseMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -25,11 +26,11 @@ class DTManager:
         self.initialized = True
 
     def _initComponents(self):
-        self.holoLink = HoloLink()
         self.actionMap = {
             "what is the date": self._getCurrentDate,
             "what is the time": self._getCurrentTime,
         }
+        self.actionMatcher = PhraseMatcher(self.actionMap)
 
     def _metaData(self):
         return {
@@ -41,14 +42,13 @@ class DTManager:
         """
         Description: Executes the requested action for date/time management based on context.
         """
-        self.holoLink.calledActions(self, locals())
         try:
             action = ctx.lower()
-            actionKey = next((key for key in self.actionMap if key in action), None)
-            if not actionKey:
+            match = self.actionMatcher.find(action)
+            if not match:
                 return None
-            args = action.replace(actionKey, "", 1).strip()
-            return self.actionMap[actionKey](args)
+            args = self.actionMatcher.remove(action, match)
+            return match.value(args)
         except Exception as e:
             logger.error(f"Error executing {self.__class__.__name__.lower()}Action '{ctx}':", exc_info=True)
             return f"Error: {e}"
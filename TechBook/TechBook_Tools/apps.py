@@ -7,6 +7,8 @@ import inspect
 
 from HoloAI import HoloLink
 
+from TechBook_Utils.PhraseMatcher import PhraseMatcher
+
 logger = logging.getLogger(__name__)
 
 NAME_REPLACEMENTS = {
@@ -40,6 +42,7 @@ class Apps:
     def _initComponents(self):
         self.holoLink = HoloLink()
         self.nameReplacements = NAME_REPLACEMENTS.copy()  # Copy to avoid modifying the original
+        self.nameMatcher      = PhraseMatcher(self.nameReplacements)
 
     def _metaData(self):
         return {
@@ -48,11 +51,8 @@ class Apps:
         }
 
     def _normalizeAppName(self, appName: str) -> str:
-        app = appName.lower()
-        return next(
-            (replacement for key, replacement in self.nameReplacements.items() if key in app),
-            appName
-        )
+        match = self.nameMatcher.find(appName)
+        return match.value if match else appName
 
     def openApp(self, appName: str) -> str:
         """
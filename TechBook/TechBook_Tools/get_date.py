@@ -1,8 +1,6 @@
 
 from datetime import datetime
-from HoloAI import HoloLink
 
-holoLink = HoloLink()
 
 def get_current_date():
     """
@@ -11,5 +9,4 @@ def get_current_date():
     """
     #print("Fetching the current date")
     
-    holoLink.calledActions(__name__, locals())
     return datetime.now().strftime('%d-%B-%Y')
\ No newline at end of file
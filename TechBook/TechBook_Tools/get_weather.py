@@ -1,10 +1,18 @@
 
 import json
-import requests
 
-from HoloAI import HoloLink
+from TechBook_Utils.WeatherClient import WeatherClient
 
-holoLink = HoloLink()
+weather = WeatherClient()
+
+
+def _metaData():
+    # Used when CACHE_RESULTS=True, the same coordinates within a minute get the same answer.
+    return {
+        "className": __name__,
+        "description": "Current weather for coordinates",
+        "cache": {"ttl": 60},
+    }
 
 
 def get_temperature(latitude: float, longitude: float) -> str:
@@ -12,11 +20,14 @@ def get_temperature(latitude: float, longitude: float) -> str:
     Description: "Get current temperature for provided coordinates in celsius."
     Additional Information: "Provide the temperature in both Celsius and Fahrenheit."
     """
-    holoLink.calledActions(__name__, locals())
-    response = requests.get(
-        f"https://api.open-meteo.com/v1/forecast?latitude={latitude}&longitude={longitude}&current_weather=true"
-    )
-    data = response.json()
+    return _formatTemperature(weather.getForecast(latitude, longitude))
+
+
+async def _get_temperatureAsync(latitude: float, longitude: float) -> str:
+    return _formatTemperature(await weather.getForecastAsync(latitude, longitude))
+
+
+def _formatTemperature(data):
     if "current_weather" in data and "temperature" in data["current_weather"]:
         c = data["current_weather"]["temperature"]
         f = c * 9/5 + 32
@@ -25,19 +36,23 @@ def get_temperature(latitude: float, longitude: float) -> str:
         return f"Could not fetch current weather. Response: {json.dumps(data)}"
 
 
+
 def get_humidity(latitude: float, longitude: float) -> str:
     """
     Description: "Get current relative humidity for provided coordinates."
     Additional Information: "Returns humidity as a percentage."
     """
-    holoLink.calledActions(__name__, locals())
-    response = requests.get(
-        f"https://api.open-meteo.com/v1/forecast?latitude={latitude}&longitude={longitude}&current_weather=true&hourly=relative_humidity_2m"
-    )
-    data = response.json()
+    return _formatHumidity(weather.getForecast(latitude, longitude))
+
+
+async def _get_humidityAsync(latitude: float, longitude: float) -> str:
+    return _formatHumidity(await weather.getForecastAsync(latitude, longitude))
+
+
+def _formatHumidity(data):
     try:
         # Returns current hour's humidity
-        humidity = data['hourly']['relative_humidity_2m'][0]
+        humidity = weather.currentHourly(data, 'relative_humidity_2m')
         return f"Current humidity: {humidity}%"
     except Exception:
         return f"Could not fetch humidity. Response: {data}"
@@ -48,11 +63,14 @@ def get_wind_speed(latitude: float, longitude: float) -> str:
     Description: "Get current wind speed for provided coordinates."
     Additional Information: "Provide the  wind speed in both meters per second (m/s) and miles per hour (mph)."
     """
-    holoLink.calledActions(__name__, locals())
-    response = requests.get(
-        f"https://api.open-meteo.com/v1/forecast?latitude={latitude}&longitude={longitude}&current_weather=true"
-    )
-    data = response.json()
+    return _formatWindSpeed(weather.getForecast(latitude, longitude))
+
+
+async def _get_wind_speedAsync(latitude: float, longitude: float) -> str:
+    return _formatWindSpeed(await weather.getForecastAsync(latitude, longitude))
+
+
+def _formatWindSpeed(data):
     try:
         wind_speed = data['current_weather']['windspeed']
         return f"Current wind speed: {wind_speed} m/s"
@@ -60,4 +78,7 @@ def get_wind_speed(latitude: float, longitude: float) -> str:
         return f"Could not fetch wind speed. Response: {data}"
 
 
-
+# Async agent loops await these instead of running the tools on a thread, see SkillGraph.executeToolAsync.
+get_temperature.asyncVariant = _get_temperatureAsync
+get_humidity.asyncVariant = _get_humidityAsync
+get_wind_speed.asyncVariant = _get_wind_speedAsync
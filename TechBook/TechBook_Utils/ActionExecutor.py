@@ -0,0 +1,219 @@
+
+import os
+import time
+import asyncio
+import inspect
+import functools
+import threading
+import logging
+import concurrent.futures
+from dotenv import load_dotenv
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Set These Environment Variables in your .env file or system environment variables
+# ACTION_WORKERS=8 (optional, maximum number of actions run at the same time, defaults to twice the cpu count capped at 32)
+# ACTION_TIMEOUT=30 (optional, seconds each action may take before it is reported as timed out)
+
+
+class ActionExecutor:
+    """
+    Bounded thread pool for running independent actions concurrently.
+    Results always come back in the same order the actions were given, every action gets its own timeout,
+    and a failing or slow action is reported on its own without affecting the others.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(ActionExecutor, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, 'initialized', False):
+            return
+        self._initComponents()
+        self.initialized = True
+
+    def _initComponents(self):
+        self.maxWorkers = int(os.getenv('ACTION_WORKERS', min(32, (os.cpu_count() or 4) * 2)))
+        self.timeout    = float(os.getenv('ACTION_TIMEOUT', 30))
+        self.poolLock   = threading.Lock()
+        self.pool       = None
+        self.loopHooks  = []  # async callables that release what was bound to an event loop before it closes
+
+    def getPool(self):
+        """
+        Get the shared worker pool, creating it on first use.
+        """
+        if self.pool is None:
+            with self.poolLock:
+                if self.pool is None:
+                    self.pool = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=self.maxWorkers,
+                        thread_name_prefix="ActionExecutor"
+                    )
+        return self.pool
+
+    def shutdown(self, wait=True):
+        """
+        Shut down the worker pool. A new pool is created the next time actions are run.
+        """
+        with self.poolLock:
+            if self.pool is not None:
+                self.pool.shutdown(wait=wait)
+                self.pool = None
+
+    def onLoopClose(self, hook):
+        """
+        Register an async callable that runs on an event loop right before it shuts down, e.g. to close clients bound to it.
+        """
+        if hook not in self.loopHooks:
+            self.loopHooks.append(hook)
+
+    async def closeLoop(self):
+        """
+        Run every loop close hook on the running loop. runCoroutine does this for the loops it starts,
+        an application running its own loop awaits it (or SkillGraph.closeAsync) before the loop shuts down.
+        """
+        for hook in list(self.loopHooks):
+            try:
+                await hook()
+            except Exception:
+                logger.error(f"Error running loop close hook {hook}", exc_info=True)
+
+    async def callAsync(self, func, *args, **kwargs):
+        """
+        Call func from an event loop. async def functions are awaited on the loop, blocking functions run on the
+        worker pool, and a blocking function that hands back an awaitable has it awaited on the loop.
+        """
+        if inspect.iscoroutinefunction(func):
+            return await func(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self.getPool(), functools.partial(func, *args, **kwargs))
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    def runCoroutine(self, awaitable):
+        """
+        Wait for an awaitable from blocking code, e.g. when a sync caller runs an async def skill on a worker thread.
+        Raises RuntimeError on a thread with a running event loop, since blocking there would stall that loop,
+        such callers use the async variants (executeActionsAsync, callAsync) instead.
+        """
+        async def wait():
+            try:
+                return await awaitable
+            finally:
+                await self.closeLoop()  # The loop is discarded once asyncio.run returns.
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(wait())
+        if inspect.iscoroutine(awaitable):
+            awaitable.close()
+        raise RuntimeError("Cannot block on an awaitable inside a running event loop, await it or use the async variant instead")
+
+    def timedCall(self, func, item):
+        start = time.perf_counter()
+        try:
+            return {"item": item, "result": func(item), "error": None, "duration": time.perf_counter() - start}
+        except Exception as e:
+            logger.error(f"Error executing '{item}'", exc_info=True)
+            return {"item": item, "result": None, "error": str(e), "duration": time.perf_counter() - start}
+
+    async def timedCallAsync(self, func, item):
+        start = time.perf_counter()
+        try:
+            return {"item": item, "result": await self.callAsync(func, item), "error": None, "duration": time.perf_counter() - start}
+        except Exception as e:
+            logger.error(f"Error executing '{item}'", exc_info=True)
+            return {"item": item, "result": None, "error": str(e), "duration": time.perf_counter() - start}
+
+    def timedOut(self, item, timeout):
+        logger.warning(f"'{item}' did not finish within {timeout}s")
+        return {"item": item, "result": None, "error": f"Timed out after {timeout}s", "duration": timeout}
+
+    def runAll(self, func, items, timeout=None):
+        """
+        Run func(item) for every item on the worker pool.
+        Returns one report per item, in the same order as items, with keys item, result, error and duration.
+        Each item gets its own timeout measured from when the batch was started. A timed out call cannot be
+        interrupted, so it keeps its worker until it finishes but its result is discarded.
+        With the timeout disabled (0) a single item runs on the calling thread, as there is nothing to enforce.
+        """
+        items = list(items)
+        if not items:
+            return []
+        timeout = self.timeout if timeout is None else timeout
+        if len(items) == 1 and not timeout:
+            return [self.timedCall(func, items[0])]
+
+        pool    = self.getPool()
+        started = time.monotonic()
+        futures = [pool.submit(self.timedCall, func, item) for item in items]
+        reports = []
+        for item, future in zip(items, futures):
+            remaining = max(0.0, timeout - (time.monotonic() - started)) if timeout else None
+            try:
+                reports.append(future.result(timeout=remaining))
+            except concurrent.futures.TimeoutError:
+                future.cancel()
+                reports.append(self.timedOut(item, timeout))
+        return reports
+
+    async def runAllAsync(self, func, items, timeout=None):
+        """
+        Asyncio variant of runAll. An async def func is awaited on the event loop, a blocking func still runs on the
+        worker pool, so blocking skills never stall the event loop.
+        """
+        items = list(items)
+        if not items:
+            return []
+        timeout = self.timeout if timeout is None else timeout
+
+        async def runOne(item):
+            try:
+                return await asyncio.wait_for(self.timedCallAsync(func, item), timeout or None)
+            except asyncio.TimeoutError:
+                return self.timedOut(item, timeout)
+
+        return list(await asyncio.gather(*(runOne(item) for item in items)))
+
+    # ----- Actions -----
+    def normalizeActions(self, actionList):
+        # Same input handling as SkillLink.executeActions: a string holds one action per line.
+        if isinstance(actionList, str):
+            return [a.strip() for a in actionList.strip().splitlines() if a.strip()]
+        return list(actionList or [])
+
+    def formatReports(self, reports):
+        """
+        Turn reports into the plain result list SkillLink.executeActions returns, with failures as error strings.
+        """
+        return [
+            report["result"] if report["error"] is None else f"Error executing action '{report['item']}', {report['error']}"
+            for report in reports
+        ]
+
+    def executeActions(self, executeAction, actions, actionList, timeout=None):
+        """
+        Execute multiple actions concurrently using executeAction(actions, action) for each one.
+        Returns the results in the same order as actionList.
+        """
+        actionList = self.normalizeActions(actionList)
+        reports = self.runAll(lambda action: executeAction(actions, action), actionList, timeout)
+        return self.formatReports(reports)
+
+    async def executeActionsAsync(self, executeAction, actions, actionList, timeout=None):
+        """
+        Asyncio variant of executeActions.
+        """
+        actionList = self.normalizeActions(actionList)
+        reports = await self.runAllAsync(functools.partial(executeAction, actions), actionList, timeout)
+        return self.formatReports(reports)
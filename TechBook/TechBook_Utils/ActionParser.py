@@ -0,0 +1,176 @@
+
+import os
+import re
+import ast
+import copy
+import threading
+import functools
+import logging
+from dotenv import load_dotenv
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Set These Environment Variables in your .env file or system environment variables
+# ACTION_CACHE_SIZE=1024 (optional, number of distinct action strings whose parsed form is kept in memory)
+
+# Quoted strings (an unterminated quote runs to the end), brackets, separators and everything in between.
+TOKEN_PATTERN   = re.compile(r"""'(?:\\.|[^'\\])*'|"(?:\\.|[^"\\])*"|['"].*|[()\[\]{},=]|[^'"()\[\]{},=]+""", re.DOTALL)
+OPENERS         = "([{"
+CLOSERS         = ")]}"
+NO_ACTIONS      = {"", "none", "null", "[]", "()"}
+NO_ACTIONS_LEN  = max(map(len, NO_ACTIONS))
+MUTABLE_TYPES   = (list, dict, set)
+
+
+class ActionParser:
+    """
+    Tokenizer and parser for the action-call grammar the model answers with, e.g.
+        ['weatherSkill("get-weather", "47.6588", "-117.4260")', 'getTime()']
+    Parsed results are kept in a bounded LRU cache keyed by the raw string, so repeated action strings are
+    parsed once. getActions is a drop-in for SkillLink.getActions, parseCall describes a call (for tracing,
+    scheduling and result caching) without running it, executing actions stays with SkillLink.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(ActionParser, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, 'initialized', False):
+            return
+        self._initComponents()
+        self.initialized = True
+
+    def _initComponents(self):
+        self.cacheSize    = int(os.getenv('ACTION_CACHE_SIZE', 1024))
+        self._actionCache = functools.lru_cache(maxsize=self.cacheSize)(self._parseActions)
+        self._callCache   = functools.lru_cache(maxsize=self.cacheSize)(self._parseCall)
+
+    def cacheInfo(self):
+        """
+        Get the hit/miss statistics of the action and call caches.
+        """
+        return {"actions": self._actionCache.cache_info(), "calls": self._callCache.cache_info()}
+
+    def clearCache(self):
+        self._actionCache.cache_clear()
+        self._callCache.cache_clear()
+
+    # ----- Precheck -----
+    def hasActions(self, text) -> bool:
+        """
+        Cheap check for whether text can hold any actions at all.
+        Only looks at the first and last non-blank characters, so prose answers and empty replies are rejected
+        without copying or tokenizing them.
+        """
+        if not isinstance(text, str):
+            return text is not None
+        start, end = 0, len(text)
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        if end - start <= NO_ACTIONS_LEN and text[start:end].lower() in NO_ACTIONS:
+            return False
+        first, last = text[start], text[end - 1]
+        if first == "[":
+            return last == "]"
+        return (first.isalpha() or first == "_") and (last == ")" or last.isalnum() or last == "_")
+
+    # ----- Tokenizing -----
+    def splitTopLevel(self, text: str, separator: str = ",") -> list:
+        """
+        Split text on separator wherever it is outside quotes and brackets.
+        """
+        parts, buf, depth = [], [], 0
+        for token in TOKEN_PATTERN.findall(text):
+            if token == separator and depth == 0:
+                parts.append("".join(buf).strip())
+                buf = []
+                continue
+            if token in OPENERS:
+                depth += 1
+            elif token in CLOSERS and depth > 0:
+                depth -= 1
+            buf.append(token)
+        parts.append("".join(buf).strip())
+        return [part for part in parts if part]
+
+    def parseValue(self, text: str):
+        try:
+            return ast.literal_eval(text)
+        except Exception:
+            return text.strip("'\"")
+
+    def parseArgument(self, text: str):
+        """
+        Parse one argument into (None, value) for positional arguments or (name, value) for keyword arguments.
+        """
+        key, sep, value = text.partition("=")
+        if sep and key.strip().isidentifier() and not value.startswith("="):
+            # Only a top-level name= counts, never an = inside a quoted value.
+            head = TOKEN_PATTERN.match(text)
+            if head and head.group(0).strip() == key.strip():
+                return key.strip(), self.parseValue(value.strip())
+        return None, self.parseValue(text)
+
+    # ----- Parsing -----
+    def _parseActions(self, text: str) -> tuple:
+        s = text.strip()
+        if s.startswith("[") and s.endswith("]"):
+            try:
+                literal = ast.literal_eval(s)
+                if isinstance(literal, list):
+                    return tuple(str(item).strip() for item in literal)
+            except (ValueError, SyntaxError):
+                s = s[1:-1].strip()
+        return tuple(self.splitTopLevel(s))
+
+    def _parseCall(self, action: str) -> tuple:
+        s = action.strip()
+        if "(" in s and ")" in s:
+            name, rest = s.split("(", 1)
+            params = rest[:rest.rfind(")")].strip()
+        else:
+            name, params = s, ""
+        args, kwargs, mutable = [], [], False
+        for part in self.splitTopLevel(params):
+            key, value = self.parseArgument(part)
+            mutable = mutable or isinstance(value, MUTABLE_TYPES)
+            if key is None:
+                args.append(value)
+            else:
+                kwargs.append((key, value))
+        return name.strip(), tuple(args), tuple(kwargs), mutable
+
+    def getActions(self, action) -> list:
+        """
+        Parse a model reply into a list of action strings.
+        Handles a list literal of actions as well as comma separated actions, and returns [] when the reply
+        holds no actions or cannot be parsed.
+        """
+        if action is None or not self.hasActions(action):
+            return []
+        if not isinstance(action, str):
+            action = str(action)
+        try:
+            return list(self._actionCache(action))
+        except Exception as ex:
+            logger.error(f"Error parsing actions string '{action}': {ex}", exc_info=True)
+            return []
+
+    def parseCall(self, action: str) -> tuple:
+        """
+        Parse a single action string into (name, args, kwargs).
+        """
+        name, args, kwargs, mutable = self._callCache(action)
+        if mutable:
+            # Cached values are shared between calls, so hand out copies of anything a skill could modify.
+            return name, copy.deepcopy(list(args)), copy.deepcopy(dict(kwargs))
+        return name, list(args), dict(kwargs)
@@ -0,0 +1,182 @@
+
+import sys
+import time
+import threading
+import logging
+import concurrent.futures
+from dotenv import load_dotenv
+
+from TechBook_Utils.ActionExecutor import ActionExecutor
+from TechBook_Utils.ActionParser import ActionParser
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+
+class ActionScheduler:
+    """
+    Dependency-aware scheduler for the actions of a single turn.
+    Every action declares the shared resources it reads and writes, two actions conflict when one of them writes
+    something the other reads or writes, and conflicting actions run in the order they were given while everything
+    else runs concurrently on the ActionExecutor pool.
+
+    Resources are declared in a skill's _metaData under "resources", keyed by sub-action (or by method name for
+    skills without an action map):
+        "resources": {
+            "get-versions":     {"reads":  ["versionStore"]},
+            "rollback-version": {"writes": ["versionStore", "recycleBin"]},
+        }
+    Actions without a declaration are treated as writing their own skill, so they never race with other actions of
+    the same skill but still run alongside other skills.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(ActionScheduler, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, 'initialized', False):
+            return
+        self._initComponents()
+        self.initialized = True
+
+    def _initComponents(self):
+        self.executor = ActionExecutor()
+        self.parser   = ActionParser()
+
+    # ----- Resources -----
+    def parseAction(self, action):
+        """
+        Split an action string into its skill name and sub-action (None when the action has no sub-action).
+        """
+        if not action:
+            return None, None
+        name, args, _ = self.parser.parseCall(action)
+        subAction = args[0] if args and isinstance(args[0], str) else None
+        return name or None, subAction
+
+    def getOwner(self, func):
+        # Bound methods belong to their skill instance, plain functions to their module.
+        owner = getattr(func, "__self__", None)
+        if owner is None:
+            owner = sys.modules.get(getattr(func, "__module__", None) or "")
+        return owner
+
+    def getDeclaredResources(self, owner):
+        metaMethod = getattr(owner, "_metaData", None) or getattr(owner, "_metadata", None)
+        if not callable(metaMethod):
+            return {}
+        try:
+            return (metaMethod() or {}).get("resources") or {}
+        except Exception:
+            logger.warning(f"Could not read resources from {owner}", exc_info=True)
+            return {}
+
+    def getResources(self, actions, action):
+        """
+        Get the (reads, writes) resource sets declared for an action string.
+        """
+        name, subAction = self.parseAction(action)
+        func = actions.get(name) if name else None
+        if func is None:
+            return set(), set()
+        owner = self.getOwner(func)
+        declared = self.getDeclaredResources(owner)
+        key = subAction.lower() if subAction else name
+        spec = declared.get(key) or declared.get(name)
+        if spec is None:
+            # Undeclared: serialize with the rest of the same skill only.
+            ownerName = getattr(owner, "__name__", None) or owner.__class__.__name__
+            return set(), {f"skill:{ownerName}"}
+        return set(spec.get("reads", [])), set(spec.get("writes", []))
+
+    def buildGraph(self, actions, actionList):
+        """
+        Build the dependency graph for a list of actions.
+        Returns a list where entry i holds the indices of the earlier actions that action i must wait for.
+        """
+        resources = [self.getResources(actions, action) for action in actionList]
+        graph = []
+        for i, (reads, writes) in enumerate(resources):
+            deps = []
+            for j in range(i):
+                prevReads, prevWrites = resources[j]
+                if writes & (prevReads | prevWrites) or reads & prevWrites:
+                    deps.append(j)
+            graph.append(deps)
+        return graph
+
+    # ----- Execution -----
+    def executeActions(self, executeAction, actions, actionList, timeout=None):
+        """
+        Execute actions with the most concurrency their declared resources allow.
+        Results come back in the same order as actionList. An action that times out is still running, so anything
+        that depends on it is skipped rather than racing with it.
+        """
+        actionList = self.executor.normalizeActions(actionList)
+        if not actionList:
+            return []
+        timeout = self.executor.timeout if timeout is None else timeout
+        if not hasattr(actions, "get"):
+            return [executeAction(actions, action) for action in actionList]
+
+        graph      = self.buildGraph(actions, actionList)
+        dependents = {i: [] for i in range(len(actionList))}
+        waiting    = {i: len(deps) for i, deps in enumerate(graph)}
+        for i, deps in enumerate(graph):
+            for j in deps:
+                dependents[j].append(i)
+
+        pool      = self.executor.getPool()
+        reports   = [None] * len(actionList)
+        running   = {}
+        deadlines = {}
+
+        def submit(i):
+            action = actionList[i]
+            future = pool.submit(self.executor.timedCall, lambda a: executeAction(actions, a), action)
+            running[future] = i
+            deadlines[future] = time.monotonic() + timeout if timeout else None
+
+        def skip(i, reason):
+            reports[i] = {"item": actionList[i], "result": None, "error": reason, "duration": 0.0}
+            for k in dependents[i]:
+                if reports[k] is None:
+                    skip(k, f"Skipped because '{actionList[i]}' did not finish")
+
+        def release(i):
+            for k in dependents[i]:
+                waiting[k] -= 1
+                if waiting[k] == 0 and reports[k] is None:
+                    submit(k)
+
+        for i, count in waiting.items():
+            if count == 0:
+                submit(i)
+
+        while running:
+            now = time.monotonic()
+            pending = [d for d in deadlines.values() if d is not None]
+            wait = max(0.0, min(pending) - now) if pending else None
+            done, _ = concurrent.futures.wait(list(running), timeout=wait, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                i = running.pop(future)
+                deadlines.pop(future, None)
+                reports[i] = future.result()
+                release(i)
+            now = time.monotonic()
+            for future in [f for f, d in deadlines.items() if d is not None and d <= now and f not in done]:
+                i = running.pop(future)
+                deadlines.pop(future)
+                future.cancel()
+                reports[i] = self.executor.timedOut(actionList[i], timeout)
+                for k in dependents[i]:
+                    if reports[k] is None:
+                        skip(k, f"Skipped because '{actionList[i]}' did not finish")
+
+        return self.executor.formatReports(reports)
@@ -0,0 +1,209 @@
+
+import os
+import json
+import time
+import random
+import threading
+import logging
+from collections import deque
+from dotenv import load_dotenv
+
+from TechBook_Utils.ActionParser import ActionParser
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Set These Environment Variables in your .env file or system environment variables
+# TRACE_ACTIONS=True (optional, to record a structured event for every action and tool call)
+# TRACE_BUFFER=1024 (optional, number of most recent events kept when TRACE_ACTIONS is enabled)
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, float("inf"))  # upper bounds in seconds
+ARGS_LIMIT      = 120  # Characters kept of an args summary.
+
+
+class ActionTracer:
+    """
+    Records what the agent called, applied once by SkillGraph around action and tool execution
+    instead of inside every skill and tool.
+    When tracing is off, wrap hands back the original callable, so there is nothing to pay per call.
+    When it is on, every call adds a {time, kind, skill, action, args, duration, resultSize, error} event to a
+    fixed-size ring buffer that can be sampled, summarized into latency histograms or exported as JSON lines.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(ActionTracer, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, 'initialized', False):
+            return
+        self._initComponents()
+        self.initialized = True
+
+    def _initComponents(self):
+        self.showActions = os.getenv('SHOW_CALLED_ACTIONS', 'False') == 'True'
+        self.enabled     = os.getenv('TRACE_ACTIONS', 'False') == 'True' or self.showActions
+        self.events      = deque(maxlen=int(os.getenv('TRACE_BUFFER', 1024)))
+        self.parser      = ActionParser()
+
+    # ----- Events -----
+    def summarize(self, args, kwargs=None) -> str:
+        parts = [repr(arg) for arg in args or ()]
+        parts.extend(f"{key}={value!r}" for key, value in (kwargs or {}).items())
+        summary = ", ".join(parts)
+        return summary if len(summary) <= ARGS_LIMIT else summary[:ARGS_LIMIT - 3] + "..."
+
+    def getSkillName(self, func) -> str:
+        owner = getattr(func, "__self__", None)
+        if owner is not None:
+            return owner.__class__.__name__
+        return getattr(func, "__module__", None) or "<unknown>"
+
+    def record(self, kind, skill, action, args, kwargs, start, result, error=None):
+        if error is None and isinstance(result, str) and result.startswith("Error"):
+            error = result[:ARGS_LIMIT]  # ActionParser reports failures as strings instead of raising.
+        event = {
+            "time":       time.time(),
+            "kind":       kind,
+            "skill":      skill,
+            "action":     action,
+            "args":       self.summarize(args, kwargs),
+            "duration":   time.perf_counter() - start,
+            "resultSize": len(result) if isinstance(result, (str, bytes, list, dict)) else len(str(result or "")),
+            "error":      error,
+        }
+        self.events.append(event)
+        if self.showActions:
+            print(f"Called {skill}.{action}({event['args']}) in {event['duration'] * 1000:.1f} ms")
+        return event
+
+    def trace(self, kind, skill, action, args, kwargs, execute):
+        """
+        Run execute() and record it as one event.
+        """
+        start = time.perf_counter()
+        try:
+            result = execute()
+        except Exception as e:
+            self.record(kind, skill, action, args, kwargs, start, None, str(e))
+            raise
+        self.record(kind, skill, action, args, kwargs, start, result)
+        return result
+
+    async def traceAsync(self, kind, skill, action, args, kwargs, execute):
+        """
+        Asyncio variant of trace, awaiting execute().
+        """
+        start = time.perf_counter()
+        try:
+            result = await execute()
+        except Exception as e:
+            self.record(kind, skill, action, args, kwargs, start, None, str(e))
+            raise
+        self.record(kind, skill, action, args, kwargs, start, result)
+        return result
+
+    # ----- Hooks -----
+    def describeAction(self, actions, action):
+        """
+        Get (skill, action, args, kwargs) for an action string, e.g. ("Apps", "appSkill:open-app", ("notepad",), {}).
+        """
+        try:
+            name, args, kwargs = self.parser.parseCall(action)
+        except Exception:
+            return "<unknown>", str(action), (), {}
+        func = actions.get(name) if hasattr(actions, 'get') else None
+        if args and isinstance(args[0], str):
+            name, args = f"{name}:{args[0]}", args[1:]
+        return self.getSkillName(func), name, args, kwargs
+
+    def wrap(self, executeAction, kind="action", describe=None):
+        """
+        Wrap an executeAction(actions, action) callable so every call is traced.
+        describe(actions, action) gives the (skill, action, args, kwargs) recorded, describeAction by default.
+        Returns executeAction itself when tracing is off.
+        """
+        if not self.enabled:
+            return executeAction
+        describe = describe or self.describeAction
+
+        def traced(actions, action):
+            skill, name, args, kwargs = describe(actions, action)
+            return self.trace(kind, skill, name, args, kwargs, lambda: executeAction(actions, action))
+        return traced
+
+    def wrapAsync(self, executeActionAsync):
+        """
+        Asyncio variant of wrap.
+        """
+        if not self.enabled:
+            return executeActionAsync
+
+        async def traced(actions, action):
+            skill, name, args, kwargs = self.describeAction(actions, action)
+            return await self.traceAsync("action", skill, name, args, kwargs, lambda: executeActionAsync(actions, action))
+        return traced
+
+    # ----- Reading -----
+    def getEvents(self, limit=None, sample=None, action=None) -> list:
+        """
+        Get recorded events, oldest first. action filters by action name, sample keeps that fraction of them at random
+        and limit keeps only the most recent ones.
+        """
+        events = list(self.events)
+        if action:
+            events = [event for event in events if event["action"] == action]
+        if sample is not None and sample < 1:
+            events = [event for event in events if random.random() < sample]
+        return events[-limit:] if limit else events
+
+    def histogram(self, action=None) -> dict:
+        """
+        Get a latency histogram per action, {action: {"<= 0.01s": count, ...}}, using LATENCY_BUCKETS.
+        """
+        histograms = {}
+        for event in self.getEvents(action=action):
+            counts = histograms.setdefault(event["action"], {self.bucketName(bound): 0 for bound in LATENCY_BUCKETS})
+            bound  = next(bound for bound in LATENCY_BUCKETS if event["duration"] <= bound)
+            counts[self.bucketName(bound)] += 1
+        return histograms
+
+    def bucketName(self, bound) -> str:
+        return f"<= {bound:g}s" if bound != float("inf") else f"> {LATENCY_BUCKETS[-2]:g}s"
+
+    def summary(self) -> dict:
+        """
+        Get {action: {count, errors, p50, p95, max}} with durations in seconds.
+        """
+        grouped = {}
+        for event in self.getEvents():
+            grouped.setdefault(event["action"], []).append(event)
+        result = {}
+        for name, events in grouped.items():
+            durations = sorted(event["duration"] for event in events)
+            result[name] = {
+                "count":  len(durations),
+                "errors": sum(1 for event in events if event["error"]),
+                "p50":    durations[int(0.50 * (len(durations) - 1))],
+                "p95":    durations[int(0.95 * (len(durations) - 1))],
+                "max":    durations[-1],
+            }
+        return result
+
+    def export(self, path) -> int:
+        """
+        Append the recorded events to a JSON lines file and return how many were written.
+        """
+        events = self.getEvents()
+        with open(path, "a", encoding="utf-8") as f:
+            for event in events:
+                f.write(json.dumps(event, default=str) + "\n")
+        return len(events)
+
+    def clear(self):
+        self.events.clear()
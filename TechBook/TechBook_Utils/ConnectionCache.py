@@ -0,0 +1,186 @@
+import os
+import time
+import sqlite3
+import threading
+import logging
+from contextlib import contextmanager
+from dotenv import load_dotenv
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Set These Environment Variables in your .env file or system environment variables
+# SQLITE_IDLE_TIMEOUT=30 (optional, seconds a cached database handle may sit unused before it is closed)
+# SQLITE_MMAP_SIZE=67108864 (optional, bytes of each database memory mapped for reads, 0 to turn it off)
+# SQLITE_CACHE_KB=8192 (optional, page cache per handle in KiB)
+# SQLITE_WAL=True (optional, to open databases in WAL mode so writes never block reads. This changes the files on disk for good,
+#                  so anything that moves or deletes them must call ConnectionCache().closeAll() first)
+
+
+class CachedConnection:
+    """
+    One open handle, owned by the thread that opened it.
+    """
+    __slots__ = ("conn", "path", "identity", "lastUsed", "busy", "closed")
+
+    def __init__(self, conn, path, identity):
+        self.conn     = conn
+        self.path     = path
+        self.identity = identity
+        self.lastUsed = time.monotonic()
+        self.busy     = False
+        self.closed   = False
+
+
+class ConnectionCache:
+    """
+    Per-thread SQLite handles keyed by database path, so memory reads and writes stop reconnecting on every call.
+    Each handle is opened once with mmap and a larger page cache, and is reused by the thread that opened it.
+    Databases keep the rollback journal their owner (SynMem/HoloMem) gave them unless SQLITE_WAL is enabled.
+    A handle is reopened when its file was removed or replaced, and handles left idle for SQLITE_IDLE_TIMEOUT
+    seconds are closed by a background sweep. Every handle is checkpointed as it is closed, so nothing is left only
+    in a -wal file, but that does not cover a file moved while a handle is still open: memory maintenance must call
+    closeAll() before it moves or deletes databases. The cache never takes Memory.dbLock, so it is safe to use while it is held.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(ConnectionCache, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, 'initialized', False):
+            return
+        self._initComponents()
+        self.initialized = True
+
+    def _initComponents(self):
+        self.idleTimeout = float(os.getenv('SQLITE_IDLE_TIMEOUT', 30))
+        self.mmapSize    = int(os.getenv('SQLITE_MMAP_SIZE', 64 * 1024 * 1024))
+        self.cacheKb     = int(os.getenv('SQLITE_CACHE_KB', 8192))
+        self.wal         = os.getenv('SQLITE_WAL', 'False') == 'True'
+        self.local       = threading.local()
+        self.entryLock   = threading.Lock()
+        self.entries     = set()  # Every open handle, for the idle sweep and closeAll.
+        self.thread      = None
+        self.stopEvent   = threading.Event()
+
+    # ----- Handles -----
+    def getIdentity(self, path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_dev, stat.st_ino)
+
+    def open(self, path):
+        conn = sqlite3.connect(path, timeout=30, check_same_thread=False)  # Only the sweep closes it from another thread.
+        if self.wal:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA mmap_size={self.mmapSize}")
+        conn.execute(f"PRAGMA cache_size=-{self.cacheKb}")
+        return conn
+
+    def getEntry(self, path, create):
+        handles = getattr(self.local, "handles", None)
+        if handles is None:
+            handles = self.local.handles = {}
+        identity = self.getIdentity(path)
+        if identity is None and not create:
+            return None
+        with self.entryLock:
+            entry = handles.get(path)
+            if entry and not entry.closed and entry.identity == identity:
+                entry.busy = True
+                return entry
+            stale = entry if entry and not entry.closed else None
+            if stale:
+                self.detachEntry(stale)
+        if stale:
+            self.closeEntry(stale)
+        if identity is None:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        conn  = self.open(path)
+        entry = CachedConnection(conn, path, self.getIdentity(path))
+        entry.busy = True
+        with self.entryLock:
+            handles[path] = entry
+            self.entries.add(entry)
+        self.start()
+        return entry
+
+    @contextmanager
+    def connect(self, path: str, create: bool = True):
+        """
+        Use this thread's handle for the database at path, opening it on first use.
+        Yields None instead of creating the file when create is False and the database does not exist.
+        """
+        entry = self.getEntry(path, create)
+        if entry is None:
+            yield None
+            return
+        try:
+            yield entry.conn
+        finally:
+            entry.lastUsed = time.monotonic()
+            entry.busy     = False
+
+    # ----- Closing -----
+    def detachEntry(self, entry):
+        # Called with entryLock held, so the owning thread can no longer pick the handle up.
+        entry.closed = True
+        self.entries.discard(entry)
+
+    def closeEntry(self, entry):
+        # Called without entryLock, a checkpoint may have to wait for readers.
+        try:
+            if self.wal:
+                entry.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.Error:
+            logger.debug(f"Could not checkpoint {entry.path}", exc_info=True)
+        try:
+            entry.conn.close()
+        except Exception:
+            logger.debug(f"Error closing {entry.path}", exc_info=True)
+
+    def closeIdle(self, maxIdle: float = None):
+        """
+        Checkpoint and close every handle that has not been used for maxIdle seconds. Handles in use are left alone.
+        """
+        maxIdle = self.idleTimeout if maxIdle is None else maxIdle
+        now     = time.monotonic()
+        with self.entryLock:
+            idle = [entry for entry in self.entries if not entry.busy and now - entry.lastUsed >= maxIdle]
+            for entry in idle:
+                self.detachEntry(entry)
+        for entry in idle:
+            self.closeEntry(entry)
+        if idle:
+            logger.debug(f"Closed {len(idle)} idle database handles")
+        return len(idle)
+
+    def closeAll(self):
+        """
+        Checkpoint and close every handle that is not in use.
+        Memory maintenance must call this before it moves or deletes databases, so no rows are left behind in a -wal file.
+        """
+        return self.closeIdle(0)
+
+    # ----- Background -----
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return
+        with self._lock:
+            if self.thread and self.thread.is_alive():
+                return
+            self.thread = threading.Thread(target=self.run, name="ConnectionCache", daemon=True)
+            self.thread.start()
+
+    def run(self):
+        while not self.stopEvent.wait(max(self.idleTimeout / 2, 0.05)):
+            self.closeIdle()
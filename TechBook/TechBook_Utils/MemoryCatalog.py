@@ -0,0 +1,242 @@
+import os
+import sqlite3
+import threading
+import logging
+from dotenv import load_dotenv
+
+from TechBook_Utils.ConnectionCache import ConnectionCache
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Set These Environment Variables in your .env file or system environment variables
+# CATALOG_FETCH_SIZE=256 (optional, catalog entries resolved against the memory databases per round trip)
+
+# Bumped whenever the catalog layout changes, an older catalog is dropped and rebuilt from the memory databases.
+CATALOG_VERSION = 2
+CATALOG_SCHEMA = (
+    '''
+    CREATE TABLE IF NOT EXISTS sources (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        path TEXT UNIQUE,
+        tier TEXT,
+        identity TEXT,
+        minId INTEGER,
+        maxId INTEGER,
+        seq INTEGER
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS entries (
+        user TEXT COLLATE NOCASE,
+        tier TEXT,
+        dtStamp TEXT,
+        source INTEGER,
+        rowId INTEGER,
+        PRIMARY KEY (user, tier, dtStamp, source, rowId)
+    ) WITHOUT ROWID
+    ''',
+    'CREATE INDEX IF NOT EXISTS entriesByDate ON entries (user, dtStamp)',
+    'CREATE INDEX IF NOT EXISTS entriesBySource ON entries (source, rowId)',
+)
+# Columns each memory layout is read back with, matching what SynMem returns for it.
+COLUMNS = {
+    "memory":  "dtStamp, content, response",
+    "details": "dtStamp, content",
+}
+# Index lookups only, so checking a source costs the same however long its history is.
+SIGNATURE = "SELECT (SELECT MIN(id) FROM memory), (SELECT MAX(id) FROM memory)"
+SEQUENCE  = "SELECT seq FROM sqlite_sequence WHERE name = 'memory'"
+# Details databases have no user column, their entries are catalogued under ''.
+KEYS = {
+    "memory":  "SELECT id, user, dtStamp FROM memory",
+    "details": "SELECT id, '', dtStamp FROM memory",
+}
+
+
+class MemoryCatalog:
+    """
+    Date-indexed catalog over the STM and LTM memory databases, kept in one index database.
+    Every entry is catalogued as (user, tier, dtStamp, source, rowId), so a date range lookup reads only the
+    matching index range and then fetches just those rows from the tiers that hold them, in chronological order
+    across tiers and a batch at a time. A source is caught up before it is queried from its MIN(id), MAX(id) and
+    AUTOINCREMENT sequence, all index lookups: appended rows are added, rows removed from either end (maintenance
+    moving the oldest rows from STM to LTM, clearing the first or last entry) are dropped, and a source that was
+    replaced is catalogued again. Entries of rows deleted from the middle are skipped when their rows are fetched.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(MemoryCatalog, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, 'initialized', False):
+            return
+        self._initComponents()
+        self.initialized = True
+
+    def _initComponents(self):
+        self.fetchSize = int(os.getenv('CATALOG_FETCH_SIZE', 256))
+        self.pool      = ConnectionCache()
+        self.syncLock  = threading.Lock()
+        self.prepared  = set()  # Catalog paths whose schema exists.
+
+    # ----- Catalog -----
+    def connect(self, catalogPath: str):
+        if catalogPath not in self.prepared or not os.path.exists(catalogPath):
+            with self.pool.connect(catalogPath) as conn, conn:
+                if conn.execute("PRAGMA user_version").fetchone()[0] != CATALOG_VERSION:
+                    conn.execute("DROP TABLE IF EXISTS entries")
+                    conn.execute("DROP TABLE IF EXISTS sources")
+                    conn.execute(f"PRAGMA user_version = {CATALOG_VERSION}")
+                for statement in CATALOG_SCHEMA:
+                    conn.execute(statement)
+            self.prepared.add(catalogPath)
+        return self.pool.connect(catalogPath)
+
+    def getSignature(self, path: str):
+        """
+        Get (identity, minId, maxId, seq) of a memory database, or None when it does not exist.
+        """
+        identity = self.pool.getIdentity(path)
+        if identity is None:
+            return None
+        try:
+            with self.pool.connect(path, create=False) as conn:
+                if conn is None:
+                    return None
+                minId, maxId = conn.execute(SIGNATURE).fetchone()
+                try:
+                    seq = (conn.execute(SEQUENCE).fetchone() or (0,))[0]
+                except sqlite3.OperationalError:
+                    seq = 0  # Not an AUTOINCREMENT table.
+        except sqlite3.OperationalError:
+            minId, maxId, seq = 0, 0, 0  # No memory table yet.
+        return f"{identity[0]}:{identity[1]}", minId or 0, maxId or 0, seq or maxId or 0
+
+    def readKeys(self, path: str, kind: str, afterId: int = 0):
+        with self.pool.connect(path, create=False) as conn:
+            if conn is None:
+                return []
+            return conn.execute(f"{KEYS[kind]} WHERE id > ?", (afterId,)).fetchall()
+
+    def syncSource(self, catalog, tier: str, path: str, kind: str):
+        """
+        Bring the catalog entries of one memory database up to date and return its source id, None when it is gone.
+        """
+        signature = self.getSignature(path)
+        source    = catalog.execute("SELECT id, identity, minId, maxId, seq FROM sources WHERE path = ?", (path,)).fetchone()
+        if signature is None:
+            if source:
+                with catalog:
+                    catalog.execute("DELETE FROM entries WHERE source = ?", (source[0],))
+                    catalog.execute("DELETE FROM sources WHERE id = ?", (source[0],))
+            return None
+        identity, minId, maxId, seq = signature
+        if source and tuple(source[1:]) == signature:
+            return source[0]
+        # Ids are AUTOINCREMENT, so a sequence that went back means the file was recreated, possibly on the same inode.
+        afterId = source[3] if source and source[1] == identity and seq >= source[4] else 0
+        keys    = self.readKeys(path, kind, afterId)
+        with catalog:
+            if source is None:
+                sourceId = catalog.execute("INSERT INTO sources (path, tier) VALUES (?, ?)", (path, tier)).lastrowid
+            else:
+                sourceId = source[0]
+            if afterId:
+                # Only rows removed from either end need dropping, the catalogued ones in between are still there.
+                catalog.execute("DELETE FROM entries WHERE source = ? AND (rowId < ? OR rowId > ?)", (sourceId, minId, maxId))
+            elif source is not None:
+                catalog.execute("DELETE FROM entries WHERE source = ?", (sourceId,))
+            catalog.executemany(
+                "INSERT OR REPLACE INTO entries (user, tier, dtStamp, source, rowId) VALUES (?, ?, ?, ?, ?)",
+                ((user or '', tier, dtStamp or '', sourceId, rowId) for rowId, user, dtStamp in keys)
+            )
+            catalog.execute(
+                "UPDATE sources SET tier = ?, identity = ?, minId = ?, maxId = ?, seq = ? WHERE id = ?",
+                (tier, identity, minId, maxId, seq, sourceId)
+            )
+        logger.debug(f"Catalogued {len(keys)} {'new ' if afterId else ''}entries of {path}")
+        return sourceId
+
+    def sync(self, catalog, sources, kind: str) -> dict:
+        """
+        Sync every (tier, path) in sources, returning {sourceId: path} for the ones that exist.
+        """
+        synced = {}
+        with self.syncLock:
+            for tier, path in sources:
+                try:
+                    sourceId = self.syncSource(catalog, tier, path, kind)
+                except sqlite3.Error:
+                    logger.error(f"Error cataloguing {path}:", exc_info=True)
+                    continue
+                if sourceId is not None:
+                    synced[sourceId] = path
+        return synced
+
+    # ----- Queries -----
+    def query(self, catalogPath: str, sources, kind: str = "memory", user: str = None, startDate: str = None, endDate: str = None):
+        """
+        Stream the entries of sources, a list of (tier, path), in chronological order.
+        kind is "memory" for conversation databases, yielding (user, dtStamp, content, response) with user '' as SynMem does,
+        or "details" for interaction and image details, yielding (dtStamp, content).
+        Dates must already be in the ISO form stored in dtStamp. Entries are fetched fetchSize at a time.
+        """
+        with self.connect(catalogPath) as catalog:
+            paths = self.sync(catalog, sources, kind)
+            if not paths:
+                return
+            where, params = [f"source IN ({', '.join('?' * len(paths))})"], list(paths)
+            user = '' if kind == "details" else user  # Keeps details lookups on the (user, dtStamp) index too.
+            if user is not None:
+                where.append("user = ?")
+                params.append(user)
+            if startDate:
+                where.append("dtStamp >= ?")
+                params.append(startDate)
+            if endDate:
+                where.append("dtStamp <= ?")
+                params.append(endDate)
+            cursor = catalog.execute(
+                f"SELECT source, rowId FROM entries WHERE {' AND '.join(where)} ORDER BY dtStamp, source, rowId", params
+            )
+            while True:
+                keys = cursor.fetchmany(self.fetchSize)
+                if not keys:
+                    break
+                for row in self.fetchRows(paths, keys, kind):
+                    yield row
+
+    def fetchRows(self, paths: dict, keys: list, kind: str) -> list:
+        """
+        Read the rows for a batch of (source, rowId) keys, one query per source, keeping the order of keys.
+        """
+        wanted = {}
+        for sourceId, rowId in keys:
+            wanted.setdefault(sourceId, []).append(rowId)
+        found = {}
+        for sourceId, rowIds in wanted.items():
+            with self.pool.connect(paths[sourceId], create=False) as conn:
+                if conn is None:
+                    continue
+                rows = conn.execute(
+                    f"SELECT id, {COLUMNS[kind]} FROM memory WHERE id IN ({', '.join('?' * len(rowIds))})", rowIds
+                ).fetchall()
+            for row in rows:
+                found[(sourceId, row[0])] = row[1:]
+        rows = []
+        for key in keys:
+            row = found.get(tuple(key))
+            if row is None:
+                continue  # Removed since the catalog was synced.
+            if kind == "memory":
+                rows.append(('', *row))
+            else:
+                rows.append((row[0], row[1] if isinstance(row[1], str) else str(row[1])))
+        return rows
@@ -0,0 +1,103 @@
+import sqlite3
+import threading
+import logging
+from datetime import datetime
+from dotenv import load_dotenv
+
+from TechBook_Utils.ConnectionCache import ConnectionCache
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+
+class MemoryReader:
+    """
+    The SynMem/HoloMem memory reads, run on cached per-thread handles instead of a new connection per database per call.
+    Queries and result shapes match SynMem's, so Memory can switch between the two without its callers noticing.
+    Dates must already be in the ISO form stored in dtStamp, e.g. from synMem.formatIsoDate.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(MemoryReader, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, 'initialized', False):
+            return
+        self._initComponents()
+        self.initialized = True
+
+    def _initComponents(self):
+        self.pool = ConnectionCache()
+
+    # ----- Queries -----
+    def query(self, dbFile: str, query: str, params=()) -> list:
+        """
+        Run a read against dbFile, returning [] when the database does not exist yet.
+        """
+        try:
+            with self.pool.connect(dbFile, create=False) as conn:
+                if conn is None:
+                    return []
+                return conn.execute(query, params).fetchall()
+        except sqlite3.Error:
+            logger.error(f"Error reading from {dbFile}:", exc_info=True)
+            return []
+
+    def dateRange(self, query: str, params: list, startDate: str = None, endDate: str = None):
+        if startDate:
+            query += ' AND dtStamp >= ?'
+            params.append(startDate)
+        if endDate:
+            query += ' AND dtStamp <= ?'
+            params.append(endDate)
+        return query, params
+
+    # ----- Memory -----
+    def retrieveSensory(self, dbFile: str) -> list:
+        """
+        Get every sensory entry as (user, dtStamp, content, response), user being '' like SynMem returns it.
+        """
+        return [('', *row) for row in self.query(dbFile, 'SELECT dtStamp, content, response FROM memory')]
+
+    def retrieveConversationDetails(self, user: str, dbFiles: list, startDate: str = None, endDate: str = None) -> list:
+        """
+        Get the conversation entries of user from the STM and LTM databases, oldest database first.
+        """
+        query, params = self.dateRange(
+            'SELECT dtStamp, content, response FROM memory WHERE user = ? COLLATE NOCASE', [user], startDate, endDate
+        )
+        return [('', *row) for dbFile in dbFiles for row in self.query(dbFile, query, params)]
+
+    def retrieveDetails(self, dbFiles: list, startDate: str = None, endDate: str = None) -> list:
+        """
+        Get (dtStamp, content) entries from interaction or image Details databases.
+        """
+        query, params = self.dateRange('SELECT dtStamp, content FROM memory WHERE 1=1', [], startDate, endDate)
+        return [
+            (row[0], row[1] if isinstance(row[1], str) else str(row[1]))
+            for dbFile in dbFiles for row in self.query(dbFile, query, params)
+        ]
+
+    def retrieveLastTimestamp(self, user: str, sensoryDb: str, stmDb: str, ltmDb: str):
+        """
+        Get the newest dtStamp for user as a datetime, checking sensory memory, then STM, then LTM. None when there is none.
+        """
+        sources = [
+            (sensoryDb, 'SELECT dtStamp FROM memory ORDER BY dtStamp DESC LIMIT 1', []),
+            (stmDb, 'SELECT dtStamp FROM memory WHERE user = ? COLLATE NOCASE ORDER BY dtStamp DESC LIMIT 1', [user]),
+            (ltmDb, 'SELECT dtStamp FROM memory WHERE user = ? COLLATE NOCASE ORDER BY dtStamp DESC LIMIT 1', [user]),
+        ]
+        for dbFile, query, params in sources:
+            rows = self.query(dbFile, query, params)
+            if rows:
+                try:
+                    return datetime.fromisoformat(rows[0][0])
+                except (TypeError, ValueError):
+                    logger.warning(f"Invalid timestamp in DB: {rows[0][0]}")
+        return None
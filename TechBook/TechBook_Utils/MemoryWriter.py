@@ -0,0 +1,158 @@
+import os
+import time
+import atexit
+import threading
+import logging
+from collections import OrderedDict
+from contextlib import contextmanager
+from dotenv import load_dotenv
+
+from TechBook_Utils.ConnectionCache import ConnectionCache
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Set These Environment Variables in your .env file or system environment variables
+# MEMORY_BATCH_SIZE=32 (optional, queued memory records that trigger a flush straight away)
+# MEMORY_FLUSH_INTERVAL=1.0 (optional, most seconds a queued memory record waits before it is written)
+
+# Keeps the newest rows of a capped database, the way sensory memory is limited.
+TRIM = "DELETE FROM memory WHERE id NOT IN (SELECT id FROM memory ORDER BY id DESC LIMIT ?)"
+
+
+class MemoryWriter:
+    """
+    Write-behind writer for memory records.
+    Records are queued and a background thread commits them in one transaction per database, once enough
+    are queued or the oldest has waited long enough. Each batch reuses the writer thread's cached handle and one
+    prepared insert per column set through executemany. Tables are created by the memory package itself, through
+    the create callable passed with each record, so the layout never drifts from SynMem/HoloMem. Whatever is still
+    queued is written when the process exits, flush() writes it straight away, e.g. before reading memory back,
+    and paused() holds writes back while maintenance moves or deletes the databases.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(MemoryWriter, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, 'initialized', False):
+            return
+        self._initComponents()
+        self.initialized = True
+
+    def _initComponents(self):
+        self.batchSize = int(os.getenv('MEMORY_BATCH_SIZE', 32))
+        self.interval  = float(os.getenv('MEMORY_FLUSH_INTERVAL', 1.0))
+        self.queueLock = threading.Condition()
+        self.flushLock = threading.RLock()  # Keeps batches in the order they were queued.
+        self.pending   = []  # (path, row, create, limit)
+        self.queuedAt  = None  # When the oldest pending record was queued.
+        self.thread    = None
+        self.stopEvent = threading.Event()
+        self.pool      = ConnectionCache()
+        atexit.register(self.close)
+
+    # ----- Queue -----
+    def write(self, path: str, row: dict, create=None, limit: int = None):
+        """
+        Queue a {column: value} row for the memory table of the database at path.
+        create(path) makes the database with its table when it does not exist yet, e.g. synMem.createMemoryDatabase.
+        limit keeps only the newest limit rows of the database, the way sensory memory is capped.
+        """
+        if not isinstance(row, dict) or not row:
+            raise ValueError(f"Memory rows must be a non-empty {{column: value}} dict, got {row!r}")
+        with self.queueLock:
+            if not self.pending:
+                self.queuedAt = time.monotonic()
+            self.pending.append((path, row, create, limit))
+            if len(self.pending) >= self.batchSize:
+                self.queueLock.notify()
+        self.start()
+
+    def hasPending(self) -> bool:
+        return bool(self.pending)
+
+    # ----- Writing -----
+    def flush(self):
+        """
+        Write everything queued so far, one transaction per database.
+        """
+        with self.flushLock:
+            with self.queueLock:
+                batch, self.pending, self.queuedAt = self.pending, [], None
+            if not batch:
+                return 0
+            grouped = OrderedDict()
+            for path, row, create, limit in batch:
+                entry = grouped.setdefault(path, {"rows": OrderedDict(), "count": 0, "create": None, "limit": None})
+                entry["rows"].setdefault(tuple(row), []).append(tuple(row.values()))
+                entry["count"] += 1
+                entry["create"] = create or entry["create"]
+                entry["limit"]  = limit if limit is not None else entry["limit"]
+            for path, entry in grouped.items():
+                try:
+                    if entry["create"]:
+                        entry["create"](path)  # The file may have been removed by maintenance since the last batch.
+                    with self.pool.connect(path) as conn, conn:
+                        for columns, rows in entry["rows"].items():
+                            conn.executemany(
+                                f"INSERT INTO memory ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})", rows
+                            )
+                        if entry["limit"]:
+                            conn.execute(TRIM, (entry["limit"],))
+                except Exception:
+                    logger.error(f"Error writing {entry['count']} memory records to {path}:", exc_info=True)
+            logger.debug(f"Flushed {len(batch)} memory records to {len(grouped)} databases")
+            return len(batch)
+
+    @contextmanager
+    def paused(self):
+        """
+        Write everything queued, checkpoint and close every cached handle, and hold further writes back until the
+        block exits. Memory maintenance runs inside it, so it only ever moves or deletes complete database files.
+        """
+        with self.flushLock:
+            self.flush()
+            self.pool.closeAll()
+            yield
+
+    # ----- Background -----
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return
+        with self._lock:
+            if self.thread and self.thread.is_alive():
+                return
+            self.stopEvent.clear()
+            self.thread = threading.Thread(target=self.run, name="MemoryWriter", daemon=True)
+            self.thread.start()
+
+    def run(self):
+        while not self.stopEvent.is_set():
+            with self.queueLock:
+                if not self.pending:
+                    self.queueLock.wait(self.interval)
+                    continue
+                waited = time.monotonic() - self.queuedAt
+                if len(self.pending) < self.batchSize and waited < self.interval:
+                    self.queueLock.wait(self.interval - waited)
+                    continue
+            self.flush()
+
+    def close(self):
+        """
+        Stop the background thread and write whatever is still queued.
+        """
+        self.stopEvent.set()
+        with self.queueLock:
+            self.queueLock.notify_all()
+        if self.thread and self.thread.is_alive() and self.thread is not threading.current_thread():
+            self.thread.join(timeout=5)
+        self.flush()
+        self.pool.closeAll()
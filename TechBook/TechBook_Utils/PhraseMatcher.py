@@ -0,0 +1,86 @@
+
+import logging
+from collections import deque, namedtuple
+
+logger = logging.getLogger(__name__)
+
+PhraseMatch = namedtuple("PhraseMatch", ["phrase", "value", "start", "end"])
+
+
+class PhraseMatcher:
+    """
+    Aho-Corasick automaton over the keys of a {phrase: value} map, built once when the map is set.
+    find scans the text a single time and returns the longest phrase it contains, so overlapping phrases
+    always resolve the same way: longest phrase first, then the one that starts earliest.
+    Phrases match anywhere in the text, the same as a substring check, and case is ignored.
+    """
+
+    def __init__(self, phrases=None):
+        self.build(phrases or {})
+
+    def build(self, phrases):
+        """
+        Build the automaton for a {phrase: value} map (or any iterable of phrases, mapped to themselves).
+        """
+        if not hasattr(phrases, 'items'):
+            phrases = {phrase: phrase for phrase in phrases}
+        self.goto    = [{}]    # node -> {char: node}
+        self.fail    = [0]     # node -> longest proper suffix node
+        self.longest = [None]  # node -> (length, phrase) of the longest phrase ending at this node
+        self.values  = {}
+        for phrase, value in phrases.items():
+            key = str(phrase).lower()
+            if not key or key in self.values:
+                continue
+            self.values[key] = (phrase, value)
+            node = 0
+            for char in key:
+                nxt = self.goto[node].get(char)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[node][char] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.longest.append(None)
+                node = nxt
+            self.longest[node] = (len(key), key)
+
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self.goto[node].items():
+                queue.append(child)
+                state = self.fail[node]
+                while state and char not in self.goto[state]:
+                    state = self.fail[state]
+                self.fail[child] = self.goto[state].get(char, 0)
+                if self.longest[child] is None:
+                    self.longest[child] = self.longest[self.fail[child]]
+        return self
+
+    def find(self, text):
+        """
+        Get the PhraseMatch(phrase, value, start, end) of the longest phrase in text, or None when there is none.
+        """
+        if not text:
+            return None
+        goto, fail, longest = self.goto, self.fail, self.longest
+        best, node = None, 0
+        for index, char in enumerate(str(text).lower()):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            found = longest[node]
+            if found and (best is None or found[0] > best[0]):
+                best = (found[0], found[1], index + 1)
+        if best is None:
+            return None
+        length, key, end = best
+        phrase, value = self.values[key]
+        return PhraseMatch(phrase, value, end - length, end)
+
+    def remove(self, text, match):
+        """
+        Get text with the matched phrase cut out, e.g. the arguments left after an action phrase.
+        """
+        return (text[:match.start] + text[match.end:]).strip()
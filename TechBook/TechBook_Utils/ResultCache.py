@@ -0,0 +1,234 @@
+
+import os
+import sys
+import json
+import time
+import functools
+import threading
+import logging
+from collections import OrderedDict
+from dotenv import load_dotenv
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Set These Environment Variables in your .env file or system environment variables
+# RESULT_CACHE_SIZE=512 (optional, number of cached tool and action results kept in memory)
+
+NO_POLICY = {"ttl": 0, "key": "args", "mutating": False}
+
+
+class ResultCache:
+    """
+    Size-bounded LRU of tool and action results with a TTL per entry.
+    What gets cached is declared by each skill (or tool module) in _metaData under "cache":
+        "cache": {
+            "ttl": 60,                                                  # seconds, for every action of the skill
+            "key": "args",                                              # "args" (default) or "action" to ignore arguments
+            "actions": {"retrieve-conversation-details": {"ttl": 30}},  # per action overrides, a ttl of 0 disables caching
+            "mutating": ["clear-all-entries"],                          # never cached, and clear the skill's cached results
+        }
+    Actions that declare "writes" under "resources" are treated as mutating too. Errors are never cached.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(ResultCache, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, 'initialized', False):
+            return
+        self._initComponents()
+        self.initialized = True
+
+    def _initComponents(self):
+        self.maxSize   = int(os.getenv('RESULT_CACHE_SIZE', 512))
+        self.cacheLock = threading.Lock()
+        self.entries   = OrderedDict()  # (owner id, name, action, args) -> (expires, result)
+        self.policies  = {}  # id(owner) -> (owner, declared cache policy, declared resources)
+        self.hits      = 0
+        self.misses    = 0
+        self.bypasses  = 0
+
+    # ----- Policies -----
+    def getOwner(self, func):
+        # Bound methods belong to their skill instance, plain functions to their module.
+        owner = getattr(func, "__self__", None)
+        if owner is None:
+            owner = sys.modules.get(getattr(func, "__module__", None) or "")
+        return owner
+
+    def getDeclared(self, owner):
+        entry = self.policies.get(id(owner))
+        if entry is None or entry[0] is not owner:
+            cache, resources = {}, {}
+            metaMethod = getattr(owner, "_metaData", None) or getattr(owner, "_metadata", None)
+            if callable(metaMethod):
+                try:
+                    meta = metaMethod() or {}
+                    cache, resources = meta.get("cache") or {}, meta.get("resources") or {}
+                except Exception:
+                    logger.warning(f"Could not read cache policy from {owner}", exc_info=True)
+            entry = (owner, cache, resources)
+            with self.cacheLock:
+                self.policies[id(owner)] = entry
+        return entry[1], entry[2]
+
+    def getPolicy(self, func, action=None):
+        """
+        Get the {"ttl", "key", "mutating"} policy for calling func, with action being the sub-action if there is one.
+        """
+        owner = self.getOwner(func)
+        cache, resources = self.getDeclared(owner)
+        if not cache and not resources:
+            return NO_POLICY
+        name     = getattr(func, "__name__", "")
+        key      = action.lower() if isinstance(action, str) else name
+        override = (cache.get("actions") or {}).get(key) or {}
+        declared = resources.get(key) or resources.get(name) or {}
+        mutating = key in (cache.get("mutating") or []) or name in (cache.get("mutating") or []) or bool(declared.get("writes"))
+        return {
+            "ttl":      0 if mutating else float(override.get("ttl", cache.get("ttl", 0)) or 0),
+            "key":      override.get("key", cache.get("key", "args")),
+            "mutating": mutating,
+        }
+
+    # ----- Entries -----
+    def makeKey(self, func, action, args, kwargs, policy):
+        owner = self.getOwner(func)
+        if policy["key"] == "action":
+            return (id(owner), getattr(func, "__name__", ""), action, None)
+        try:
+            argKey = json.dumps([args, kwargs], sort_keys=True, default=repr)
+        except (TypeError, ValueError):
+            argKey = repr((args, sorted(kwargs.items())))
+        return (id(owner), getattr(func, "__name__", ""), action, argKey)
+
+    def isError(self, result) -> bool:
+        if result is None:
+            return True
+        if isinstance(result, dict):
+            return "error" in result
+        return isinstance(result, str) and result.lstrip().lower().startswith(("error", "function '", "could not", "invalid"))
+
+    def get(self, key):
+        with self.cacheLock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return False, None
+            if entry[0] <= time.monotonic():
+                del self.entries[key]
+                return False, None
+            self.entries.move_to_end(key)
+            return True, entry[1]
+
+    def put(self, key, result, ttl):
+        with self.cacheLock:
+            self.entries[key] = (time.monotonic() + ttl, result)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxSize:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, owner=None):
+        """
+        Drop the cached results of one skill or tool module, or everything when owner is None.
+        """
+        with self.cacheLock:
+            if owner is None:
+                self.entries.clear()
+                self.policies.clear()
+                return
+            for key in [key for key in self.entries if key[0] == id(owner)]:
+                del self.entries[key]
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size":     len(self.entries),
+            "hits":     self.hits,
+            "misses":   self.misses,
+            "bypasses": self.bypasses,
+            "hitRate":  (self.hits / total) if total else 0.0,
+        }
+
+    # ----- Calls -----
+    def lookup(self, func, action, args, kwargs):
+        """
+        Work out how a call to func is cached. Returns (policy, key, found, result), key is None when it is not cached.
+        """
+        policy = self.getPolicy(func, action)
+        if policy["mutating"]:
+            self.bypasses += 1
+            return policy, None, False, None
+        if policy["ttl"] <= 0:
+            return policy, None, False, None
+        key = self.makeKey(func, action, args, kwargs or {}, policy)
+        found, result = self.get(key)
+        if found:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return policy, key, found, result
+
+    def store(self, policy, key, result):
+        if key is not None and not self.isError(result):
+            self.put(key, result, policy["ttl"])
+
+    def call(self, func, execute, action=None, args=(), kwargs=None):
+        """
+        Run execute() for a call to func, serving and storing its result according to func's declared policy.
+        args, kwargs and action only build the cache key, execute does the actual call.
+        """
+        policy, key, found, result = self.lookup(func, action, args, kwargs)
+        if found:
+            return result
+        try:
+            result = execute()
+        finally:
+            if policy["mutating"]:
+                self.invalidate(self.getOwner(func))
+        self.store(policy, key, result)
+        return result
+
+    async def callAsync(self, func, execute, action=None, args=(), kwargs=None):
+        """
+        Asyncio variant of call, awaiting execute().
+        """
+        policy, key, found, result = self.lookup(func, action, args, kwargs)
+        if found:
+            return result
+        try:
+            result = await execute()
+        finally:
+            if policy["mutating"]:
+                self.invalidate(self.getOwner(func))
+        self.store(policy, key, result)
+        return result
+
+    def memoize(self, ttl=60, key="args"):
+        """
+        Decorator caching a function's results for ttl seconds, for functions outside of skills and tools.
+            @ResultCache().memoize(ttl=300)
+            def lookup(city): ...
+        """
+        policy = {"ttl": ttl, "key": key, "mutating": False}
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                cacheKey = self.makeKey(func, None, args, kwargs, policy)
+                found, result = self.get(cacheKey)
+                if found:
+                    self.hits += 1
+                    return result
+                self.misses += 1
+                result = func(*args, **kwargs)
+                self.store(policy, cacheKey, result)
+                return result
+            return wrapper
+        return decorator
@@ -0,0 +1,133 @@
+
+import os
+import json
+import threading
+import logging
+from dotenv import load_dotenv
+
+from TechBook_Utils.SkillTracker import SkillTracker
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+SCHEMA_TYPES = ("chat_completions", "responses", "typed")
+
+
+class SchemaCache:
+    """
+    Process-wide cache of tool schemas shared by SkillGraph and the ToolSchemas managers.
+    Single schemas are kept per tool, source file and schema type together with the hash of that file, so an edited
+    tool replaces its old schema instead of adding to it, and whole tool lists are memoized
+    together with their pre-serialized JSON bytes, so a request body never re-runs json.dumps on the tools.
+    Everything is tied to a version that is bumped when skills or tools are reloaded.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(SchemaCache, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, 'initialized', False):
+            return
+        self._initComponents()
+        self.initialized = True
+
+    def _initComponents(self):
+        self.tracker   = SkillTracker()
+        self.cacheLock = threading.RLock()
+        self.version   = 0
+        self.schemas   = {}  # (toolKey, sourceFile, schemaType) -> (sourceHash, schema)
+        self.lists     = {}  # (version, schemaType, wrapped, tool ids) -> (schemas, bytes)
+        self.toolLists = {}  # (version, component ids) -> {name: function}
+
+    def invalidate(self):
+        """
+        Drop every memoized tool list and start a new version. Single schemas are kept unless their source file is gone.
+        """
+        with self.cacheLock:
+            self.version += 1
+            self.lists.clear()
+            self.toolLists.clear()
+            for key in [key for key in self.schemas if key[1] and not os.path.exists(key[1])]:
+                del self.schemas[key]
+        logger.debug(f"Schema cache invalidated, now at version {self.version}")
+
+    # ----- Keys -----
+    def toolKey(self, func):
+        return f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', getattr(func, '__name__', repr(func)))}"
+
+    def sourceFile(self, func):
+        return getattr(func, "__manifestPath__", None) or self.tracker.sourceFile(func)
+
+    def listKey(self, toolList, schemaType, wrapped=False):
+        return (self.version, schemaType, wrapped, tuple((name, id(func)) for name, func in toolList.items()))
+
+    # ----- Tools -----
+    def getToolList(self, components, parse):
+        """
+        Get the {name: function} tool dict for components, parsing it with parse(components) once per version.
+        """
+        key = (self.version, tuple(map(id, components)))
+        toolList = self.toolLists.get(key)
+        if toolList is None:
+            toolList = parse(components)
+            with self.cacheLock:
+                self.toolLists = {key: toolList}
+        return toolList
+
+    # ----- Schemas -----
+    def getSchema(self, func, schemaType, build):
+        """
+        Get one tool's schema, building it with build(func, schemaType) only if its source changed.
+        """
+        path   = self.sourceFile(func)
+        key    = (self.toolKey(func), path, schemaType)
+        digest = self.tracker.fileHash(path)
+        cached = self.schemas.get(key)
+        if cached is not None and cached[0] == digest:
+            return cached[1]
+        schema = build(func, schemaType)
+        with self.cacheLock:
+            self.schemas[key] = (digest, schema)
+        return schema
+
+    def serialize(self, schemas, schemaType):
+        if schemaType == "typed":
+            payload = [
+                schema.model_dump(mode='json', exclude_none=True) if hasattr(schema, "model_dump") else schema
+                for schema in schemas
+            ]
+        else:
+            payload = schemas
+        return json.dumps(payload, separators=(",", ":"), default=str).encode('utf-8')
+
+    def getEntry(self, toolList, schemaType, build, wrap=None):
+        key = self.listKey(toolList, schemaType, wrap is not None)
+        entry = self.lists.get(key)
+        if entry is None:
+            with self.cacheLock:
+                entry = self.lists.get(key)
+                if entry is None:
+                    schemas = [self.getSchema(func, schemaType, build) for func in toolList.values()]
+                    entry = (wrap(schemas) if wrap else schemas, self.serialize(schemas, schemaType))
+                    self.lists[key] = entry
+        return entry
+
+    def getSchemas(self, toolList, schemaType, build, wrap=None):
+        """
+        Get the schemas for a whole tool list, memoized for the current version.
+        wrap(schemas) can turn the list into the provider's container, e.g. a Google types.Tool.
+        The returned objects are shared between callers and must be treated as read-only.
+        """
+        return self.getEntry(toolList, schemaType, build, wrap)[0]
+
+    def getSchemaBytes(self, toolList, schemaType, build):
+        """
+        Get the schemas for a whole tool list as compact, pre-serialized JSON bytes.
+        """
+        return self.getEntry(toolList, schemaType, build)[1]
@@ -0,0 +1,182 @@
+
+import json
+import types
+import inspect
+import threading
+import logging
+from collections import namedtuple
+from dotenv import load_dotenv
+
+from TechBook_Utils.SkillManifest import SIG_ATTRS
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+ACTION_MAP_ATTRS = ("actionMap", "ACTION_MAP", "action_map")
+
+# One resolved action: the prebound callable, how many positional arguments it takes and how to shape the raw args.
+DispatchEntry = namedtuple("DispatchEntry", ["skill", "action", "func", "arity", "coerce"])
+
+
+class SkillDispatcher:
+    """
+    Frozen dispatch table for skill dispatchers such as appSkill(action, *args).
+    Everything systemDispatcher works out with inspect on every call (the target method, its arity and
+    whether it takes a list or dict signature) is resolved once when the skills are loaded, so dispatching
+    is a dict lookup plus a precompiled argument coercer. The table is rebuilt and swapped in as a whole on reload.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(SkillDispatcher, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, 'initialized', False):
+            return
+        self._initComponents()
+        self.initialized = True
+
+    def _initComponents(self):
+        self.table     = types.MappingProxyType({})
+        self.tableLock = threading.Lock()
+
+    # ----- Coercers -----
+    def _joinFragments(self, args, opener, closer):
+        # The action parser splits a JSON list/dict argument on its commas, so put it back together.
+        if len(args) > 1 and isinstance(args[0], str) and isinstance(args[-1], str) \
+                and args[0].startswith(opener) and args[-1].endswith(closer):
+            try:
+                return json.loads('","'.join(args))
+            except Exception:
+                return None
+        if len(args) == 1 and isinstance(args[0], str):
+            try:
+                return json.loads(args[0])
+            except Exception:
+                return None
+        return None
+
+    def listCoercer(self):
+        def coerce(args):
+            possible = self._joinFragments(args, "[", "]")
+            return (possible if isinstance(possible, list) else list(args),)
+        return coerce
+
+    def dictCoercer(self, keys):
+        keys = tuple(keys)
+
+        def coerce(args):
+            possible = self._joinFragments(args, "{", "}")
+            values = [possible.get(k) for k in keys] if isinstance(possible, dict) else args
+            return (dict(zip(keys, values)),)
+        return coerce
+
+    def positionalCoercer(self, arity):
+        if arity is None:
+            return lambda args: args
+        return lambda args: args[:arity]
+
+    # ----- Building -----
+    def getSig(self, owner, funcName, key):
+        for attr in SIG_ATTRS[key]:
+            value = getattr(owner, attr, None)
+            if isinstance(value, dict) and funcName in value:
+                return value[funcName]
+        return None
+
+    def getActionMap(self, owner):
+        for attr in ACTION_MAP_ATTRS:
+            value = getattr(owner, attr, None)
+            if isinstance(value, dict):
+                return value
+        return {}
+
+    def isDispatcher(self, func):
+        """
+        Check whether func is a skill dispatcher, i.e. takes an action followed by *args.
+        """
+        try:
+            params = inspect.signature(func).parameters
+        except (TypeError, ValueError):
+            return False
+        return "action" in params and any(p.kind == p.VAR_POSITIONAL for p in params.values())
+
+    def buildEntry(self, skill, action, func, owner=None):
+        """
+        Resolve one action into a DispatchEntry.
+        """
+        owner    = getattr(func, "__self__", None) or owner
+        funcName = getattr(func, "__name__", "")
+        listSig  = self.getSig(owner, funcName, "listSig")
+        dictSig  = self.getSig(owner, funcName, "dictSig")
+        if listSig:
+            return DispatchEntry(skill, action, func, 1, self.listCoercer())
+        if dictSig:
+            return DispatchEntry(skill, action, func, 1, self.dictCoercer(dictSig.keys()))
+        try:
+            params = inspect.signature(func).parameters.values()
+            arity = None if any(p.kind == p.VAR_POSITIONAL for p in params) else len(params)
+        except (TypeError, ValueError):
+            arity = None
+        return DispatchEntry(skill, action, func, arity, self.positionalCoercer(arity))
+
+    def buildTable(self, skills):
+        """
+        Build the dispatch table for a list of skills and swap it in.
+        Keys are (dispatcher name, action), e.g. ("appSkill", "open-app").
+        """
+        table = {}
+        for skill in skills or []:
+            actionMap = self.getActionMap(skill)
+            if not actionMap:
+                continue
+            # Skill classes are inspected on the class so no skill state is touched, skill modules directly.
+            source = skill if isinstance(skill, types.ModuleType) else type(skill)
+            for name, method in inspect.getmembers(source, predicate=inspect.isfunction):
+                if name.startswith("_") or not self.isDispatcher(method):
+                    continue
+                for action, func in actionMap.items():
+                    try:
+                        table[(name, action.lower())] = self.buildEntry(name, action.lower(), func, skill)
+                    except Exception:
+                        logger.error(f"Failed to build dispatch entry for {name} '{action}'", exc_info=True)
+        with self.tableLock:
+            self.table = types.MappingProxyType(table)
+        logger.debug(f"Built dispatch table with {len(table)} actions")
+        return self.table
+
+    def getEntry(self, skill, actionMap, action):
+        """
+        Get the entry for an action, resolving it on the fly when the table is missing or stale for it
+        (e.g. the skill was reloaded or is used without a SkillGraph).
+        """
+        key   = (skill, action)
+        func  = actionMap.get(action)
+        entry = self.table.get(key)
+        if entry is not None and entry.func is func:
+            return entry
+        if func is None:
+            return None
+        entry = self.buildEntry(skill, action, func)
+        with self.tableLock:
+            self.table = types.MappingProxyType({**self.table, key: entry})
+        return entry
+
+    # ----- Dispatch -----
+    def dispatch(self, skill, actionMap, action: str, *args):
+        """
+        Drop-in replacement for SkillLink.executeSkill('system', skill, actionMap, action, *args).
+        """
+        try:
+            entry = self.getEntry(skill, actionMap, action.lower())
+            if entry is None:
+                return f"Invalid {skill} Action: {action}"
+            return entry.func(*entry.coerce(list(args)))
+        except Exception as e:
+            logger.error(f"Error executing {skill} with: {action}", exc_info=True)
+            return f"Error: {e}"
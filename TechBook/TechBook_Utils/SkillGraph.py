@@ -1,6 +1,9 @@
 
 
 import os
+import time
+import asyncio
+import inspect
 import threading
 import logging
 from dotenv import load_dotenv
@@ -9,6 +12,25 @@ from dotenv import load_dotenv
 # from SkillLink import SkillLink, SyncLink
 from HoloLink import HoloLink as SkillLink
 from HoloSync import HoloSync as SyncLink
+from google.genai import types
+
+from TechBook_Utils.SkillManifest import SkillManifest
+from TechBook_Utils.SkillProxy import SkillProxy
+from TechBook_Utils.ActionExecutor import ActionExecutor
+from TechBook_Utils.ActionScheduler import ActionScheduler
+from TechBook_Utils.ActionParser import ActionParser
+from TechBook_Utils.SkillDispatcher import SkillDispatcher
+from TechBook_Utils.SkillWatcher import SkillWatcher
+from TechBook_Utils.SkillTracker import SkillTracker
+from TechBook_Utils.SkillInstructions import SkillInstructions
+from TechBook_Utils.SkillSelector import SkillSelector
+from TechBook_Utils.SchemaCache import SchemaCache
+from TechBook_Utils.ToolResolver import ToolResolver
+from TechBook_Utils.ToolCallRunner import ToolCallRunner
+from TechBook_Utils.ToolValidator import ToolValidator
+from TechBook_Utils.ResultCache import ResultCache
+from TechBook_Utils.ActionTracer import ActionTracer
+from TechBook_Utils.SkillRouter import SkillRouter
 
 load_dotenv()
 
@@ -18,6 +40,15 @@ logger = logging.getLogger(__name__)
 # SHOW_CAPABILITIES=True (optional, to show capabilities at startup)
 # SHOW_METADATA=True (optional, to show metadata at startup)
 # SHOW_CALLED_ACTIONS=True (optional, to show called actions during execution)
+# USE_SKILL_MANIFEST=True (optional, to serve tool metadata and schemas from the on-disk manifest and only import tools when they are called)
+# LAZY_SKILLS=True (optional, to register skills as lightweight proxies that only import and construct the real skill when it is first called)
+# PARALLEL_ACTIONS=True (optional, to run multiple actions from one turn concurrently instead of one after another)
+# SCHEDULE_ACTIONS=True (optional, to run actions concurrently but keep actions that share declared resources in order)
+# WATCH_SKILLS=True (optional, to reload reloadable skills as soon as their files change instead of rescanning them on a timer)
+# SELECT_SKILLS=True (optional, to only describe the skills relevant to what the user said instead of every skill on every turn)
+# VALIDATE_TOOL_ARGS=True (optional, to check and coerce tool arguments against the tool signature before the tool is called)
+# CACHE_RESULTS=True (optional, to reuse tool and action results for as long as the skill's _metaData "cache" policy allows)
+# ROUTE_USER_SKILLS=True (optional, to answer plain user skill commands like "what is the time" locally without calling the model)
 
 
 class SkillGraph:
@@ -48,11 +79,45 @@ class SkillGraph:
         self.schemaType    = os.getenv('SCHEMA_TYPE', 'chat_completions').lower()  # Default to 'chat_completions' if not set
         self.showMetaData  = os.getenv('SHOW_METADATA', 'False') == 'True'
         self.syncActivated = os.getenv("ACTIVATE_SKILL_SYNC", "False")
+        self.useManifest   = os.getenv('USE_SKILL_MANIFEST', 'False') == 'True'
+        self.lazySkills    = os.getenv('LAZY_SKILLS', 'False') == 'True'
+        self.parallel      = os.getenv('PARALLEL_ACTIONS', 'False') == 'True'
+        self.scheduled     = os.getenv('SCHEDULE_ACTIONS', 'False') == 'True'
+        self.watchSkills   = os.getenv('WATCH_SKILLS', 'False') == 'True'
+        self.relevantOnly  = os.getenv('SELECT_SKILLS', 'False') == 'True'
+        self.validateArgs  = os.getenv('VALIDATE_TOOL_ARGS', 'False') == 'True'
+        self.cacheResults  = os.getenv('CACHE_RESULTS', 'False') == 'True'
+        self.routeInput    = os.getenv('ROUTE_USER_SKILLS', 'False') == 'True'
+        self.executor      = ActionExecutor()
+        self.scheduler     = ActionScheduler()
+        self.actionParser  = ActionParser()
+        self.dispatcher    = SkillDispatcher()
+        self.watcher       = SkillWatcher()
+        self.tracker       = SkillTracker()
+        self.instructions  = SkillInstructions()
+        self.selector      = SkillSelector()
+        self.schemaCache   = SchemaCache()
+        self.toolResolver  = ToolResolver()
+        self.toolCalls     = ToolCallRunner()
+        self.toolValidator = ToolValidator()
+        self.resultCache   = ResultCache()
+        self.tracer        = ActionTracer()
+        self.router        = SkillRouter()
+        # Built once so tracing and caching cost nothing per call when they are off.
+        self.actionRunner  = self.tracer.wrap(self.executeCachedAction if self.cacheResults else self.executeLinkedAction)
+        self.asyncRunner   = self.tracer.wrapAsync(self.executeCachedActionAsync if self.cacheResults else self.executeLinkedActionAsync)
+        self.skillsVersion = 0
+        self.manifest      = SkillManifest()
         if self.syncActivated:
             # self.skillList=["research"] # List the skills you want to sync from SkillForge
             self.syncLink.startSync() #(syncList=self.skillList, override=False)  # Download the latest skills from SkillForge changing the override parameter to True will overwrite existing skills
         self.skillComponents()
         self.toolComponents()
+        if self.validateArgs:
+            self.toolValidator.compileTools(self.getToolList())
+        if self.routeInput:
+            self.router.buildIndex(self.userSkills)
+        self.skillStates = self.tracker.getStates(self.getAllComponents())
         self.showSkillsAndTools()  # Load skills and tools at startup if configured to do so.
 
     def showSkillsAndTools(self):
@@ -80,6 +145,20 @@ class SkillGraph:
         """
         self.userSkills = [] # If not using user setup, you can skip this.
         self.agentSkills = []
+        if self.lazySkills:
+            # Proxies are built from the manifest, the real skill is imported and constructed on its first call.
+            SkillProxy.loadComponents(
+                paths=[
+                    [self.getDir(self.baseSkillsDir, 'User')], # If not using user setup, you can skip this.
+                    [self.getDir(self.baseSkillsDir, 'Agent')]
+                ],
+                components=[
+                    self.userSkills, # If not using user setup, you can skip this.
+                    self.agentSkills
+                ]
+            )
+            self.dispatcher.buildTable(self.agentSkills)
+            return
         self.skillLink.loadComponents(
             paths=[
                 [self.getDir(self.baseSkillsDir, 'User')], # If not using user setup, you can skip this. Refer to the Example_3.py for more details on how to use the user skills.
@@ -95,12 +174,18 @@ class SkillGraph:
             ],
             #cycleInterval=60 # Optional, set the cycle interval in seconds for auto reloading skills (default is 60 seconds).
         )
+        # Resolve every (skill, action) pair once so dispatching never has to inspect the skill.
+        self.dispatcher.buildTable(self.agentSkills)
 
     def toolComponents(self):
         """
         Load custom tools for the self agent.
         These tools are not part of the dynamic, static and restricted skills.
         """
+        if self.useManifest:
+            # Tools are registered from the manifest and their modules are only imported the first time they are called.
+            self.agentTools = self.manifest.buildTools(self.getDir(self.baseToolsDir, 'Tools'))
+            return
         self.agentTools = []
         self.skillLink.loadComponents(
             paths=[
@@ -124,7 +209,59 @@ class SkillGraph:
         skills = (
             self.userSkills
         )
-        return self.skillLink.getComponents(skills, content)
+        getComponents = self.tracer.wrap(self.skillLink.getComponents, "user", self.describeUserCall)
+        return getComponents(skills, content)
+
+    def describeUserCall(self, skills, content):
+        return "SkillLink", "getComponents", (content,), {}
+
+    def executeUserAction(self, skill, content, phrase=None, execute=None):
+        """
+        Run skill.executeAction(content), or execute() when given, recording it as a "user" event when TRACE_ACTIONS is enabled.
+        Skills that pass on the content (return None) are not recorded, only the one that handled it.
+        """
+        execute = execute or (lambda: skill.executeAction(content))
+        if not self.tracer.enabled:
+            return execute()
+        name  = type(skill).__name__
+        start = time.perf_counter()
+        try:
+            result = execute()
+        except Exception as e:
+            self.tracer.record("user", name, phrase or "executeAction", (content,), {}, start, None, str(e))
+            raise
+        if result is not None:
+            self.tracer.record("user", name, phrase or "executeAction", (content,), {}, start, result)
+        return result
+
+    def routeUserInput(self, content, threshold=None):
+        """
+        Match content against the trigger phrases of the user skills without calling the model.
+        Returns RouteMatch(skill, action, phrase, score, args) when the match is confident enough, otherwise None to defer to the model.
+        """
+        return self.router.route(content, threshold)
+
+    def getRoutedActions(self, content, threshold=None):
+        """
+        Answer content straight from the user skill it routes to, when ROUTE_USER_SKILLS is enabled.
+        The action is called with the argument the router took from the normalized input, without filler words.
+        Returns None when there is no confident route or the skill did not handle it, so the caller falls back to the model.
+        """
+        if not self.routeInput:
+            return None
+        match = self.routeUserInput(content, threshold)
+        if not match:
+            return None
+        logger.debug(f"Routed '{content}' to {type(match.skill).__name__} '{match.phrase}' (score {match.score:.2f})")
+        if not callable(match.action):
+            # Proxied skills only know their actions by name, they get the normalized phrase and argument instead.
+            text = " ".join((match.phrase, *match.args))
+            return self.executeUserAction(match.skill, text, match.phrase)
+        try:
+            return self.executeUserAction(match.skill, " ".join(match.args), match.phrase, lambda: match.action(*match.args))
+        except Exception:
+            logger.error(f"Error running routed action '{match.phrase}' for '{content}':", exc_info=True)
+            return None
 
     def getAgentActions(self):
         """
@@ -140,13 +277,63 @@ class SkillGraph:
         """ 
         Reload all skills and print any new skills added.
         Only necessary when letting the agent create new skills or when you want to refresh the skills during runtime.
+        Returns the change set, {"added": {...}, "removed": {...}, "changed": {...}} keyed by (path, className).
         """
-        original = self.getMetaData()
         self.skillLink.reloadSkills()
-        new = self.getMetaData()
-        for skill in new:
-            if skill not in original:
-                print(f"I've added the new skill {skill['className']} That {skill['description']}.\n")
+        changes = self.refreshSkills()
+        for (_, className), meta in changes["added"].items():
+            print(f"I've added the new skill {className} That Allows me to {meta.get('description', '').lower()}.\n")
+        return changes
+
+    def getAllComponents(self):
+        """
+        Get every loaded skill and tool, including the optional dynamic, static and restricted groups.
+        """
+        components = []
+        for name in ('userSkills', 'agentSkills', 'dynamicUserSkills', 'dynamicAgentSkills', 'staticUserSkills',
+                     'staticAgentSkills', 'restrictedUserSkills', 'restrictedAgentSkills', 'agentTools'):
+            components.extend(getattr(self, name, None) or [])
+        return components
+
+    def refreshSkills(self):
+        """
+        Work out what changed since the last refresh and update everything derived from the skills.
+        Bumps skillsVersion whenever something changed, which cached instructions and schemas are keyed on.
+        """
+        states  = self.tracker.getStates(self.getAllComponents())
+        changes = self.tracker.diff(getattr(self, 'skillStates', None), states)
+        self.skillStates = states
+        if self.tracker.hasChanges(changes):
+            self.skillsVersion += 1
+            self.instructions.pruneFragments(self.agentSkills, states)
+            self.schemaCache.invalidate()
+            self.resultCache.invalidate()
+            if self.validateArgs:
+                self.toolValidator.compileTools(self.getToolList())
+            if self.routeInput:
+                self.router.buildIndex(self.userSkills)
+            self.dispatcher.buildTable(self.agentSkills + getattr(self, 'dynamicAgentSkills', []))
+            logger.info(
+                f"Skills changed: added={[key[1] for key in changes['added']]}, "
+                f"removed={[key[1] for key in changes['removed']]}, changed={[key[1] for key in changes['changed']]}"
+            )
+        return changes
+
+    def watchComponents(self, paths, components):
+        """
+        Watch reloadable components instead of rescanning them on a timer.
+        Only the skill files that change are reloaded, a short while after their last write.
+        """
+        for pathGroup, component in zip(paths, components):
+            self.watcher.watch(pathGroup, component, self.onSkillsChanged)
+
+    def onSkillsChanged(self, changes):
+        """
+        Called by the watcher after it reloaded skills.
+        """
+        for path, change in changes.items():
+            logger.debug(f"Skill file {change}: {path}")
+        self.refreshSkills()
 
     def getMetaData(self):
         """Get metadata for all skills."""
@@ -179,37 +366,169 @@ class SkillGraph:
         """
         Get actions available for the self agent based on the given action string.
         If the action is not found, it will return an empty list.
+        Replies that cannot hold actions are rejected up front and parsed action strings are cached,
+        so repeated replies are not parsed again.
         """
-        return self.skillLink.getActions(action)
+        return self.actionParser.getActions(action)
 
     def executeAction(self, actions, action):
         """
         Execute a single action from the self agent's skills.
         If the action is not found, it will return an error message.
         You must do your own for loop to iterate through the actions.
-        """
-        return self.skillLink.executeAction(actions, action)
-
-    def executeActions(self, actions, action):
+        If CACHE_RESULTS is enabled, results are reused as the skill's _metaData "cache" policy allows.
+        """
+        return self.actionRunner(actions, action)
+
+    def executeLinkedAction(self, actions, action):
+        """
+        Execute a single action with SkillLink, waiting for the result when the skill is async def.
+        """
+        return self.resolveLinkedResult(action, self.skillLink.executeAction(actions, action))
+
+    async def executeLinkedActionAsync(self, actions, action):
+        """
+        Asyncio variant of executeLinkedAction. SkillLink runs on the worker pool, an async def skill's
+        coroutine is awaited on the running loop.
+        """
+        loop   = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self.executor.getPool(), self.skillLink.executeAction, actions, action)
+        if inspect.isawaitable(result):
+            result = await self.awaitLinkedResult(action, result)
+        return result
+
+    def resolveLinkedResult(self, action, result):
+        if not inspect.isawaitable(result):
+            return result
+        waiter = self.awaitLinkedResult(action, result)
+        try:
+            return self.executor.runCoroutine(waiter)
+        except Exception as ex:
+            if inspect.iscoroutine(result):
+                result.close()
+            logger.error(f"Error executing action '{action}'", exc_info=True)
+            return f"Error executing action '{action}', {ex}"
+
+    async def awaitLinkedResult(self, action, result):
+        # Finishes what SkillLink.executeAction started: same result formatting and error strings.
+        try:
+            result = await result
+        except Exception as ex:
+            logger.error(f"Error executing action '{action}'", exc_info=True)
+            return f"Error executing action '{action}', {ex}"
+        if isinstance(result, list):
+            return "\n".join(map(str, result))
+        if isinstance(result, dict):
+            return str(result)
+        return result
+
+    def getActionCall(self, actions, action):
+        """
+        Get (func, subAction, args, kwargs) for an action string, or None when it cannot be resolved.
+        """
+        if not hasattr(actions, 'get'):
+            return None
+        try:
+            name, args, kwargs = self.actionParser.parseCall(action)
+        except Exception:
+            return None
+        func = actions.get(name)
+        if func is None:
+            return None
+        subAction = args[0] if args and isinstance(args[0], str) else None
+        return func, subAction, args, kwargs
+
+    def executeCachedAction(self, actions, action):
+        """
+        Execute a single action through the result cache.
+        """
+        call = self.getActionCall(actions, action)
+        if call is None:
+            return self.executeLinkedAction(actions, action)
+        func, subAction, args, kwargs = call
+        return self.resultCache.call(func, lambda: self.executeLinkedAction(actions, action), subAction, args, kwargs)
+
+    async def executeCachedActionAsync(self, actions, action):
+        """
+        Asyncio variant of executeCachedAction.
+        """
+        call = self.getActionCall(actions, action)
+        if call is None:
+            return await self.executeLinkedActionAsync(actions, action)
+        func, subAction, args, kwargs = call
+        return await self.resultCache.callAsync(func, lambda: self.executeLinkedActionAsync(actions, action), subAction, args, kwargs)
+
+    def executeActions(self, actions, action, timeout=None):
         """
         Execute multiple actions from the self agent's skills.
         If the action is not found, it will return an error message.
 
         The for loop is done for you to iterate through the actions.
+        If PARALLEL_ACTIONS is enabled, independent actions run concurrently on a bounded thread pool,
+        results keep the order of the actions, and each action is limited to timeout seconds (ACTION_TIMEOUT by default).
+        If SCHEDULE_ACTIONS is enabled, actions that read or write the same declared resources run in order
+        and everything else runs concurrently.
+        If CACHE_RESULTS is enabled, results are reused as each skill's _metaData "cache" policy allows.
+        """
+        if self.scheduled:
+            return self.scheduler.executeActions(self.actionRunner, actions, action, timeout)
+        if self.parallel:
+            return self.executor.executeActions(self.actionRunner, actions, action, timeout)
+        if self.actionRunner != self.executeLinkedAction:
+            return [self.actionRunner(actions, a) for a in self.executor.normalizeActions(action)]
+        results = self.skillLink.executeActions(actions, action)
+        if any(inspect.isawaitable(result) for result in results):
+            results = [self.resolveLinkedResult(a, result) for a, result in zip(self.executor.normalizeActions(action), results)]
+        return results
+
+    async def executeActionsAsync(self, actions, action, timeout=None):
         """
-        return self.skillLink.executeActions(actions, action)
+        Execute multiple actions concurrently from an asyncio event loop.
+        async def skills are awaited on the loop, blocking skills run on the same bounded thread pool so they never stall it.
+        Results keep the order of the actions and each action is limited to timeout seconds (ACTION_TIMEOUT by default).
+        """
+        return await self.executor.executeActionsAsync(self.asyncRunner, actions, action, timeout)
 
-    def skillInstructions(self):
+    async def closeAsync(self):
+        """
+        Release what async skills and tools bound to the running event loop, like the weather client's httpx client.
+        Await it when an asyncio agent loop is done, before the loop shuts down.
+        """
+        await self.executor.closeLoop()
+
+    def getRelevantSkills(self, ctx: str = None, k: int = None):
+        """
+        Get the agent skills relevant to ctx, ranked with a BM25 index over skill names, descriptions and actions.
+        Returns every agent skill when SELECT_SKILLS is disabled, no ctx is given or nothing in ctx matches.
+        """
+        if not self.relevantOnly or not ctx:
+            return self.agentSkills
+        return self.selector.selectSkills(ctx, self.agentSkills, k, key=(self.skillsVersion, tuple(map(id, self.agentSkills))))
+
+    def skillInstructions(self, compact: bool = False, maxTokens: int = None, ctx: str = None):
         """
         Get action instructions for the self agent based on its capabilities.
         This method returns a string that describes how the self agent can perform actions.
+        The instructions are memoized and only the skills that changed since the last call are parsed again.
+        If maxTokens is set and the full instructions are estimated to be larger, the compact variant is returned.
+        If ctx is given and SELECT_SKILLS is enabled, only the skills relevant to ctx are included.
         """
         # # If you want to provide your own examples, you can uncomment the following line and provide your own examples.
         # return self.skillLink.skillInstructions(self.getAgentCapabilities(), self.skillExamples())
 
         # # This will automatically generate instructions based on the capabilities and your naming conventions.
         # return self.skillLink.skillInstructions(self.getAvaCapabilities())
-        return self.skillLink.skillInstructions(self.getAgentCapabilities())
+        skills = self.getRelevantSkills(ctx)
+        instructions = self.instructions.getInstructions(self.skillLink, skills, self.skillStates, compact)
+        if not compact and maxTokens is not None and self.instructions.estimateTokens(instructions) > maxTokens:
+            return self.instructions.getInstructions(self.skillLink, skills, self.skillStates, True)
+        return instructions
+
+    def instructionTokens(self, compact: bool = False) -> int:
+        """
+        Estimate how many tokens the skill instructions take up in a prompt.
+        """
+        return self.instructions.estimateTokens(self.skillInstructions(compact))
 
     def skillExamples(self):
         """
@@ -235,8 +554,71 @@ class SkillGraph:
         Execute a tool with the given name, tools, and arguments.
         If the tool is not found, it will return an error message.
         If the tool execution fails, it will retry based on the retry parameter.
-        """
-        return self.skillLink.executeTool(name, tools, args, threshold, retry)
+        A misspelled tool name is resolved to the closest registered tool scoring at least threshold.
+        If VALIDATE_TOOL_ARGS is enabled, arguments are coerced to the tool's parameter types first and invalid
+        ones are returned as a structured error instead of calling the tool.
+        If CACHE_RESULTS is enabled, results are reused as the tool module's _metaData "cache" policy allows.
+        """
+        if hasattr(tools, 'get') and name not in tools:
+            name = self.toolResolver.resolve(name, tools, threshold) or name
+        args, error = self.validateToolArgs(name, tools, args)
+        if error:
+            return error
+        execute = lambda: self.toolCalls.resolveResult(self.skillLink.executeTool(name, tools, args, threshold, retry))
+        if self.cacheResults and hasattr(tools, 'get') and name in tools:
+            cached  = execute
+            execute = lambda: self.resultCache.call(tools[name], cached, kwargs=args)
+        if self.tracer.enabled:
+            skill = self.tracer.getSkillName(tools.get(name)) if hasattr(tools, 'get') else "<unknown>"
+            return self.tracer.trace("tool", skill, name, (), args, execute)
+        return execute()
+
+    def validateToolArgs(self, name, tools, args):
+        """
+        Coerce args to the parameter types of the tool, returning (args, error).
+        Does nothing unless VALIDATE_TOOL_ARGS is enabled.
+        """
+        if not self.validateArgs or not hasattr(tools, 'get') or name not in tools:
+            return args, None
+        return self.toolValidator.validate(name, tools[name], args)
+
+    async def executeToolAsync(self, name, tools, args, threshold=80, retry=True):
+        """
+        Asyncio variant of executeTool.
+        async def tools, and tools with an async def asyncVariant, are awaited on the running loop.
+        Blocking tools run on the bounded ActionExecutor pool, so they never stall the loop.
+        """
+        if hasattr(tools, 'get') and name not in tools:
+            name = self.toolResolver.resolve(name, tools, threshold) or name
+        asyncTool = self.toolCalls.getAsyncTool(tools.get(name)) if hasattr(tools, 'get') else None
+        if asyncTool is None:
+            return await self.executor.callAsync(self.executeTool, name, tools, args, threshold, retry)
+        args, error = self.validateToolArgs(name, tools, args)
+        if error:
+            return error
+        execute = lambda: self.toolCalls.resolveResultAsync(self.skillLink.executeTool(name, {name: asyncTool}, args, threshold, retry))
+        if self.cacheResults:
+            cached  = execute
+            execute = lambda: self.resultCache.callAsync(tools[name], cached, kwargs=args)
+        if self.tracer.enabled:
+            return await self.tracer.traceAsync("tool", self.tracer.getSkillName(tools[name]), name, (), args, execute)
+        return await execute()
+
+    def executeToolCalls(self, toolCalls, tools=None, timeout=None):
+        """
+        Execute every tool call of a model response concurrently, each with its own timeout.
+        Takes OpenAI chat completions tool_calls, Responses API function_call items or Gemini function_call parts.
+        Returns the tool result messages in the same order as the calls, shaped for the provider that made them.
+        """
+        tools = self.getToolList() if tools is None else tools
+        return self.toolCalls.executeToolCalls(self.executeTool, tools, toolCalls, timeout)
+
+    async def executeToolCallsAsync(self, toolCalls, tools=None, timeout=None):
+        """
+        Asyncio variant of executeToolCalls, async tools run on the loop without holding a thread.
+        """
+        tools = self.getToolList() if tools is None else tools
+        return await self.toolCalls.executeToolCallsAsync(self.executeToolAsync, tools, toolCalls, timeout)
 
     def getTools(self):
         """
@@ -248,6 +630,22 @@ class SkillGraph:
         )
         return self.skillLink.getTools(tools, self.showTools, self.schemaType)
 
+    def getToolList(self):
+        """
+        Get the {name: function} dict of all tools, parsed once per skill/tool version.
+        """
+        return self.schemaCache.getToolList(self.agentTools, self.skillLink.getTools)
+
+    def buildSchema(self, func, schemaType):
+        """
+        Build the schema of a single tool, from the manifest when it is enabled.
+        """
+        if self.useManifest:
+            return self.getCachedSchema(func, schemaType)
+        if schemaType == 'typed':
+            return self.getTypedSchema(func)
+        return self.getJsonSchema(func, schemaType)
+
     def extractJson(self, text):
         """
         Extract the first JSON array or object from a string, even if wrapped in markdown or extra commentary.
@@ -277,9 +675,16 @@ class SkillGraph:
         This method retrieves the tools and converts them to a format compatible with OpenAI APIs.
         The schemaType can be either 'chat_completions' or 'responses'.
         Returns a dictionary representing the tools in JSON schema format.
+        Schemas come from the shared schema cache, so the returned list must be treated as read-only.
         """
-        toolList = self.getTools()
-        return self.holoLink.getJsonTools(toolList, schemaType)
+        toolList = self.getToolList()
+        return self.schemaCache.getSchemas(toolList, schemaType, self.buildSchema), toolList
+
+    def getJsonToolsBytes(self, schemaType="responses") -> bytes:
+        """
+        Get the JSON tool schemas pre-serialized as compact JSON bytes, ready to be placed in a request body.
+        """
+        return self.schemaCache.getSchemaBytes(self.getToolList(), schemaType, self.buildSchema)
 
     def getTypedTools(self):
         """
@@ -287,8 +692,32 @@ class SkillGraph:
         This method retrieves the tools and converts them to a format compatible with Google GenAI APIs.
         Returns a dictionary representing the tools in typed format.
         """
-        toolList = self.getTools()  # {name: function}
-        return self.holoLink.getTypedTools(toolList)
+        toolList = self.getToolList()  # {name: function}
+        tools = self.schemaCache.getSchemas(
+            toolList, 'typed', self.buildSchema,
+            wrap=lambda declarations: [types.Tool(function_declarations=declarations)]
+        )
+        return tools, toolList
+
+    def getCachedSchema(self, func, schemaType):
+        """
+        Get the schema for a tool from the manifest, building and storing it only if the tool's file changed.
+        The tool's module is imported only when its schema has to be built.
+        """
+        path = getattr(func, '__manifestPath__', None)
+        key  = f"schema:{schemaType}:{func.__name__}"
+        cached = self.manifest.getArtifact(path, key)
+        if cached is None:
+            realFunc = self.manifest.resolveTool(func)
+            if schemaType == 'typed':
+                cached = self.getTypedSchema(realFunc).model_dump(mode='json', exclude_none=True)
+            else:
+                cached = self.getJsonSchema(realFunc, schemaType)
+            self.manifest.setArtifact(path, key, cached)
+            self.manifest.saveManifest()
+        if schemaType == 'typed':
+            return types.FunctionDeclaration.model_validate(cached)
+        return cached
 
 
     # ----- Can be used with both skills and tools -----
@@ -388,20 +817,24 @@ class SkillGraph:
         """
         self.dynamicUserSkills = [] # If not using user setup, you can skip this.
         self.dynamicAgentSkills = []
+        paths = [
+            [self.getDir(self.baseSkillsDir, 'User', 'Created'), self.getDir(self.baseSkillsDir, 'User', 'Dynamic')], # If not using user setup, you can skip this.
+            [self.getDir(self.baseSkillsDir, 'Agent', 'Created'), self.getDir(self.baseSkillsDir, 'Agent', 'Dynamic')]
+        ]
+        components = [
+            self.dynamicUserSkills, # If not using user setup, you can skip this.
+            self.dynamicAgentSkills
+        ]
         self.skillLink.loadComponents(
-            paths=[
-                [self.getDir(self.baseSkillsDir, 'User', 'Created'), self.getDir(self.baseSkillsDir, 'User', 'Dynamic')], # If not using user setup, you can skip this.
-                [self.getDir(self.baseSkillsDir, 'Agent', 'Created'), self.getDir(self.baseSkillsDir, 'Agent', 'Dynamic')]
-            ],
-            components=[
-                self.dynamicUserSkills, # If not using user setup, you can skip this.
-                self.dynamicAgentSkills
-            ],
+            paths=paths,
+            components=components,
             reloadable=[
-                True, # If not using user setup, you can skip this.
-                True
+                not self.watchSkills, # If not using user setup, you can skip this.
+                not self.watchSkills # With WATCH_SKILLS the watcher reloads changed files instead of the reload timer.
             ]
         )
+        if self.watchSkills:
+            self.watchComponents(paths, components)
 
     def staticComponents(self):
         """
@@ -453,14 +886,17 @@ class SkillGraph:
         No advanced logic.
         """
         self.dynamicAgentSkills = []
+        dynamicPaths = [
+            self.getDir(self.baseSkillsDir, 'Agent', 'Created'), 
+            self.getDir(self.baseSkillsDir, 'Agent', 'Dynamic')
+        ]
         self.skillLink.loadComponents(
-            paths=[[
-                self.getDir(self.baseSkillsDir, 'Agent', 'Created'), 
-                self.getDir(self.baseSkillsDir, 'Agent', 'Dynamic')]
-            ],
+            paths=[dynamicPaths],
             components=[self.dynamicAgentSkills],
-            reloadable=[True]
+            reloadable=[not self.watchSkills]
         )
+        if self.watchSkills:
+            self.watchComponents([dynamicPaths], [self.dynamicAgentSkills])
 
         self.staticAgentSkills = []
         self.skillLink.loadComponents(
@@ -0,0 +1,130 @@
+
+import threading
+import logging
+from collections import OrderedDict
+from dotenv import load_dotenv
+
+from TechBook_Utils.SkillTracker import SkillTracker
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4  # Rough average for English prompt text, good enough for budgeting.
+MEMO_SIZE       = 32 # Finished instructions kept, one per skill subset and variant.
+
+
+class SkillInstructions:
+    """
+    Memoized skill instructions.
+    Every skill's capability text is rendered once and kept as a fragment keyed by the skill object and its
+    content hash, so after a reload only the skills that changed are parsed again and the full instructions
+    are rebuilt by concatenating fragments. The finished instructions are memoized for the current set of skills.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(SkillInstructions, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, 'initialized', False):
+            return
+        self._initComponents()
+        self.initialized = True
+
+    def _initComponents(self):
+        self.tracker   = SkillTracker()
+        self.buildLock = threading.Lock()
+        self.fragments = {}  # (id(skill), hash) -> [capability, ...]
+        self.memo      = OrderedDict()  # (skill keys, compact) -> instructions
+
+    # ----- Tokens -----
+    def estimateTokens(self, text: str) -> int:
+        """
+        Estimate how many tokens text takes up in a prompt.
+        """
+        return (len(text or "") + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+    # ----- Fragments -----
+    def compactFragment(self, fragment: str) -> str:
+        """
+        Squeeze a capability down to its signature and one line per action, e.g.
+            appSkill(action: str, *args):
+            - open-app: Required: appName (str)
+        Plain functions keep only their signature, which already lists their parameters.
+        """
+        if "Actions:" not in fragment:
+            return fragment.strip().splitlines()[0] if fragment.strip() else ""
+        lines = []
+        for line in fragment.splitlines():
+            stripped = line.strip()
+            if not stripped or stripped == "Actions:":
+                continue
+            if stripped.startswith(("Required:", "Optional:")) and lines:
+                lines[-1] += f" {stripped}"
+            else:
+                lines.append(line.rstrip())
+        return "\n".join(lines)
+
+    def skillKey(self, skill, states):
+        return (id(skill), (states or {}).get(self.tracker.stateKey(skill), {}).get("hash"))
+
+    def getFragments(self, skillLink, skills, keys):
+        """
+        Get the capability fragments for each skill, only parsing skills whose key is new.
+        """
+        capabilities = []
+        for skill, key in zip(skills, keys):
+            cached = self.fragments.get(key)
+            if cached is None:
+                try:
+                    cached = list(skillLink.parseCapabilities([skill], False))
+                except Exception:
+                    logger.error(f"Could not parse capabilities of {skill}", exc_info=True)
+                    cached = []
+                self.fragments[key] = cached
+            capabilities.extend(cached)
+        return capabilities
+
+    def pruneFragments(self, skills, states=None):
+        """
+        Drop the fragments of skills that are no longer loaded.
+        """
+        with self.buildLock:
+            keep = {self.skillKey(skill, states) for skill in skills or []}
+            self.fragments = {key: value for key, value in self.fragments.items() if key in keep}
+            self.memo.clear()
+
+    # ----- Instructions -----
+    def getInstructions(self, skillLink, skills, states=None, compact: bool = False):
+        """
+        Get the action instructions for skills, rebuilding them only when the skills changed.
+        compact renders one line per action and a single example of each kind.
+        """
+        skills = list(skills or [])
+        keys   = [self.skillKey(skill, states) for skill in skills]
+        key    = (tuple(keys), compact)
+        cached = self.memo.get(key)
+        if cached is not None:
+            return cached
+        with self.buildLock:
+            cached = self.memo.get(key)
+            if cached is not None:
+                self.memo.move_to_end(key)
+                return cached
+            capabilities = self.getFragments(skillLink, skills, keys)
+            joined = "\n\n".join(capabilities)
+            # Examples are generated from the full capabilities, the compact layout drops what they are parsed from.
+            examples = skillLink.generateExamples(joined, limit=1 if compact else None)
+            if compact:
+                joined = "\n".join(self.compactFragment(capability) for capability in capabilities)
+            instructions = skillLink.skillInstructions(joined, examples)
+            self.memo[key] = instructions
+            if len(self.memo) > MEMO_SIZE:
+                self.memo.popitem(last=False)
+            logger.debug(f"Rebuilt {'compact ' if compact else ''}skill instructions (~{self.estimateTokens(instructions)} tokens)")
+            return instructions
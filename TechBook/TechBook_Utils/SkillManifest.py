@@ -0,0 +1,495 @@
+
+import os
+import ast
+import sys
+import json
+import inspect
+import hashlib
+import threading
+import importlib.util
+import logging
+from pathlib import Path
+from dotenv import load_dotenv
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Set These Environment Variables in your .env file or system environment variables
+# SKILL_MANIFEST_PATH=/path/to/SkillManifest.json (optional, defaults to TechBook_Cache/SkillManifest.json)
+
+# Bump this whenever the shape of an entry changes so old manifests are thrown away instead of misread.
+MANIFEST_VERSION = 3
+
+# Annotations we can turn back into real types without importing the skill module.
+BUILTIN_TYPES = {
+    "str":   str,
+    "int":   int,
+    "float": float,
+    "bool":  bool,
+    "list":  list,
+    "dict":  dict,
+}
+
+# Attribute names the skill loader and parsers look up for list/dict signatures.
+SIG_ATTRS = {
+    "listSig": ("listSig", "list_sig", "LIST_SIG", "list_info"),
+    "dictSig": ("dictSig", "dict_sig", "DICT_SIG"),
+}
+
+PARAM_KINDS = {
+    "positional": inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    "varargs":    inspect.Parameter.VAR_POSITIONAL,
+    "kwonly":     inspect.Parameter.KEYWORD_ONLY,
+    "varkw":      inspect.Parameter.VAR_KEYWORD,
+}
+
+
+class SkillManifest:
+    """
+    Persistent on-disk manifest of skill and tool files.
+    Every file is keyed by its path, mtime and content hash, and holds the metadata extracted from its source
+    (_metaData, action maps, signatures and docstrings) plus any artifacts built from it such as tool schemas.
+    Nothing in here imports a skill module until something actually needs to call it.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(SkillManifest, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, 'initialized', False):
+            return
+        self._initComponents()
+        self.initialized = True
+
+    def _initComponents(self):
+        self.manifestPath = os.getenv('SKILL_MANIFEST_PATH', self.getDir('TechBook_Cache', 'SkillManifest.json'))
+        self.entryLock    = threading.RLock()
+        self.entries      = {}
+        self.dirty        = False
+        self.modules      = {}  # resolved path -> module imported from it
+        self.instances    = {}  # (resolved path, className) -> skill instance
+        self.loadManifest()
+
+    def getDir(self, *paths):
+        return str(Path(*paths).resolve())
+
+    # ----- Persistence -----
+    def loadManifest(self):
+        """
+        Load the manifest from disk.
+        A missing, unreadable or outdated manifest is treated as empty and rebuilt on the next scan.
+        """
+        try:
+            with open(self.manifestPath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == MANIFEST_VERSION:
+                self.entries = data.get('entries', {})
+        except FileNotFoundError:
+            self.entries = {}
+        except Exception:
+            logger.warning(f"Could not read skill manifest {self.manifestPath}, rebuilding it.", exc_info=True)
+            self.entries = {}
+
+    def saveManifest(self):
+        """
+        Write the manifest to disk if anything changed since the last save.
+        The file is written to a temp file first and swapped in, so a crash never leaves a half written manifest.
+        """
+        with self.entryLock:
+            if not self.dirty:
+                return
+            payload = json.dumps({'version': MANIFEST_VERSION, 'entries': self.entries})
+            self.dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.manifestPath), exist_ok=True)
+            tmpPath = f"{self.manifestPath}.tmp"
+            with open(tmpPath, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmpPath, self.manifestPath)
+        except Exception:
+            logger.error(f"Could not write skill manifest {self.manifestPath}", exc_info=True)
+
+    # ----- Entries -----
+    def hashFile(self, path):
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    def getEntry(self, path):
+        """
+        Get the manifest entry for a single file.
+        Unchanged files (same mtime and size) are served straight from the manifest, touched files are re-hashed,
+        and only files whose content actually changed are parsed again.
+        """
+        path = self.getDir(path)
+        stat = os.stat(path)
+        with self.entryLock:
+            entry = self.entries.get(path)
+            if entry and entry['mtime'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                return entry
+            digest = self.hashFile(path)
+            if entry and entry['hash'] == digest:
+                entry['mtime'], entry['size'] = stat.st_mtime_ns, stat.st_size
+                self.dirty = True
+                return entry
+            with open(path, 'r', encoding='utf-8-sig') as f:
+                source = f.read()
+            entry = {
+                'path':      path,
+                'mtime':     stat.st_mtime_ns,
+                'size':      stat.st_size,
+                'hash':      digest,
+                'module':    self.parseSource(source, path),
+                'artifacts': {},
+            }
+            self.entries[path] = entry
+            self.dirty = True
+            return entry
+
+    def scanDirectory(self, directory):
+        """
+        Get the manifest entries for every skill file in a directory, using the same file rules as the skill loader.
+        Entries for files that were removed from the directory are dropped.
+        """
+        src = Path(self.getDir(directory))
+        if not src.is_dir():
+            logger.error(f"Skills directory not found: {src}")
+            return []
+        entries = []
+        seen = set()
+        for py in sorted(src.iterdir()):
+            if not (py.is_file() and py.suffix == ".py" and py.name != "__init__.py"):
+                continue
+            try:
+                entry = self.getEntry(py)
+            except Exception:
+                logger.warning(f"Could not read skill file {py}", exc_info=True)
+                continue
+            seen.add(entry['path'])
+            entries.append(entry)
+        with self.entryLock:
+            for path in [p for p in self.entries if str(Path(p).parent) == str(src) and p not in seen]:
+                del self.entries[path]
+                self.dirty = True
+        return entries
+
+    def getArtifact(self, path, key, default=None):
+        """
+        Get an artifact built from a file (e.g. a generated tool schema).
+        Artifacts live on the entry, so they are discarded automatically when the file content changes.
+        """
+        entry = self.entries.get(self.getDir(path)) if path else None
+        if not entry:
+            return default
+        return entry['artifacts'].get(key, default)
+
+    def setArtifact(self, path, key, value):
+        """
+        Store an artifact built from a file. The value must be JSON serializable.
+        """
+        if not path:
+            return
+        with self.entryLock:
+            entry = self.entries.get(self.getDir(path))
+            if entry is None:
+                return
+            entry['artifacts'][key] = value
+            self.dirty = True
+
+    # ----- Modules -----
+    def moduleName(self, path, prefix="_dynamic"):
+        # The skill loader's _dynamic_{stem} plus a digest of the path, so same-stem files in the Agent and
+        # Tools directories (apps.py, get_date.py, ...) never share, or evict each other from, sys.modules.
+        digest = hashlib.sha1(self.getDir(path).encode('utf-8')).hexdigest()[:8]
+        return f"{prefix}_{Path(path).stem}_{digest}"
+
+    def loadModule(self, path):
+        """
+        Import a skill file on demand and return the module.
+        Modules are keyed by their resolved path, imported once and reused afterwards.
+        """
+        path = self.getDir(path)
+        with self.entryLock:
+            module = self.modules.get(path)
+            if module is not None:
+                return module
+            modName = self.moduleName(path)
+            spec = importlib.util.spec_from_file_location(modName, path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            sys.modules[modName] = module
+            self.modules[path] = module
+            return module
+
+    def getInstance(self, path, className):
+        """
+        Get the instance of a skill class, constructing it the first time, so stateful skills keep their state.
+        """
+        module = self.loadModule(path)
+        key    = (self.getDir(path), className)
+        with self.entryLock:
+            instance = self.instances.get(key)
+            if instance is None:
+                instance = getattr(module, className)()
+                self.instances[key] = instance
+            return instance
+
+    def buildSignature(self, fnInfo, keepSelf=False):
+        """
+        Build an inspect.Signature from the parameters stored in the manifest.
+        Annotations are kept as strings except for builtin types, which are turned back into real types.
+        Set keepSelf when the signature belongs to a function that will be bound as a method.
+        """
+        params = []
+        for p in fnInfo['params']:
+            if p['name'] == 'self' and not keepSelf:
+                continue
+            annotation = p['annotation']
+            annotation = BUILTIN_TYPES.get(annotation, annotation) if annotation else inspect.Parameter.empty
+            default = inspect.Parameter.empty
+            if p['default'] is not None:
+                try:
+                    default = ast.literal_eval(p['default'])
+                except Exception:
+                    default = p['default']
+            params.append(inspect.Parameter(p['name'], PARAM_KINDS[p['kind']], default=default, annotation=annotation))
+        return inspect.Signature(params)
+
+    def buildAnnotations(self, fnInfo):
+        # Only builtin annotations are exposed so typing.get_type_hints never has to resolve names from the skill module.
+        return {
+            p['name']: BUILTIN_TYPES[p['annotation']]
+            for p in fnInfo['params']
+            if p['annotation'] in BUILTIN_TYPES
+        }
+
+    def buildTool(self, entry, fnInfo, className=None, moduleName=None):
+        """
+        Build a stand-in for a tool function (or a tool method when className is given) from its manifest entry.
+        It carries the real name, docstring and signature, and imports the module only the first time it is called.
+        """
+        path = entry['path']
+        name = fnInfo['name']
+        manifest = self
+
+        def tool(*args, **kwargs):
+            return manifest.resolveCallable(path, name, className)(*args, **kwargs)
+
+        tool.__name__         = name
+        tool.__qualname__     = name
+        tool.__doc__          = fnInfo['doc']
+        tool.__module__       = moduleName or self.moduleName(path)
+        tool.__signature__    = self.buildSignature(fnInfo)
+        tool.__annotations__  = self.buildAnnotations(fnInfo)
+        tool.__manifestPath__ = path
+        tool.__manifestClass__ = className
+        return tool
+
+    def buildTools(self, directory):
+        """
+        Build lazy tool stand-ins for every public module level function in a directory.
+        """
+        tools = []
+        for entry in self.scanDirectory(directory):
+            for fnInfo in entry['module']['functions']:
+                tools.append(self.buildTool(entry, fnInfo))
+            for classInfo in entry['module']['classes']:
+                for name, fnInfo in classInfo['methods'].items():
+                    if not name.startswith("_"):
+                        tools.append(self.buildTool(entry, fnInfo, classInfo['name']))
+        self.saveManifest()
+        return tools
+
+    def resolveCallable(self, path, name, className=None):
+        """
+        Get the real function, or the bound method of the class's cached instance, from a skill file.
+        """
+        if className:
+            return getattr(self.getInstance(path, className), name)
+        return getattr(self.loadModule(path), name)
+
+    def resolveTool(self, tool):
+        """
+        Get the real function behind a lazy tool, importing its module if needed.
+        Anything that is not a lazy tool is returned as is.
+        """
+        path = getattr(tool, '__manifestPath__', None)
+        if not path:
+            return tool
+        return self.resolveCallable(path, tool.__name__, getattr(tool, '__manifestClass__', None))
+
+    # ----- Source Parsing -----
+    def parseSource(self, source, path=None):
+        """
+        Extract skill metadata from source code without importing it.
+        Returns the module level public functions, the module level action map keys and, for each class,
+        its _metaData, its action map and the signatures and docstrings of its methods.
+        """
+        try:
+            tree = ast.parse(source, filename=path or "<skill>")
+        except SyntaxError:
+            logger.warning(f"Could not parse skill file {path}", exc_info=True)
+            return {'functions': [], 'classes': [], 'actionMap': {}, 'sigs': {}}
+
+        functions, classes, actionMap, sigs = [], [], {}, {}
+        for node in tree.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and not node.name.startswith("_"):
+                functions.append(self._parseFunction(node))
+            elif isinstance(node, ast.ClassDef):
+                classes.append(self._parseClass(node))
+            elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+                found = self._parseActionMap(node, None)
+                if found is not None:
+                    actionMap = found
+                sigs.update(self._parseSigs(node, None))
+        return {'functions': functions, 'classes': classes, 'actionMap': actionMap, 'sigs': sigs}
+
+    def _parseClass(self, node):
+        methods, metaData, actionMap, sigs, dynamic = {}, None, {}, {}, False
+        for item in node.body:
+            if not isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            if item.name.startswith("__"):
+                continue
+            methods[item.name] = self._parseFunction(item)
+            if item.name in ('_metaData', '_metadata'):
+                metaData = self._parseMetaData(item, node.name)
+            for sub in ast.walk(item):
+                if isinstance(sub, (ast.Assign, ast.AnnAssign)):
+                    found = self._parseActionMap(sub, 'self')
+                    if found is not None:
+                        actionMap = found
+                        dynamic = dynamic or None in found.values() or self._hasUnpacking(sub.value)
+                    sigs.update(self._parseSigs(sub, 'self'))
+        return {
+            'name':        node.name,
+            'metaData':    metaData,
+            'actionMap':   actionMap,
+            'dynamicMap':  bool(dynamic),
+            'sigs':        sigs,
+            'methods':     methods,
+        }
+
+    def _parseFunction(self, node):
+        args = node.args
+        params = []
+        positional = args.posonlyargs + args.args
+        defaults = [None] * (len(positional) - len(args.defaults)) + list(args.defaults)
+        for arg, default in zip(positional, defaults):
+            params.append(self._parseParam(arg, 'positional', default))
+        if args.vararg:
+            params.append(self._parseParam(args.vararg, 'varargs', None))
+        for arg, default in zip(args.kwonlyargs, args.kw_defaults):
+            params.append(self._parseParam(arg, 'kwonly', default))
+        if args.kwarg:
+            params.append(self._parseParam(args.kwarg, 'varkw', None))
+        return {
+            'name':    node.name,
+            'params':  params,
+            'returns': ast.unparse(node.returns) if node.returns else None,
+            'doc':     ast.get_docstring(node),
+            'isAsync': isinstance(node, ast.AsyncFunctionDef),
+        }
+
+    def _parseParam(self, arg, kind, default):
+        return {
+            'name':       arg.arg,
+            'kind':       kind,
+            'annotation': ast.unparse(arg.annotation) if arg.annotation else None,
+            'default':    ast.unparse(default) if default is not None else None,
+        }
+
+    def _parseMetaData(self, node, className):
+        # Handles the usual `return {"className": f"{self.__class__.__name__}", "description": "..."}` shape.
+        for sub in ast.walk(node):
+            if isinstance(sub, ast.Return) and isinstance(sub.value, ast.Dict):
+                metaData = {}
+                for key, value in zip(sub.value.keys, sub.value.values):
+                    if isinstance(key, ast.Constant) and isinstance(key.value, str):
+                        resolved = self._staticValue(value, className)
+                        if resolved is not None:
+                            metaData[key.value] = resolved
+                return metaData
+        return None
+
+    def _staticValue(self, node, className):
+        if isinstance(node, ast.Constant):
+            return node.value
+        if isinstance(node, ast.JoinedStr):
+            parts = []
+            for value in node.values:
+                if isinstance(value, ast.Constant):
+                    parts.append(str(value.value))
+                elif isinstance(value, ast.FormattedValue) and self._isClassName(value.value):
+                    parts.append(className)
+                else:
+                    return None
+            return "".join(parts)
+        if self._isClassName(node):
+            return className
+        if isinstance(node, (ast.Dict, ast.List, ast.Tuple, ast.Set)):
+            # Nested declarations such as "resources" are plain literals.
+            try:
+                return ast.literal_eval(node)
+            except Exception:
+                return None
+        return None
+
+    def _isClassName(self, node):
+        # self.__class__.__name__
+        return (
+            isinstance(node, ast.Attribute) and node.attr == '__name__' and
+            isinstance(node.value, ast.Attribute) and node.value.attr == '__class__'
+        )
+
+    def _parseActionMap(self, node, owner):
+        targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+        if not isinstance(node.value, ast.Dict):
+            return None
+        for target in targets:
+            if owner and isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name) \
+                    and target.value.id == owner and target.attr in ('actionMap', 'ACTION_MAP', 'action_map'):
+                break
+            if not owner and isinstance(target, ast.Name) and target.id in ('actionMap', 'ACTION_MAP', 'action_map'):
+                break
+        else:
+            return None
+        actionMap = {}
+        for key, value in zip(node.value.keys, node.value.values):
+            if not (isinstance(key, ast.Constant) and isinstance(key.value, str)):
+                continue
+            if isinstance(value, ast.Attribute):
+                actionMap[key.value] = value.attr
+            elif isinstance(value, ast.Name):
+                actionMap[key.value] = value.id
+            else:
+                actionMap[key.value] = None
+        return actionMap
+
+    def _parseSigs(self, node, owner):
+        # listSig/dictSig are plain literals in practice, anything else is left for the real module to provide.
+        targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+        sigs = {}
+        for target in targets:
+            if owner and isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name) and target.value.id == owner:
+                name = target.attr
+            elif not owner and isinstance(target, ast.Name):
+                name = target.id
+            else:
+                continue
+            for key, attrs in SIG_ATTRS.items():
+                if name in attrs and node.value is not None:
+                    try:
+                        sigs[key] = ast.literal_eval(node.value)
+                    except Exception:
+                        pass
+        return sigs
+
+    def _hasUnpacking(self, node):
+        # `{**self.memory.actionMap}` style maps can only be resolved by importing the skill.
+        return isinstance(node, ast.Dict) and any(key is None for key in node.keys)
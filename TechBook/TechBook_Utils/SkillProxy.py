@@ -0,0 +1,173 @@
+
+import sys
+import types
+import threading
+import logging
+from dotenv import load_dotenv
+
+from TechBook_Utils.SkillManifest import SkillManifest, SIG_ATTRS
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+
+class SkillProxy:
+    """
+    Lightweight stand-in for a skill class, built from its manifest entry instead of importing it.
+    It exposes the same public methods, _metaData, actionMap and list/dict signatures as the real skill,
+    so capabilities and metadata can be rendered from it, and only imports and constructs the real
+    skill the first time one of its methods is actually called.
+    """
+    # Attributes the skill parsers probe for. Defined here so probing a proxy never imports the real skill.
+    ACTION_MAP = None
+    action_map = None
+    listSig    = None
+    list_sig   = None
+    LIST_SIG   = None
+    list_info  = None
+    dictSig    = None
+    dict_sig   = None
+    DICT_SIG   = None
+
+    _proxyPath  = None
+    _proxyClass = None
+    _proxyMeta  = None
+
+    def __init__(self, actionMap=None, sigs=None):
+        self._proxyLock   = threading.Lock()
+        self._proxyTarget = None
+        self.actionMap    = actionMap or {}
+        for key, attrs in SIG_ATTRS.items():
+            if sigs and key in sigs:
+                setattr(self, attrs[0], sigs[key])
+
+    def _metaData(self):
+        return dict(self._proxyMeta or {"className": self._proxyClass})
+
+    def _isLoaded(self):
+        return self._proxyTarget is not None
+
+    def _resolve(self):
+        """
+        Import the skill module and construct the real skill on first use.
+        """
+        if self._proxyTarget is None:
+            with self._proxyLock:
+                if self._proxyTarget is None:
+                    self._proxyTarget = SkillManifest().getInstance(self._proxyPath, self._proxyClass)
+                    logger.debug(f"Loaded skill {self._proxyClass} from {self._proxyPath}")
+        return self._proxyTarget
+
+    def __getattr__(self, name):
+        # Only reached for attributes the proxy does not define, i.e. real skill state.
+        if name.startswith("__") or name.startswith("_proxy"):
+            raise AttributeError(name)
+        return getattr(self._resolve(), name)
+
+    def __repr__(self):
+        state = "loaded" if self._isLoaded() else "lazy"
+        return f"<{self._proxyClass} proxy ({state})>"
+
+    # ----- Building -----
+    @staticmethod
+    def buildMethod(name, fnInfo, moduleName):
+        """
+        Build a proxy method that forwards to the real skill's method of the same name.
+        """
+        manifest = SkillManifest()
+
+        def method(self, *args, **kwargs):
+            return getattr(self._resolve(), name)(*args, **kwargs)
+
+        method.__name__      = name
+        method.__qualname__  = name
+        method.__doc__       = fnInfo['doc']
+        method.__module__    = moduleName
+        method.__signature__ = manifest.buildSignature(fnInfo, keepSelf=True)
+        return method
+
+    @staticmethod
+    def buildActionMap(proxy, classInfo):
+        """
+        Build the proxy's actionMap from the statically parsed action map.
+        Each entry carries the signature of its target method and forwards to the real bound method when called.
+        """
+        manifest = SkillManifest()
+        actionMap = {}
+        for action, methodName in classInfo['actionMap'].items():
+            fnInfo = classInfo['methods'].get(methodName)
+            if fnInfo is None:
+                continue
+
+            def mapped(*args, _methodName=methodName, **kwargs):
+                return getattr(proxy._resolve(), _methodName)(*args, **kwargs)
+
+            mapped.__name__      = methodName
+            mapped.__qualname__  = methodName
+            mapped.__doc__       = fnInfo['doc']
+            mapped.__signature__ = manifest.buildSignature(fnInfo)
+            actionMap[action] = mapped
+        return actionMap
+
+    @staticmethod
+    def buildProxy(entry, classInfo):
+        """
+        Build a proxy instance for one skill class in a manifest entry.
+        """
+        moduleName = SkillManifest().moduleName(entry['path'])
+        attrs = {
+            '__module__':  moduleName,
+            '__doc__':     f"Lazy proxy for {classInfo['name']}.",
+            '_proxyPath':  entry['path'],
+            '_proxyClass': classInfo['name'],
+            '_proxyMeta':  classInfo['metaData'],
+        }
+        for name, fnInfo in classInfo['methods'].items():
+            if not name.startswith("_"):
+                attrs[name] = SkillProxy.buildMethod(name, fnInfo, moduleName)
+        proxyClass = type(classInfo['name'], (SkillProxy,), attrs)
+        proxy = proxyClass(sigs=classInfo.get('sigs'))
+        proxy.actionMap = SkillProxy.buildActionMap(proxy, classInfo)
+        return proxy
+
+    @staticmethod
+    def buildModule(entry):
+        """
+        Build a stand-in module for a skill file that exposes module level functions.
+        The functions import the real module the first time they are called.
+        """
+        manifest   = SkillManifest()
+        moduleName = manifest.moduleName(entry['path'], "_lazy")
+        module     = types.ModuleType(moduleName, f"Lazy proxy for {entry['path']}.")
+        module._proxyPath = entry['path']
+        for fnInfo in entry['module']['functions']:
+            setattr(module, fnInfo['name'], manifest.buildTool(entry, fnInfo, moduleName=moduleName))
+        sigs = entry['module'].get('sigs', {})
+        for key, attrs in SIG_ATTRS.items():
+            if key in sigs:
+                setattr(module, attrs[0], sigs[key])
+        # The skill parsers match functions to their module through sys.modules.
+        sys.modules[moduleName] = module
+        return module
+
+    @staticmethod
+    def loadComponents(paths, components):
+        """
+        Lazy counterpart of SkillLink.loadComponents: fill each component list with proxies built from the manifest.
+        Classes whose action map can only be resolved at runtime (e.g. `{**self.memory.actionMap}`) are loaded eagerly.
+        """
+        manifest = SkillManifest()
+        for pathGroup, component in zip(paths, components):
+            for path in pathGroup or []:
+                for entry in manifest.scanDirectory(path):
+                    for classInfo in entry['module']['classes']:
+                        if classInfo['dynamicMap']:
+                            try:
+                                component.append(manifest.getInstance(entry['path'], classInfo['name']))
+                            except Exception:
+                                logger.error(f"Failed to instantiate {classInfo['name']} in {entry['path']}", exc_info=True)
+                            continue
+                        component.append(SkillProxy.buildProxy(entry, classInfo))
+                    if entry['module']['functions'] or entry['module']['actionMap']:
+                        component.append(SkillProxy.buildModule(entry))
+        manifest.saveManifest()
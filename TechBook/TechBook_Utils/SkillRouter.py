@@ -0,0 +1,163 @@
+import os
+import re
+import inspect
+import threading
+import logging
+from collections import namedtuple
+from dotenv import load_dotenv
+
+from TechBook_Utils.PhraseMatcher import PhraseMatcher
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Set These Environment Variables in your .env file or system environment variables
+# ROUTE_THRESHOLD=0.75 (optional, score from 0 to 1 a trigger phrase needs before user input is answered without the model)
+# ROUTE_MAX_ARGUMENT_WORDS=2 (optional, most words an action argument the skill does not recognise may have and still be routed)
+
+WORD_PATTERN = re.compile(r"[a-z0-9']+")
+FILLER_WORDS = frozenset("""
+    please hey hi hello ok okay can could would will you tell me just quickly now
+""".split())
+# Words that make an argument read like a sentence rather than a name, e.g. "open up about your feelings".
+PROSE_WORDS  = frozenset("""
+    a an the and or but to of in on at for with about up down out into over your my our their his her its
+    this that these those it them him i we they is are was be
+""".split())
+# Skill attributes holding the names an argument can resolve to, e.g. AppManager.nameMap.
+NAME_MAPS    = ("nameMap", "nameReplacements", "NAME_MAP")
+
+RouteMatch = namedtuple("RouteMatch", ["skill", "action", "phrase", "score", "args"])
+
+
+class SkillRouter:
+    """
+    Routes raw user input straight to a user skill when it is plainly one of the skill's trigger phrases.
+    Every actionMap key of every user skill is compiled into one PhraseMatcher, so routing is a single pass over the
+    input. The score is the share of the input's words the phrase accounts for, ignoring filler like "please" or
+    "can you". Actions that take the rest of the input as their argument ("open word") account for the words after
+    the phrase as well, but only when those words are a name the skill knows (its nameMap) or a short argument
+    that does not read like a sentence, so "close your eyes and imagine a beach" is left alone. Anything under the
+    threshold is left for the model. A routed action is called with the argument taken from the normalized words,
+    so "please open notepad" opens "notepad", not "please notepad".
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(SkillRouter, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, 'initialized', False):
+            return
+        self._initComponents()
+        self.initialized = True
+
+    def _initComponents(self):
+        self.threshold = float(os.getenv('ROUTE_THRESHOLD', 0.75))
+        self.maxWords  = int(os.getenv('ROUTE_MAX_ARGUMENT_WORDS', 2))
+        self.indexLock = threading.Lock()
+        self.matcher   = PhraseMatcher()
+
+    # ----- Index -----
+    def normalize(self, text: str) -> list:
+        """
+        Split text into lowercase words, leaving out filler words.
+        """
+        return [word for word in WORD_PATTERN.findall((text or "").lower()) if word not in FILLER_WORDS]
+
+    def takesArguments(self, action) -> bool:
+        """
+        Check whether an action needs an argument, i.e. it consumes the words that follow its trigger phrase.
+        Proxied skills only know their actions by name, so they are treated as taking none.
+        """
+        if not callable(action):
+            return False
+        try:
+            params = inspect.signature(action).parameters.values()
+        except (TypeError, ValueError):
+            return False
+        return any(
+            param.default is param.empty and param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD)
+            for param in params
+        )
+
+    def getNameMatcher(self, skill):
+        """
+        Build a matcher over the names the skill resolves its arguments with, None when it has no name map.
+        """
+        for attr in NAME_MAPS:
+            names = getattr(skill, attr, None)
+            if isinstance(names, dict):
+                keys = (self.normalize(name) for name in names)
+                return PhraseMatcher({f" {' '.join(words)} ": len(words) for words in keys if words})
+        return None
+
+    def buildIndex(self, skills):
+        """
+        Compile the trigger phrases of every user skill into one matcher.
+        When two skills share a phrase, the first skill keeps it, the same skill getUserActions would have tried first.
+        """
+        phrases = {}
+        for skill in skills or []:
+            actionMap = getattr(skill, "actionMap", None)
+            if not isinstance(actionMap, dict):
+                continue
+            for phrase, action in actionMap.items():
+                words = self.normalize(phrase)
+                if not words:
+                    continue
+                key = f" {' '.join(words)} "  # Padded so phrases only match whole words.
+                if key not in phrases:
+                    arguments = self.takesArguments(action)
+                    names     = self.getNameMatcher(skill) if arguments else None
+                    phrases[key] = (skill, phrase, len(words), arguments, names)
+        with self.indexLock:
+            self.matcher = PhraseMatcher(phrases)
+        logger.debug(f"Indexed {len(phrases)} user skill trigger phrases")
+
+    # ----- Routing -----
+    def score(self, words: list, match) -> float:
+        """
+        Score a match from 0 to 1 by how much of the input it accounts for.
+        """
+        _, _, length, arguments, names = match.value
+        if not arguments:
+            return length / len(words)
+        remaining = words[length:]
+        if not remaining:
+            return 0.0  # "open" on its own, the model should ask what to open.
+        if match.start != 0:
+            return length / len(words)
+        return 1.0 if self.isArgument(remaining, names) else length / len(words)
+
+    def isArgument(self, remaining: list, names) -> bool:
+        """
+        Check whether the words after an action phrase are an argument for it rather than the rest of a sentence.
+        """
+        found = names.find(f" {' '.join(remaining)} ") if names else None
+        if found and len(remaining) <= found.value + 1:
+            return True  # A known name, e.g. "vs code", with at most one word around it.
+        return len(remaining) <= self.maxWords and not PROSE_WORDS.intersection(remaining)
+
+    def route(self, content: str, threshold: float = None):
+        """
+        Get the RouteMatch(skill, action, phrase, score, args) for content, or None to defer to the model.
+        args is what the action is called with, ("notepad",) for "please open notepad" and () for actions without arguments.
+        """
+        words = self.normalize(content)
+        if not words:
+            return None
+        match = self.matcher.find(f" {' '.join(words)} ")
+        if not match:
+            return None
+        score = self.score(words, match)
+        if score < (self.threshold if threshold is None else threshold):
+            return None
+        skill, phrase, length, arguments, _ = match.value
+        args = (" ".join(words[length:]),) if arguments else ()
+        return RouteMatch(skill, skill.actionMap.get(phrase), phrase, score, args)
@@ -0,0 +1,157 @@
+
+import os
+import re
+import math
+import inspect
+import threading
+import logging
+from collections import Counter
+from dotenv import load_dotenv
+
+from TechBook_Utils.SkillTracker import SkillTracker
+from TechBook_Utils.SkillProxy import SkillProxy
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Set These Environment Variables in your .env file or system environment variables
+# SKILL_TOP_K=8 (optional, number of skills sent to the model per turn when SELECT_SKILLS is enabled)
+
+WORD_PATTERN  = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+STOP_WORDS    = frozenset("""
+    a an and are as at be but by can could do does for from get have how i if in into is it its me my of on or
+    please set should so than that the their them then there these this to up use was what when where which who
+    will with would you your skill skills action actions allows
+""".split())
+BM25_K1       = 1.5
+BM25_B        = 0.75
+
+
+class SkillSelector:
+    """
+    Picks the skills relevant to what the user said, so only those are described to the model.
+    Each skill becomes a small document made of its className, metadata description, public method names,
+    action names and parameter names, indexed in a BM25 inverted index when the skills are loaded.
+    Selection is a few dict lookups per query word, with no network or GPU involved.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(SkillSelector, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, 'initialized', False):
+            return
+        self._initComponents()
+        self.initialized = True
+
+    def _initComponents(self):
+        self.topK      = int(os.getenv('SKILL_TOP_K', 8))
+        self.tracker   = SkillTracker()
+        self.indexLock = threading.Lock()
+        self.indexKey  = None
+        self.postings  = {}  # term -> {docIndex: termFrequency}
+        self.lengths   = []
+        self.avgLength = 0.0
+
+    # ----- Tokenizing -----
+    def tokenize(self, text: str) -> list:
+        """
+        Split text into lowercase terms, breaking camelCase, snake_case and kebab-case names apart.
+        """
+        terms = []
+        for word in WORD_PATTERN.findall(text or ""):
+            word = word.lower()
+            if word in STOP_WORDS or len(word) < 2:
+                continue
+            # Light stemming so "apps"/"app" and "opened"/"open" meet.
+            for suffix in ("ing", "ed", "es", "s"):
+                if len(word) > len(suffix) + 2 and word.endswith(suffix):
+                    word = word[:-len(suffix)]
+                    break
+            terms.append(word)
+        return terms
+
+    def describe(self, skill) -> str:
+        """
+        Build the searchable text of a skill from its metadata, method names, action names and parameters.
+        """
+        meta  = self.tracker.getMeta(skill)
+        parts = [str(meta.get("className", "")), str(meta.get("description", ""))]
+        if inspect.isfunction(skill):
+            members = [(skill.__name__, skill)]
+        else:
+            members = [
+                (name, member) for name, member in inspect.getmembers(type(skill) if not inspect.ismodule(skill) else skill)
+                if not name.startswith("_") and callable(member) and not hasattr(SkillProxy, name)
+            ]
+        for name, member in members:
+            parts.append(name)
+            try:
+                parts.extend(inspect.signature(member).parameters)
+            except (TypeError, ValueError):
+                pass
+        actionMap = getattr(skill, "actionMap", None) or getattr(skill, "ACTION_MAP", None)
+        if isinstance(actionMap, dict):
+            parts.extend(actionMap)
+        return " ".join(parts)
+
+    # ----- Index -----
+    def buildIndex(self, skills, key=None):
+        """
+        Build the inverted index for a list of skills. key identifies the skill set so unchanged sets are not re-indexed.
+        """
+        postings, lengths = {}, []
+        for index, skill in enumerate(skills):
+            try:
+                terms = self.tokenize(self.describe(skill))
+            except Exception:
+                logger.warning(f"Could not index {skill}", exc_info=True)
+                terms = []
+            lengths.append(len(terms))
+            for term, frequency in Counter(terms).items():
+                postings.setdefault(term, {})[index] = frequency
+        with self.indexLock:
+            self.postings  = postings
+            self.lengths   = lengths
+            self.avgLength = (sum(lengths) / len(lengths)) if lengths else 0.0
+            self.indexKey  = key
+
+    def score(self, ctx: str) -> dict:
+        """
+        Score every indexed skill against ctx with BM25. Skills sharing no terms with ctx are left out.
+        """
+        postings, lengths, avgLength = self.postings, self.lengths, self.avgLength or 1.0
+        total, scores = len(lengths), {}
+        for term in set(self.tokenize(ctx)):
+            docs = postings.get(term)
+            if not docs:
+                continue
+            idf = math.log(1 + (total - len(docs) + 0.5) / (len(docs) + 0.5))
+            for index, frequency in docs.items():
+                norm = frequency * (BM25_K1 + 1) / (frequency + BM25_K1 * (1 - BM25_B + BM25_B * lengths[index] / avgLength))
+                scores[index] = scores.get(index, 0.0) + idf * norm
+        return scores
+
+    def selectSkills(self, ctx: str, skills, k: int = None, key=None) -> list:
+        """
+        Get the top k skills for ctx, in their original order.
+        When nothing in ctx matches any skill, all skills are returned so the model still sees everything.
+        """
+        skills = list(skills or [])
+        k = self.topK if k is None else k
+        if not ctx or len(skills) <= k:
+            return skills
+        key = key if key is not None else tuple(id(skill) for skill in skills)
+        if key != self.indexKey:
+            self.buildIndex(skills, key)
+        scores = self.score(ctx)
+        if not scores:
+            return skills
+        best = sorted(scores, key=lambda index: -scores[index])[:k]
+        return [skills[index] for index in sorted(best)]
@@ -0,0 +1,138 @@
+
+import os
+import sys
+import json
+import hashlib
+import inspect
+import threading
+import logging
+from dotenv import load_dotenv
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+
+class SkillTracker:
+    """
+    Tracks what each loaded skill looks like so reloads can report exactly what changed.
+    A skill's state is keyed by (source file, className) and holds a content hash built from that file and its
+    metadata, so diffing two snapshots is a single pass of dict lookups instead of comparing metadata lists.
+    The source file is part of the key because agent skills and tools share class names, e.g. both get_date.py
+    files report _dynamic_get_date, and one must not shadow the other.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(SkillTracker, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, 'initialized', False):
+            return
+        self._initComponents()
+        self.initialized = True
+
+    def _initComponents(self):
+        self.hashLock   = threading.Lock()
+        self.fileHashes = {}  # path -> (mtime_ns, size, digest)
+
+    # ----- Hashing -----
+    def fileHash(self, path):
+        """
+        Hash a source file, re-reading it only when its mtime or size changed.
+        """
+        if not path:
+            return ""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return ""
+        with self.hashLock:
+            cached = self.fileHashes.get(path)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                return cached[2]
+        with open(path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        with self.hashLock:
+            self.fileHashes[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def sourceFile(self, component):
+        # Proxies know their file without importing it, modules carry it, functions and classes through their code.
+        # sys.modules is only the last resort: the loader names every file _dynamic_{stem}, so same-stem files
+        # in different directories share one entry there.
+        path = getattr(component, "_proxyPath", None)
+        if path:
+            return path
+        if inspect.ismodule(component):
+            return getattr(component, "__file__", None)
+        func = inspect.unwrap(component) if inspect.isfunction(component) or inspect.ismethod(component) else None
+        code = getattr(getattr(func, "__func__", func), "__code__", None)
+        if code is None:
+            cls = component if inspect.isclass(component) else type(component)
+            for value in vars(cls).values():
+                value = getattr(value, "__func__", value)  # staticmethod and classmethod
+                if inspect.isfunction(value):
+                    code = value.__code__
+                    break
+        if code is not None and os.path.exists(code.co_filename):
+            return code.co_filename
+        moduleName = getattr(component, "__module__", None) or type(component).__module__
+        return getattr(sys.modules.get(moduleName), "__file__", None)
+
+    def getMeta(self, component):
+        metaMethod = getattr(component, "_metaData", None) or getattr(component, "_metadata", None)
+        if callable(metaMethod):
+            try:
+                return metaMethod() or {}
+            except Exception:
+                logger.warning(f"Could not read metadata from {component}", exc_info=True)
+        return {"className": getattr(component, "__name__", type(component).__name__)}
+
+    # ----- Snapshots -----
+    def stateKey(self, component, meta=None):
+        """
+        Get the (source file, className) a component's state is kept under.
+        """
+        meta = self.getMeta(component) if meta is None else meta
+        path = self.sourceFile(component)
+        return (os.path.abspath(path) if path else "", meta.get("className", "Unknown"))
+
+    def getStates(self, components):
+        """
+        Snapshot a list of components as {(path, className): {"hash": ..., "meta": ...}}.
+        """
+        states = {}
+        for component in components or []:
+            meta = self.getMeta(component)
+            key  = self.stateKey(component, meta)
+            content = json.dumps(meta, sort_keys=True, default=str) + self.fileHash(key[0])
+            states[key] = {
+                "hash": hashlib.sha256(content.encode('utf-8')).hexdigest(),
+                "meta": meta,
+            }
+        return states
+
+    def diff(self, before, after):
+        """
+        Compare two snapshots and return {"added": {...}, "removed": {...}, "changed": {...}}, each keyed by (path, className).
+        """
+        before, after = before or {}, after or {}
+        changes = {"added": {}, "removed": {}, "changed": {}}
+        for key, state in after.items():
+            old = before.get(key)
+            if old is None:
+                changes["added"][key] = state["meta"]
+            elif old["hash"] != state["hash"]:
+                changes["changed"][key] = state["meta"]
+        for key, state in before.items():
+            if key not in after:
+                changes["removed"][key] = state["meta"]
+        return changes
+
+    def hasChanges(self, changes):
+        return any(changes.get(key) for key in ("added", "removed", "changed"))
@@ -0,0 +1,304 @@
+
+import os
+import sys
+import time
+import errno
+import hashlib
+import select
+import struct
+import ctypes
+import ctypes.util
+import inspect
+import threading
+import importlib.util
+import logging
+from pathlib import Path
+from dotenv import load_dotenv
+
+from TechBook_Utils.SkillTracker import SkillTracker
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Set These Environment Variables in your .env file or system environment variables
+# SKILL_WATCH_DEBOUNCE=0.25 (optional, seconds a skill file must be quiet before it is reloaded)
+# SKILL_WATCH_INTERVAL=1.0 (optional, seconds between directory scans when inotify is not available)
+
+# inotify event flags, see <sys/inotify.h>
+IN_MODIFY      = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM  = 0x00000040
+IN_MOVED_TO    = 0x00000080
+IN_CREATE      = 0x00000100
+IN_DELETE      = 0x00000200
+IN_WATCH_MASK  = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+IN_NONBLOCK    = os.O_NONBLOCK
+IN_CLOEXEC     = 0o2000000
+EVENT_HEADER   = struct.Struct("iIII")
+
+
+class Inotify:
+    """
+    Minimal ctypes binding to the Linux inotify API. Raises OSError when inotify is not available.
+    """
+    def __init__(self):
+        libcName = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or not libcName:
+            raise OSError(errno.ENOSYS, "inotify is only available on Linux")
+        self.libc = ctypes.CDLL(libcName, use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watches = {}
+
+    def addWatch(self, directory):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), IN_WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self.watches[wd] = directory
+
+    def readEvents(self, timeout):
+        """
+        Wait up to timeout seconds and return the full paths of the files that changed.
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        paths, offset = [], 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0").decode(errors="replace")
+            offset += length
+            if wd in self.watches and name:
+                paths.append(os.path.join(self.watches[wd], name))
+        return paths
+
+    def close(self):
+        fd, self.fd = self.fd, -1
+        if fd >= 0:
+            os.close(fd)
+
+
+class SkillWatcher:
+    """
+    Watches skill directories and reloads only the skill files that change.
+    Uses inotify where available and falls back to cheap stat scans elsewhere, debounces bursts of writes,
+    and swaps the reloaded skills into their component list in a single step so in-flight actions keep
+    running against the skills they already resolved.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(SkillWatcher, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, 'initialized', False):
+            return
+        self._initComponents()
+        self.initialized = True
+
+    def _initComponents(self):
+        self.debounce    = float(os.getenv('SKILL_WATCH_DEBOUNCE', 0.25))
+        self.interval    = float(os.getenv('SKILL_WATCH_INTERVAL', 1.0))
+        self.watchLock   = threading.Lock()
+        self.directories = {}  # directory -> (component, onChange)
+        self.snapshots   = {}  # directory -> {path: (mtime_ns, size)}
+        self.pending     = {}  # path -> time of the last event
+        self.inotify     = None
+        self.thread      = None
+        self.stopEvent   = threading.Event()
+        self.tracker     = SkillTracker()
+
+    # ----- Registration -----
+    def watch(self, paths, component, onChange=None):
+        """
+        Watch directories whose skills live in component.
+        onChange(changes) is called after every reload with a dict of {path: "added" | "changed" | "removed"}.
+        """
+        failed = None
+        with self.watchLock:
+            for path in paths or []:
+                directory = str(Path(path).resolve())
+                os.makedirs(directory, exist_ok=True)
+                self.directories[directory] = (component, onChange)
+                self.snapshots[directory] = self.scan(directory)
+                if self.inotify is None and self.thread is None:
+                    self._startInotify()
+                if self.inotify is not None:
+                    try:
+                        self.inotify.addWatch(directory)
+                    except OSError:
+                        logger.warning(f"Could not watch {directory} with inotify, polling instead", exc_info=True)
+                        failed, self.inotify = self.inotify, None
+        if failed is not None:
+            # The watcher thread may be blocked reading it, so stop that thread before closing the descriptor.
+            self.stop()
+            failed.close()
+        self.start()
+
+    def _startInotify(self):
+        try:
+            self.inotify = Inotify()
+        except Exception as e:
+            logger.info(f"inotify not available ({e}), polling skill directories every {self.interval}s")
+            self.inotify = None
+
+    def start(self):
+        if self.thread is not None and self.thread.is_alive():
+            return
+        self.stopEvent.clear()
+        self.thread = threading.Thread(target=self._run, name="SkillWatcher", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopEvent.set()
+        if self.thread is not None:
+            self.thread.join(timeout=2)
+            self.thread = None
+        if self.inotify is not None:
+            self.inotify.close()
+            self.inotify = None
+
+    # ----- Detection -----
+    def isSkillFile(self, path):
+        return path.endswith(".py") and os.path.basename(path) != "__init__.py"
+
+    def scan(self, directory):
+        snapshot = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file() and self.isSkillFile(entry.path):
+                        stat = entry.stat()
+                        snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            pass
+        return snapshot
+
+    def poll(self):
+        """
+        Compare each directory with its last snapshot and return the paths that differ.
+        """
+        changed = []
+        for directory in list(self.directories):
+            old, new = self.snapshots.get(directory, {}), self.scan(directory)
+            changed.extend(path for path in old.keys() | new.keys() if old.get(path) != new.get(path))
+            self.snapshots[directory] = new
+        return changed
+
+    def _run(self):
+        while not self.stopEvent.is_set():
+            wait    = self.debounce if self.pending else self.interval
+            inotify = self.inotify
+            if inotify is not None:
+                try:
+                    events = inotify.readEvents(wait)
+                except (OSError, ValueError):
+                    logger.warning("inotify stopped working, polling skill directories instead", exc_info=True)
+                    if self.inotify is inotify:
+                        self.inotify = None
+                    events = self.poll()
+            else:
+                self.stopEvent.wait(wait)
+                events = self.poll()
+            now = time.monotonic()
+            for path in events:
+                if self.isSkillFile(path):
+                    self.pending[path] = now
+            ready = [path for path, seen in self.pending.items() if now - seen >= self.debounce]
+            if ready:
+                for path in ready:
+                    self.pending.pop(path, None)
+                try:
+                    self.reloadPaths(ready)
+                except Exception:
+                    logger.error(f"Error reloading {ready}", exc_info=True)
+
+    # ----- Reloading -----
+    def moduleName(self, path):
+        # The SkillLink loader's _dynamic_{stem} plus a digest of the path, so reloading one of two same-stem files
+        # (Agent and Tools apps.py) never replaces the other's entry in sys.modules.
+        digest = hashlib.sha1(str(Path(path).resolve()).encode('utf-8')).hexdigest()[:8]
+        return f"_dynamic_{Path(path).stem}_{digest}"
+
+    def belongsTo(self, item, path):
+        # Matched by source file, the module name is shared by same-stem files loaded by SkillLink.
+        source = self.tracker.sourceFile(item)
+        return bool(source) and str(Path(source).resolve()) == path
+
+    def loadFile(self, path):
+        """
+        Import one skill file and return its components, following the SkillLink loader rules.
+        """
+        modName = self.moduleName(path)
+        spec = importlib.util.spec_from_file_location(modName, path)
+        mod  = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+        sys.modules[modName] = mod
+
+        items = []
+        for _, cls in inspect.getmembers(mod, inspect.isclass):
+            if cls.__module__ == modName:
+                try:
+                    items.append(cls())
+                except Exception:
+                    logger.error(f"Failed to instantiate {cls.__name__} in {Path(path).name}", exc_info=True)
+        actionMap = getattr(mod, "actionMap", None) or getattr(mod, "ACTION_MAP", None)
+        publicFuncs = [
+            fn for name, fn in inspect.getmembers(mod, inspect.isfunction)
+            if fn.__module__ == modName and not name.startswith("_")
+        ]
+        if isinstance(actionMap, dict) or publicFuncs:
+            items.append(mod)
+        return items
+
+    def reloadPaths(self, paths):
+        """
+        Reload the given skill files and swap them into their component lists.
+        """
+        groups = {}
+        for path in paths:
+            path      = str(Path(path).resolve())
+            directory = os.path.dirname(path)
+            if directory in self.directories:
+                groups.setdefault(directory, []).append(path)
+
+        for directory, changedPaths in groups.items():
+            component, onChange = self.directories[directory]
+            changes = {}
+            updated = list(component)
+            for path in changedPaths:
+                existed = any(self.belongsTo(item, path) for item in updated)
+                updated = [item for item in updated if not self.belongsTo(item, path)]
+                if not os.path.exists(path):
+                    sys.modules.pop(self.moduleName(path), None)
+                    if existed:
+                        changes[path] = "removed"
+                    continue
+                try:
+                    updated.extend(self.loadFile(path))
+                    changes[path] = "changed" if existed else "added"
+                except Exception:
+                    # Keep serving the previous version until the file loads again.
+                    logger.warning(f"Could not reload skill from {path}", exc_info=True)
+                    updated.extend(item for item in component if self.belongsTo(item, path))
+            # Slice assignment swaps the whole list in one step for readers iterating over it.
+            component[:] = updated
+            self.snapshots[directory] = self.scan(directory)
+            if changes:
+                logger.info(f"Reloaded skills: {changes}")
+                if onChange:
+                    try:
+                        onChange(changes)
+                    except Exception:
+                        logger.error("Error in skill reload callback", exc_info=True)
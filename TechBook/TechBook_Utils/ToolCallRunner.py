@@ -0,0 +1,179 @@
+
+import json
+import inspect
+import threading
+import logging
+from dotenv import load_dotenv
+from google.genai import types
+
+from TechBook_Utils.ActionExecutor import ActionExecutor
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+
+class ToolCallRunner:
+    """
+    Executes every tool call of a model response at once.
+    Accepts OpenAI chat completions tool_calls, Responses API function_call items and Gemini function_call parts,
+    runs them concurrently on the ActionExecutor pool with a timeout per call, and returns tool result messages
+    in the same order and in the shape the provider expects back.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(ToolCallRunner, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, 'initialized', False):
+            return
+        self._initComponents()
+        self.initialized = True
+
+    def _initComponents(self):
+        self.executor = ActionExecutor()
+
+    # ----- Parsing -----
+    def field(self, obj, name, default=None):
+        # Provider SDKs hand out objects, raw HTTP responses hand out dicts.
+        if isinstance(obj, dict):
+            return obj.get(name, default)
+        return getattr(obj, name, default)
+
+    def parseArgs(self, args):
+        if args is None or args == "":
+            return {}
+        if isinstance(args, str):
+            try:
+                return json.loads(args)
+            except json.JSONDecodeError:
+                logger.warning(f"Could not parse tool call arguments: {args}")
+                return {}
+        return dict(args)
+
+    def normalizeCall(self, call):
+        """
+        Turn one provider tool call into {"provider", "id", "name", "args"}, or None if it is not a tool call.
+        """
+        function = self.field(call, "function")
+        if function is not None:
+            return {
+                "provider": "chat_completions",
+                "id":       self.field(call, "id"),
+                "name":     self.field(function, "name"),
+                "args":     self.parseArgs(self.field(function, "arguments")),
+            }
+        if self.field(call, "type") == "function_call" or self.field(call, "call_id") is not None:
+            return {
+                "provider": "responses",
+                "id":       self.field(call, "call_id"),
+                "name":     self.field(call, "name"),
+                "args":     self.parseArgs(self.field(call, "arguments")),
+            }
+        functionCall = self.field(call, "function_call")
+        if functionCall is None and self.field(call, "args") is not None:
+            functionCall = call
+        if functionCall is not None:
+            return {
+                "provider": "typed",
+                "id":       self.field(functionCall, "id"),
+                "name":     self.field(functionCall, "name"),
+                "args":     self.parseArgs(self.field(functionCall, "args")),
+            }
+        return None
+
+    def normalizeCalls(self, toolCalls):
+        """
+        Normalize a list of tool calls, skipping anything that is not one (e.g. text parts or reasoning items).
+        """
+        if toolCalls is None:
+            return []
+        if not isinstance(toolCalls, (list, tuple)):
+            toolCalls = [toolCalls]
+        return [call for call in map(self.normalizeCall, toolCalls) if call is not None]
+
+    # ----- Results -----
+    def formatOutput(self, result) -> str:
+        if isinstance(result, str):
+            return result
+        try:
+            return json.dumps(result, default=str)
+        except (TypeError, ValueError):
+            return str(result)
+
+    def formatResult(self, call, report):
+        """
+        Shape one report as the tool result message the call's provider expects.
+        """
+        result = report["result"] if report["error"] is None else f"Error: {report['error']}"
+        if call["provider"] == "chat_completions":
+            return {"role": "tool", "tool_call_id": call["id"], "content": self.formatOutput(result)}
+        if call["provider"] == "responses":
+            return {"type": "function_call_output", "call_id": call["id"], "output": self.formatOutput(result)}
+        if report["error"] is not None:
+            response = {"error": result}
+        else:
+            response = result if isinstance(result, dict) else {"result": result}
+        return types.Part(function_response=types.FunctionResponse(id=call["id"], name=call["name"], response=response))
+
+    # ----- Async -----
+    def getAsyncTool(self, func):
+        """
+        Get the coroutine function to await for a tool: the tool itself when it is async def,
+        or the async def it names as its asyncVariant, or None when it only runs blocking.
+        """
+        if inspect.iscoroutinefunction(func):
+            return func
+        variant = getattr(func, "asyncVariant", None)
+        return variant if inspect.iscoroutinefunction(variant) else None
+
+    def resolveResult(self, result):
+        """
+        Wait for a tool result that is still an awaitable. Auto-corrected calls come back wrapped as {"result": ...}.
+        """
+        if inspect.isawaitable(result):
+            return self.executor.runCoroutine(result)
+        if isinstance(result, dict) and inspect.isawaitable(result.get("result")):
+            return dict(result, result=self.executor.runCoroutine(result["result"]))
+        return result
+
+    async def resolveResultAsync(self, result):
+        """
+        Asyncio variant of resolveResult.
+        """
+        if inspect.isawaitable(result):
+            return await result
+        if isinstance(result, dict) and inspect.isawaitable(result.get("result")):
+            return dict(result, result=await result["result"])
+        return result
+
+    # ----- Execution -----
+    def executeToolCalls(self, executeTool, tools, toolCalls, timeout=None):
+        """
+        Execute all tool calls concurrently with executeTool(name, tools, args).
+        Returns one provider-shaped result per tool call, in the order the calls were given.
+        """
+        calls = self.normalizeCalls(toolCalls)
+        reports = self.executor.runAll(
+            lambda call: executeTool(call["name"], tools, call["args"]),
+            calls,
+            timeout
+        )
+        return [self.formatResult(call, report) for call, report in zip(calls, reports)]
+
+    async def executeToolCallsAsync(self, executeToolAsync, tools, toolCalls, timeout=None):
+        """
+        Asyncio variant of executeToolCalls, awaiting executeToolAsync(name, tools, args) for every call on the running loop.
+        """
+        calls = self.normalizeCalls(toolCalls)
+
+        async def runCall(call):
+            return await executeToolAsync(call["name"], tools, call["args"])
+
+        reports = await self.executor.runAllAsync(runCall, calls, timeout)
+        return [self.formatResult(call, report) for call, report in zip(calls, reports)]
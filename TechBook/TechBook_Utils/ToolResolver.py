@@ -0,0 +1,133 @@
+
+import os
+import re
+import threading
+import logging
+from collections import OrderedDict, Counter
+from dotenv import load_dotenv
+
+try:
+    from rapidfuzz import fuzz  # Optional, scores candidates by edit distance instead of shared n-grams.
+except ImportError:
+    fuzz = None
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Set These Environment Variables in your .env file or system environment variables
+# TOOL_ALIAS_CACHE=256 (optional, number of resolved misspelled tool names kept in memory)
+
+NORMALIZE_PATTERN = re.compile(r"[^a-z0-9]")
+NGRAM_SIZE        = 3
+MAX_CANDIDATES    = 8
+
+
+class ToolResolver:
+    """
+    Resolves a possibly misspelled tool name to a registered tool.
+    Lookups go through an exact map, then a normalized-name map (case, snake_case and camelCase folded),
+    then an n-gram index that narrows the tools down to a few candidates before any similarity scoring.
+    Candidates are scored with rapidfuzz when it is installed and by their shared n-grams otherwise.
+    Resolved names are kept in a bounded alias cache, so repeated misspellings cost a single dict lookup.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(ToolResolver, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, 'initialized', False):
+            return
+        self._initComponents()
+        self.initialized = True
+
+    def _initComponents(self):
+        self.aliasSize  = int(os.getenv('TOOL_ALIAS_CACHE', 256))
+        self.indexLock  = threading.Lock()
+        self.indexKey   = None
+        self.normalized = {}  # normalized name -> tool name
+        self.ngrams     = {}  # n-gram -> set of normalized names
+        self.aliases    = OrderedDict()  # (requested name, threshold) -> tool name or None
+
+    # ----- Index -----
+    def normalize(self, name: str) -> str:
+        return NORMALIZE_PATTERN.sub("", str(name).lower())
+
+    def getNgrams(self, normalized: str) -> set:
+        padded = f" {normalized} "
+        return {padded[i:i + NGRAM_SIZE] for i in range(max(1, len(padded) - NGRAM_SIZE + 1))}
+
+    def buildIndex(self, tools):
+        """
+        Index the tool names of a {name: function} dict.
+        """
+        normalized, ngrams = {}, {}
+        for name in tools:
+            key = self.normalize(name)
+            normalized.setdefault(key, name)
+            for gram in self.getNgrams(key):
+                ngrams.setdefault(gram, set()).add(key)
+        with self.indexLock:
+            self.normalized = normalized
+            self.ngrams     = ngrams
+            self.aliases.clear()
+            self.indexKey   = tuple(tools)
+
+    def ensureIndex(self, tools):
+        if self.indexKey != tuple(tools):
+            self.buildIndex(tools)
+
+    # ----- Resolution -----
+    def getCandidates(self, normalized: str) -> list:
+        """
+        Get the normalized tool names sharing the most n-grams with normalized.
+        """
+        counts = Counter()
+        for gram in self.getNgrams(normalized):
+            counts.update(self.ngrams.get(gram, ()))
+        return [candidate for candidate, _ in counts.most_common(MAX_CANDIDATES)]
+
+    def similarity(self, normalized: str, candidate: str) -> float:
+        """
+        Score two normalized names from 0 to 100.
+        """
+        if fuzz is not None:
+            return fuzz.ratio(normalized, candidate)
+        grams, candidateGrams = self.getNgrams(normalized), self.getNgrams(candidate)
+        return 200 * len(grams & candidateGrams) / (len(grams) + len(candidateGrams))
+
+    def resolve(self, name: str, tools, threshold: int = 80):
+        """
+        Get the registered tool name for name, or None when nothing is similar enough.
+        """
+        if name in tools:
+            return name
+        self.ensureIndex(tools)
+        key = (name, threshold)
+        with self.indexLock:
+            if key in self.aliases:
+                self.aliases.move_to_end(key)
+                return self.aliases[key]
+
+        normalized = self.normalize(name)
+        resolved = self.normalized.get(normalized)
+        if resolved is None and normalized:
+            best, bestScore = None, threshold
+            for candidate in self.getCandidates(normalized):
+                score = self.similarity(normalized, candidate)
+                if score >= bestScore:
+                    best, bestScore = candidate, score
+            resolved = self.normalized.get(best) if best else None
+
+        with self.indexLock:
+            self.aliases[key] = resolved
+            if len(self.aliases) > self.aliasSize:
+                self.aliases.popitem(last=False)
+        if resolved:
+            logger.debug(f"Resolved tool name '{name}' to '{resolved}'")
+        return resolved
@@ -13,17 +13,16 @@ from TechBook_Utils.SkillGraph import SkillGraph
 load_dotenv()
 
 class BaseSchemaManager:
+    schemaType = "chat_completions"
+
     def __init__(self):
         self.showLoadedTools = os.getenv('SHOW_LOADED_TOOLS', 'False') == 'True'
         self.graph = SkillGraph()
-        self._toolFunctions = None
-        self._toolSchemas = None
         #self.printToolsSchema() # No l8nger Needed as its handled by the SkillGraph
 
     def loadTools(self):
-        if self._toolFunctions is None:
-            self._toolFunctions = self.graph.getTools()
-        return self._toolFunctions
+        # Parsed once per skill/tool version and shared with every other manager through the SkillGraph.
+        return self.graph.getToolList()
 
     def callFunction(self, *args, **kwargs):
         return self.graph.executeTool(*args, **kwargs)
@@ -31,17 +30,17 @@ class BaseSchemaManager:
     def extractJson(self, *args, **kwargs):
         return self.graph.extractJson(*args, **kwargs)
 
-    def buildToolSchema(self, func):
+    def buildToolSchema(self, func, schemaType=None):
         raise NotImplementedError("Subclasses must implement buildToolSchema.")
 
     def getToolFunctions(self):
         return self.loadTools()
 
     def getToolSchemas(self):
-        if self._toolSchemas is None:
-            toolFunctions = self.getToolFunctions()
-            self._toolSchemas = [self.buildToolSchema(f) for f in toolFunctions.values()]
-        return self._toolSchemas
+        return self.graph.schemaCache.getSchemas(self.getToolFunctions(), self.schemaType, self.buildToolSchema)
+
+    def getToolSchemaBytes(self):
+        return self.graph.schemaCache.getSchemaBytes(self.getToolFunctions(), self.schemaType, self.buildToolSchema)
 
     
 
@@ -70,21 +69,19 @@ class JsonSchemaManager(BaseSchemaManager):
 
 
 class TypedSchemaManager(BaseSchemaManager):
+    schemaType = "typed"
 
-    def buildToolSchema(self, func):
+    def buildToolSchema(self, func, schemaType="typed"):
         return self.graph.getTypedSchema(func)
 
     def buildTools(self):
-        toolFunctions = self.loadTools()
-        functionDeclarations = [self.buildToolSchema(f) for f in toolFunctions.values()]
-        tools = [types.Tool(function_declarations=functionDeclarations)]
-        self._toolSchemas = tools
-        return tools
+        return self.graph.schemaCache.getSchemas(
+            self.loadTools(), self.schemaType, self.buildToolSchema,
+            wrap=lambda functionDeclarations: [types.Tool(function_declarations=functionDeclarations)]
+        )
 
     def getToolSchemas(self):
-        if self._toolSchemas is None:
-            return self.buildTools()
-        return self._toolSchemas
+        return self.buildTools()
 
     def handleFormat(self, role: str, content: str):
         return self.graph.handleTypedFormat(role, content)
@@ -0,0 +1,262 @@
+
+import json
+import enum
+import types
+import typing
+import inspect
+import threading
+import logging
+from dotenv import load_dotenv
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+TYPE_NAMES  = {"str": str, "int": int, "float": float, "bool": bool, "list": list, "dict": dict, "tuple": tuple, "set": set}
+TRUE_WORDS  = frozenset(("true", "yes", "y", "1", "on"))
+FALSE_WORDS = frozenset(("false", "no", "n", "0", "off", "none", ""))
+UNION_TYPES = (typing.Union, getattr(types, "UnionType", typing.Union))  # Optional[x] and x | None
+ANY         = object()  # Marks parameters whose type cannot be checked, they are passed through untouched.
+
+
+class ArgumentError(ValueError):
+    pass
+
+
+class ToolValidator:
+    """
+    Checks and coerces the JSON arguments a model sends to a tool before the tool is called.
+    Every tool gets a small spec compiled once from its signature and type hints: the coercer of each parameter
+    and which parameters are required. Arguments like "47.6" for a float are fixed on the spot, and anything that
+    cannot be fixed comes back as a structured error the model can act on, instead of an exception from inside the tool.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(ToolValidator, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, 'initialized', False):
+            return
+        self._initComponents()
+        self.initialized = True
+
+    def _initComponents(self):
+        self.specLock = threading.Lock()
+        self.specs    = {}  # id(func) -> (func, spec), the func is kept so its id cannot be reused
+
+    # ----- Types -----
+    def typeName(self, hint) -> str:
+        if hint is ANY:
+            return "any"
+        if isinstance(hint, type):
+            return hint.__name__
+        return str(hint).replace("typing.", "")
+
+    def resolveHints(self, func, signature) -> dict:
+        try:
+            return typing.get_type_hints(func)
+        except Exception:
+            # String annotations that cannot be resolved, e.g. from manifest stand-ins, fall back to builtin names.
+            return {
+                name: TYPE_NAMES.get(param.annotation, ANY) if isinstance(param.annotation, str) else param.annotation
+                for name, param in signature.parameters.items()
+                if param.annotation is not inspect.Parameter.empty
+            }
+
+    # ----- Coercers -----
+    def coerceBool(self, value):
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, (int, float)) and value in (0, 1):
+            return bool(value)
+        if isinstance(value, str) and value.strip().lower() in TRUE_WORDS | FALSE_WORDS:
+            return value.strip().lower() in TRUE_WORDS
+        raise ArgumentError("expected true or false")
+
+    def coerceInt(self, value):
+        if isinstance(value, bool):
+            raise ArgumentError("expected an integer, got a boolean")
+        if isinstance(value, int):
+            return value
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        if isinstance(value, str):
+            try:
+                number = float(value.strip())
+            except ValueError:
+                raise ArgumentError("expected an integer")
+            if number.is_integer():
+                return int(number)
+        raise ArgumentError("expected an integer")
+
+    def coerceFloat(self, value):
+        if isinstance(value, bool):
+            raise ArgumentError("expected a number, got a boolean")
+        if isinstance(value, (int, float)):
+            return float(value)
+        if isinstance(value, str):
+            try:
+                return float(value.strip())
+            except ValueError:
+                pass
+        raise ArgumentError("expected a number")
+
+    def coerceStr(self, value):
+        if isinstance(value, str):
+            return value
+        if isinstance(value, (int, float, bool)):
+            return str(value)
+        raise ArgumentError("expected a string")
+
+    def coerceJson(self, kind):
+        def coerce(value):
+            if isinstance(value, str):
+                try:
+                    value = json.loads(value)
+                except ValueError:
+                    if kind is dict:
+                        raise ArgumentError("expected an object")
+                    value = [part.strip() for part in value.split(",") if part.strip()]
+            if kind is dict:
+                if isinstance(value, dict):
+                    return value
+                raise ArgumentError("expected an object")
+            if isinstance(value, (list, tuple, set)):
+                return kind(value)
+            raise ArgumentError(f"expected a {kind.__name__}")
+        return coerce
+
+    def compileHint(self, hint):
+        """
+        Build the coercer for one type hint. Unknown or unchecked types pass the value through.
+        """
+        if hint is ANY or hint is typing.Any or hint is inspect.Parameter.empty:
+            return None
+        origin, args = typing.get_origin(hint), typing.get_args(hint)
+        if origin in UNION_TYPES:
+            coercers  = [self.compileHint(arg) for arg in args if arg is not type(None)]
+            allowNone = type(None) in args
+            if any(coercer is None for coercer in coercers):
+                return None
+            def coerce(value):
+                if value is None and allowNone:
+                    return None
+                for coercer in coercers:
+                    try:
+                        return coercer(value)
+                    except ArgumentError:
+                        continue
+                raise ArgumentError(f"expected {self.typeName(hint)}")
+            return coerce
+        if origin is typing.Literal:
+            def coerce(value):
+                if value in args:
+                    return value
+                for choice in args:
+                    if str(choice).lower() == str(value).lower():
+                        return choice
+                raise ArgumentError(f"expected one of {list(args)}")
+            return coerce
+        if isinstance(hint, type) and issubclass(hint, enum.Enum):
+            def coerce(value):
+                try:
+                    return hint(value)
+                except ValueError:
+                    try:
+                        return hint[str(value)]
+                    except KeyError:
+                        raise ArgumentError(f"expected one of {[member.value for member in hint]}")
+            return coerce
+        kind = origin or hint
+        if kind is bool:
+            return self.coerceBool
+        if kind is int:
+            return self.coerceInt
+        if kind is float:
+            return self.coerceFloat
+        if kind is str:
+            return self.coerceStr
+        if kind in (list, tuple, set, dict):
+            return self.coerceJson(kind)
+        return None
+
+    # ----- Specs -----
+    def compile(self, func) -> dict:
+        """
+        Compile the argument spec of a tool from its signature and type hints.
+        """
+        signature = inspect.signature(func)
+        hints     = self.resolveHints(func, signature)
+        params, required = {}, []
+        for name, param in signature.parameters.items():
+            if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD) or name == "self":
+                continue
+            hint = hints.get(name, ANY)
+            params[name] = (self.compileHint(hint), self.typeName(hint))
+            if param.default is param.empty:
+                required.append(name)
+        return {"params": params, "required": required}
+
+    def getSpec(self, func) -> dict:
+        entry = self.specs.get(id(func))
+        if entry is None or entry[0] is not func:
+            try:
+                spec = self.compile(func)
+            except (TypeError, ValueError):
+                spec = None
+            with self.specLock:
+                self.specs[id(func)] = entry = (func, spec)
+        return entry[1]
+
+    def compileTools(self, tools):
+        """
+        Compile the specs of every tool in a {name: function} dict, dropping specs of tools no longer loaded.
+        """
+        specs = {}
+        for func in (tools or {}).values():
+            try:
+                specs[id(func)] = (func, self.compile(func))
+            except (TypeError, ValueError):
+                specs[id(func)] = (func, None)
+        with self.specLock:
+            self.specs = specs
+
+    # ----- Validation -----
+    def validate(self, name, func, args):
+        """
+        Coerce args for func. Returns (args, None) when they are valid, or (args, error) where error is a
+        {"error", "tool", "details", "info"} dict describing every problem at once.
+        Arguments with unknown names are left alone so misspelled names can still be matched up by executeTool.
+        """
+        spec = self.getSpec(func)
+        if spec is None or not isinstance(args, dict):
+            return args, None
+        params, coerced, details = spec["params"], {}, []
+        for key, value in args.items():
+            if key not in params:
+                coerced[key] = value
+                continue
+            coercer, expected = params[key]
+            try:
+                coerced[key] = coercer(value) if coercer else value
+            except ArgumentError as e:
+                details.append({"argument": key, "expected": expected, "received": value, "message": str(e)})
+        unknown = [key for key in args if key not in params]
+        if not unknown:
+            for key in spec["required"]:
+                if key not in args:
+                    details.append({"argument": key, "expected": params[key][1], "received": None, "message": "missing required argument"})
+        if not details:
+            return coerced, None
+        logger.debug(f"Rejected arguments for '{name}': {details}")
+        return coerced, {
+            "error":   f"Invalid arguments for '{name}'",
+            "tool":    name,
+            "details": details,
+            "info":    "Fix the listed arguments and call the tool again.",
+        }
@@ -0,0 +1,218 @@
+
+import os
+import time
+import asyncio
+import weakref
+import threading
+import logging
+import concurrent.futures
+import requests
+from requests.adapters import HTTPAdapter
+from dotenv import load_dotenv
+
+from TechBook_Utils.ActionExecutor import ActionExecutor
+
+try:
+    import httpx  # Optional, enables non-blocking requests in getForecastAsync.
+except ImportError:
+    httpx = None
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Set These Environment Variables in your .env file or system environment variables
+# WEATHER_URL=https://api.open-meteo.com/v1/forecast (optional, forecast endpoint, point it at a local server for testing)
+# WEATHER_TTL=300 (optional, seconds a forecast is reused for the same location)
+# WEATHER_TIMEOUT=10 (optional, seconds to wait for the forecast endpoint)
+# WEATHER_PRECISION=2 (optional, decimals latitude and longitude are rounded to, 2 is about 1 km)
+
+HOURLY_FIELDS = ("relative_humidity_2m",)
+
+
+class WeatherClient:
+    """
+    Shared Open-Meteo data layer for the weather tools.
+    One forecast request fetches current_weather and hourly data together over a pooled session, keyed by rounded
+    coordinates and time bucket. Concurrent identical requests wait on the same fetch, and payloads are kept for
+    WEATHER_TTL seconds, so asking for temperature, humidity and wind speed at once costs a single HTTP call.
+    getForecastAsync serves asyncio agent loops from the same cache, over httpx when it is installed.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(WeatherClient, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, 'initialized', False):
+            return
+        self._initComponents()
+        self.initialized = True
+
+    def _initComponents(self):
+        self.url       = os.getenv('WEATHER_URL', 'https://api.open-meteo.com/v1/forecast')
+        self.ttl       = float(os.getenv('WEATHER_TTL', 300))
+        self.timeout   = float(os.getenv('WEATHER_TIMEOUT', 10))
+        self.precision = int(os.getenv('WEATHER_PRECISION', 2))
+        self.session   = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        self.session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        self.cacheLock = threading.Lock()
+        self.cache     = {}  # key -> (expires, payload)
+        self.inflight  = {}  # key -> Future of the fetch in progress
+        self.executor  = ActionExecutor()
+        self.clients   = weakref.WeakKeyDictionary()  # event loop -> httpx.AsyncClient
+        self.tasks     = weakref.WeakKeyDictionary()  # event loop -> {key: Task of the fetch in progress}
+        self.executor.onLoopClose(self.closeAsync)
+
+    # ----- Cache -----
+    def getKey(self, latitude, longitude):
+        bucket = int(time.time() // self.ttl) if self.ttl > 0 else time.time()
+        return (round(float(latitude), self.precision), round(float(longitude), self.precision), bucket)
+
+    def pruneCache(self, now):
+        for key in [key for key, (expires, _) in self.cache.items() if expires <= now]:
+            del self.cache[key]
+
+    def clearCache(self):
+        with self.cacheLock:
+            self.cache.clear()
+
+    # ----- Fetching -----
+    def fetch(self, latitude, longitude) -> dict:
+        """
+        Request the forecast for one location. Errors are returned as {"error": True, "reason": ...} like Open-Meteo does.
+        """
+        try:
+            response = self.session.get(self.url, params=self.getParams(latitude, longitude), timeout=self.timeout)
+            data = response.json()
+        except (requests.RequestException, ValueError) as e:
+            logger.error(f"Could not fetch weather for {latitude}, {longitude}: {e}")
+            return {"error": True, "reason": str(e)}
+        return self.checkResponse(response.ok, response.status_code, data)
+
+    def getParams(self, latitude, longitude) -> dict:
+        return {
+            "latitude":        latitude,
+            "longitude":       longitude,
+            "current_weather": "true",
+            "hourly":          ",".join(HOURLY_FIELDS),
+        }
+
+    def checkResponse(self, ok, statusCode, data) -> dict:
+        if not ok and "error" not in data:
+            data = {"error": True, "reason": f"HTTP {statusCode}", "response": data}
+        return data
+
+    def storeForecast(self, key, data):
+        if "error" not in data:
+            now = time.monotonic()
+            self.pruneCache(now)
+            self.cache[key] = (now + self.ttl, data)
+
+    def getCached(self, key):
+        cached = self.cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        return None
+
+    def getForecast(self, latitude, longitude) -> dict:
+        """
+        Get the forecast payload for a location, from the cache, from a fetch already in flight, or from a new request.
+        Failed requests are not cached. The payload is shared and must be treated as read-only.
+        """
+        key = self.getKey(latitude, longitude)
+        with self.cacheLock:
+            cached = self.getCached(key)
+            if cached is not None:
+                return cached
+            future = self.inflight.get(key)
+            owner  = future is None
+            if owner:
+                future = concurrent.futures.Future()
+                self.inflight[key] = future
+        if not owner:
+            return future.result()
+
+        data = None
+        try:
+            try:
+                data = self.fetch(key[0], key[1])
+            except Exception as e:
+                data = {"error": True, "reason": str(e)}
+            with self.cacheLock:
+                self.storeForecast(key, data)
+        finally:
+            # Always release the callers waiting on this fetch, even when it was interrupted.
+            with self.cacheLock:
+                self.inflight.pop(key, None)
+            future.set_result(data if data is not None else {"error": True, "reason": "Weather request was interrupted"})
+        return data
+
+    # ----- Async -----
+    def getClient(self, loop):
+        client = self.clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(timeout=self.timeout, limits=httpx.Limits(max_connections=16))
+            self.clients[loop] = client
+        return client
+
+    async def closeAsync(self):
+        """
+        Close the httpx client of the running event loop. Loops started by ActionExecutor.runCoroutine do this on
+        their own, an agent running its own loop awaits SkillGraph.closeAsync before the loop shuts down.
+        """
+        client = self.clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    async def fetchAsync(self, latitude, longitude) -> dict:
+        """
+        Asyncio variant of fetch using httpx. Without httpx installed the blocking fetch runs on the ActionExecutor pool.
+        """
+        if httpx is None:
+            return await self.executor.callAsync(self.fetch, latitude, longitude)
+        try:
+            client = self.getClient(asyncio.get_running_loop())
+            response = await client.get(self.url, params=self.getParams(latitude, longitude))
+            data = response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            logger.error(f"Could not fetch weather for {latitude}, {longitude}: {e}")
+            return {"error": True, "reason": str(e)}
+        return self.checkResponse(response.is_success, response.status_code, data)
+
+    async def getForecastAsync(self, latitude, longitude) -> dict:
+        """
+        Asyncio variant of getForecast. Shares the cache with getForecast, and concurrent identical requests
+        on the same event loop await a single fetch.
+        """
+        key = self.getKey(latitude, longitude)
+        cached = self.getCached(key)
+        if cached is not None:
+            return cached
+        tasks = self.tasks.setdefault(asyncio.get_running_loop(), {})
+        task = tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self.fetchAsync(key[0], key[1]))
+            tasks[key] = task
+            task.add_done_callback(lambda _: tasks.pop(key, None))
+        data = await asyncio.shield(task)
+        with self.cacheLock:
+            self.storeForecast(key, data)
+        return data
+
+    # ----- Values -----
+    def currentHourly(self, data, field):
+        """
+        Get the value of an hourly field for the current hour of a forecast payload.
+        Raises KeyError or IndexError when the payload does not contain it.
+        """
+        hourly  = data["hourly"]
+        values  = hourly[field]
+        current = str(data.get("current_weather", {}).get("time", ""))[:13] + ":00"  # e.g. 2024-06-01T13:15 -> 2024-06-01T13:00
+        times   = hourly.get("time") or []
+        return values[times.index(current) if current in times else 0]
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The TechBook modules import each other as top level packages, e.g. TechBook_Utils.SkillRouter.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
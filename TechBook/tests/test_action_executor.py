@@ -0,0 +1,52 @@
+import time
+import asyncio
+
+import pytest
+
+from TechBook_Utils.ActionExecutor import ActionExecutor
+
+
+@pytest.fixture
+def executor():
+    return ActionExecutor()
+
+
+def slow(item):
+    time.sleep(item)
+    return item
+
+
+def test_single_action_gets_the_timeout(executor):
+    [report] = executor.runAll(slow, [0.5], timeout=0.05)
+    assert report["result"] is None
+    assert report["error"] == "Timed out after 0.05s"
+
+
+def test_results_keep_their_order(executor):
+    reports = executor.runAll(slow, [0.05, 0.0, 0.02], timeout=5)
+    assert [report["result"] for report in reports] == [0.05, 0.0, 0.02]
+
+
+def test_single_action_without_timeout_runs_inline(executor):
+    [report] = executor.runAll(lambda item: item * 2, [21], timeout=0)
+    assert report == {"item": 21, "result": 42, "error": None, "duration": report["duration"]}
+
+
+async def answer():
+    await asyncio.sleep(0)
+    return 42
+
+
+def test_run_coroutine_from_blocking_code(executor):
+    assert executor.runCoroutine(answer()) == 42
+
+
+def test_run_coroutine_refuses_to_block_a_running_loop(executor):
+    async def main():
+        with pytest.raises(RuntimeError, match="running event loop"):
+            executor.runCoroutine(answer())
+        # The same blocking call is fine from a worker thread of that loop.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor.getPool(), executor.runCoroutine, answer())
+
+    assert asyncio.run(main()) == 42
@@ -0,0 +1,32 @@
+import pytest
+
+from TechBook_Utils.ActionParser import ActionParser
+
+
+@pytest.fixture
+def parser():
+    return ActionParser()
+
+
+@pytest.mark.parametrize("reply", [None, "", "   \n", "None", " null ", "[]", "()", "Sure, I can help with that.", "[unclosed"])
+def test_replies_without_actions_are_rejected(parser, reply):
+    assert not parser.hasActions(reply)
+    assert parser.getActions(reply) == []
+
+
+@pytest.mark.parametrize("reply", ["getTime()", "  ['getTime()']\n", "appSkill('open-app', 'notepad')", "_private"])
+def test_replies_with_actions_pass_the_precheck(parser, reply):
+    assert parser.hasActions(reply)
+
+
+def test_get_actions_splits_like_skill_link(parser):
+    reply = "['weatherSkill(\"get-weather\", \"47.6588\", \"-117.4260\")', 'getTime()']"
+    assert parser.getActions(reply) == ['weatherSkill("get-weather", "47.6588", "-117.4260")', "getTime()"]
+    assert parser.getActions("noteSkill('add', 'a, b'), getTime()") == ["noteSkill('add', 'a, b')", "getTime()"]
+
+
+def test_parse_call_hands_out_copies_of_mutable_arguments(parser):
+    name, args, kwargs = parser.parseCall("listSkill('add', items=['a'])")
+    assert (name, args, kwargs) == ("listSkill", ["add"], {"items": ["a"]})
+    kwargs["items"].append("b")
+    assert parser.parseCall("listSkill('add', items=['a'])")[2] == {"items": ["a"]}
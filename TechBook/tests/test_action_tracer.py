@@ -0,0 +1,51 @@
+import pytest
+
+from TechBook_Utils.ActionTracer import ActionTracer
+
+
+@pytest.fixture
+def tracer():
+    tracer  = ActionTracer()
+    enabled = tracer.enabled
+    tracer.enabled = True
+    tracer.clear()
+    yield tracer
+    tracer.enabled = enabled
+    tracer.clear()
+
+
+def describeUserCall(skills, content):
+    return "SkillLink", "getComponents", (content,), {}
+
+
+def getComponents(skills, content):
+    for skill in skills:
+        result = skill(content)
+        if result is not None:
+            return result
+    return None
+
+
+def test_wrapped_call_returns_what_the_call_returns(tracer):
+    skills = [lambda content: None, lambda content: f"handled {content}"]
+    traced = tracer.wrap(getComponents, "user", describeUserCall)
+    assert traced(skills, "open notepad") == getComponents(skills, "open notepad")
+    assert traced([], "open notepad") is None
+    events = tracer.getEvents()
+    assert [(event["kind"], event["skill"], event["action"]) for event in events] == [("user", "SkillLink", "getComponents")] * 2
+    assert events[0]["resultSize"] == len("handled open notepad")
+
+
+def test_wrapped_call_raises_what_the_call_raises(tracer):
+    def failing(content):
+        raise ValueError("broken skill")
+
+    traced = tracer.wrap(getComponents, "user", describeUserCall)
+    with pytest.raises(ValueError, match="broken skill"):
+        traced([failing], "open notepad")
+    assert tracer.getEvents()[-1]["error"] == "broken skill"
+
+
+def test_wrap_is_a_no_op_when_tracing_is_off(tracer):
+    tracer.enabled = False
+    assert tracer.wrap(getComponents, "user", describeUserCall) is getComponents
@@ -0,0 +1,56 @@
+import importlib.util
+
+import pytest
+
+from TechBook_Utils.SchemaCache import SchemaCache
+
+TOOL_SOURCE = '''
+def getDate(format="%s"):
+    """Get today's date."""
+'''
+
+
+def loadTool(path):
+    spec   = importlib.util.spec_from_file_location(f"_schema_{path.stem}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.getDate
+
+
+@pytest.fixture
+def cache():
+    cache = SchemaCache()
+    cache.schemas.clear()
+    yield cache
+    cache.schemas.clear()
+
+
+def build(func, schemaType):
+    return {"name": func.__name__, "default": func.__defaults__[0]}
+
+
+def test_edited_tool_replaces_its_schema(cache, tmp_path):
+    path = tmp_path / "get_date.py"
+    for version, default in enumerate(["%Y-%m-%d", "%d/%m/%Y", "%B %d, %Y"]):
+        path.write_text(TOOL_SOURCE % default + "#" * version)  # New size, so the edit is seen within one mtime tick.
+        assert cache.getSchema(loadTool(path), "responses", build)["default"] == default
+    assert len(cache.schemas) == 1
+
+
+def test_unchanged_tool_is_not_rebuilt(cache, tmp_path):
+    path = tmp_path / "get_date.py"
+    path.write_text(TOOL_SOURCE % "%Y-%m-%d")
+    calls = []
+    counted = lambda func, schemaType: calls.append(func) or build(func, schemaType)
+    for _ in range(3):
+        cache.getSchema(loadTool(path), "responses", counted)
+    assert len(calls) == 1
+
+
+def test_removed_tool_is_dropped_on_invalidate(cache, tmp_path):
+    path = tmp_path / "get_date.py"
+    path.write_text(TOOL_SOURCE % "%Y-%m-%d")
+    cache.getSchema(loadTool(path), "responses", build)
+    path.unlink()
+    cache.invalidate()
+    assert cache.schemas == {}
@@ -0,0 +1,50 @@
+import pytest
+
+from TechBook_Utils.SkillManifest import SkillManifest
+
+SKILL_SOURCE = '''
+import builtins
+builtins.manifestImports = getattr(builtins, "manifestImports", 0) + 1
+
+FOLDER = "%s"
+
+
+class Apps:
+    def __init__(self):
+        self.calls = 0
+
+    def appSkill(self, action):
+        self.calls += 1
+        return f"{FOLDER}:{action}:{self.calls}"
+'''
+
+
+@pytest.fixture
+def sameStemFiles(tmp_path):
+    files = []
+    for folder in ("Agent", "Tools"):
+        path = tmp_path / folder / "apps.py"
+        path.parent.mkdir()
+        path.write_text(SKILL_SOURCE % folder)
+        files.append(str(path))
+    return files
+
+
+def test_same_stem_modules_are_loaded_once_each(sameStemFiles):
+    import builtins
+    manifest = SkillManifest()
+    builtins.manifestImports = 0
+    agent, tools = sameStemFiles
+    for _ in range(3):
+        assert manifest.loadModule(agent).FOLDER == "Agent"
+        assert manifest.loadModule(tools).FOLDER == "Tools"
+    assert builtins.manifestImports == 2
+    assert manifest.moduleName(agent) != manifest.moduleName(tools)
+
+
+def test_resolved_methods_share_one_instance(sameStemFiles):
+    manifest = SkillManifest()
+    agent, tools = sameStemFiles
+    assert manifest.resolveCallable(agent, "appSkill", "Apps")("open") == "Agent:open:1"
+    assert manifest.resolveCallable(agent, "appSkill", "Apps")("open") == "Agent:open:2"
+    assert manifest.resolveCallable(tools, "appSkill", "Apps")("open") == "Tools:open:1"
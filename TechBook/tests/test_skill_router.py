@@ -0,0 +1,54 @@
+import pytest
+
+from TechBook_Utils.SkillRouter import SkillRouter
+
+
+class AppSkill:
+    def __init__(self):
+        self.nameMap   = {"vs code": "code", "word": "winword"}
+        self.actionMap = {"open": self.openApp, "close": self.closeApp}
+
+    def openApp(self, appName):
+        return f"Opened {appName}"
+
+    def closeApp(self, appName):
+        return f"Closed {appName}"
+
+
+class ClockSkill:
+    def __init__(self):
+        self.actionMap = {"what is the time": self.getTime}
+
+    def getTime(self, *args):
+        return "12:00"
+
+
+@pytest.fixture
+def router():
+    router = SkillRouter()
+    router.buildIndex([AppSkill(), ClockSkill()])
+    return router
+
+
+@pytest.mark.parametrize("content, phrase, args", [
+    ("please open notepad", "open", ("notepad",)),
+    ("can you please open vs code", "open", ("vs code",)),
+    ("hey close word now", "close", ("word",)),
+    ("what is the time please", "what is the time", ()),
+])
+def test_filler_words_route_to_the_bare_target(router, content, phrase, args):
+    match = router.route(content)
+    assert match is not None
+    assert (match.phrase, match.args) == (phrase, args)
+    assert match.action(*match.args) == match.skill.actionMap[phrase](*args)
+
+
+@pytest.mark.parametrize("content", [
+    "close your eyes and imagine a beach",
+    "can you open up about your feelings",
+    "open the door for me",
+    "open",
+    "what is the time in tokyo",
+])
+def test_prose_is_left_for_the_model(router, content):
+    assert router.route(content) is None
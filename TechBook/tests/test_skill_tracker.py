@@ -0,0 +1,52 @@
+import importlib.util
+import sys
+
+import pytest
+
+from TechBook_Utils.SkillTracker import SkillTracker
+
+SKILL_SOURCE = '''
+class Apps:
+    def _metaData(self):
+        return {"className": "Apps", "description": "%s"}
+
+    def appSkill(self, action):
+        return action
+'''
+
+
+def loadAsLoader(path):
+    # The same naming the SkillLink loader uses, so both files end up as _dynamic_apps.
+    spec   = importlib.util.spec_from_file_location(f"_dynamic_{path.stem}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.modules[spec.name] = module
+    return module
+
+
+@pytest.fixture
+def sameStemSkills(tmp_path):
+    files = []
+    for folder in ("Agent", "Tools"):
+        path = tmp_path / folder / "apps.py"
+        path.parent.mkdir()
+        path.write_text(SKILL_SOURCE % folder)
+        files.append(path)
+    yield files, [loadAsLoader(path).Apps() for path in files]
+    sys.modules.pop("_dynamic_apps", None)
+
+
+def test_same_stem_skills_keep_their_own_state(sameStemSkills):
+    files, skills = sameStemSkills
+    tracker = SkillTracker()
+    states  = tracker.getStates(skills)
+    assert set(states) == {(str(path), "Apps") for path in files}
+
+
+def test_editing_the_shadowed_file_is_reported(sameStemSkills):
+    files, skills = sameStemSkills
+    tracker = SkillTracker()
+    before  = tracker.getStates(skills)
+    files[0].write_text(SKILL_SOURCE % "Agent, edited" + "\n")
+    changes = tracker.diff(before, tracker.getStates(skills))
+    assert list(changes["changed"]) == [(str(files[0]), "Apps")]
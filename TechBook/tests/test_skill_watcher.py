@@ -0,0 +1,50 @@
+import sys
+
+import pytest
+
+from TechBook_Utils.SkillWatcher import SkillWatcher
+
+SKILL_SOURCE = '''
+FOLDER = "%s"
+
+
+class Apps:
+    def appSkill(self, action):
+        return f"{FOLDER}:{action}"
+'''
+
+
+@pytest.fixture
+def sameStemComponent(tmp_path):
+    watcher = SkillWatcher()
+    files   = []
+    for folder in ("Agent", "Tools"):
+        path = tmp_path / folder / "apps.py"
+        path.parent.mkdir()
+        path.write_text(SKILL_SOURCE % folder)
+        files.append(path)
+    component = [item for path in files for item in watcher.loadFile(str(path))]
+    for path in files:
+        watcher.directories[str(path.parent.resolve())] = (component, None)
+    yield watcher, files, component
+    for path in files:
+        watcher.directories.pop(str(path.parent.resolve()), None)
+        sys.modules.pop(watcher.moduleName(str(path)), None)
+
+
+def test_reloading_one_file_keeps_the_same_stem_skill(sameStemComponent):
+    watcher, (agent, tools), component = sameStemComponent
+    agentSkill   = component[0]
+    agentModule  = sys.modules[watcher.moduleName(str(agent))]
+    tools.write_text(SKILL_SOURCE % "Tools, edited")
+    watcher.reloadPaths([str(tools)])
+    assert component[0] is agentSkill
+    assert [skill.appSkill("open") for skill in component] == ["Agent:open", "Tools, edited:open"]
+    assert sys.modules[watcher.moduleName(str(agent))] is agentModule
+
+
+def test_removing_one_file_keeps_the_same_stem_skill(sameStemComponent):
+    watcher, (agent, tools), component = sameStemComponent
+    tools.unlink()
+    watcher.reloadPaths([str(tools)])
+    assert [skill.appSkill("open") for skill in component] == ["Agent:open"]
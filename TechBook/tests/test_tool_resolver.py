@@ -0,0 +1,28 @@
+import pytest
+
+import TechBook_Utils.ToolResolver as toolResolver
+from TechBook_Utils.ToolResolver import ToolResolver
+
+TOOLS = {"getWeather": None, "get_humidity": None, "getWindSpeed": None, "getDate": None}
+
+
+@pytest.fixture(params=["rapidfuzz", "ngrams"])
+def resolver(request, monkeypatch):
+    if request.param == "ngrams":
+        monkeypatch.setattr(toolResolver, "fuzz", None)
+    elif toolResolver.fuzz is None:
+        pytest.skip("rapidfuzz is not installed")
+    resolver = ToolResolver()
+    resolver.buildIndex(TOOLS)
+    return resolver
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("getWeather", "getWeather"),
+    ("get_weather", "getWeather"),
+    ("GetHumidity", "get_humidity"),
+    ("getWindSpeeds", "getWindSpeed"),
+    ("playMusic", None),
+])
+def test_resolves_misspelled_tool_names(resolver, name, expected):
+    assert resolver.resolve(name, TOOLS) == expected
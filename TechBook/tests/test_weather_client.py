@@ -0,0 +1,91 @@
+import json
+import threading
+import http.server
+import concurrent.futures
+
+import pytest
+
+from TechBook_Utils.WeatherClient import WeatherClient
+
+FORECAST = {
+    "current_weather": {"time": "2024-06-01T13:15", "temperature": 21.5, "windspeed": 9.0},
+    "hourly":          {"time": ["2024-06-01T12:00", "2024-06-01T13:00"], "relative_humidity_2m": [40, 45]},
+}
+
+
+class ForecastStub(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), ForecastHandler)
+        self.requests = 0
+        self.status   = 200
+        self.release  = threading.Event()
+
+
+class ForecastHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requests += 1
+        self.server.release.wait(5)  # Hold the response until every caller is waiting on it.
+        body = FORECAST if self.server.status == 200 else {"error": True, "reason": "stub failure"}
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(self.server.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub():
+    server = ForecastStub()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.release.set()
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(stub, monkeypatch):
+    monkeypatch.setenv("WEATHER_URL", f"http://127.0.0.1:{stub.server_address[1]}/v1/forecast")
+    monkeypatch.setenv("WEATHER_TTL", "3600")
+    monkeypatch.setattr(WeatherClient, "_instance", None)
+    client = WeatherClient()
+    yield client
+    client.executor.loopHooks.remove(client.closeAsync)
+    client.session.close()
+
+
+def getConcurrently(client, stub, count=8):
+    with concurrent.futures.ThreadPoolExecutor(max_workers=count) as pool:
+        futures = [pool.submit(client.getForecast, 47.6588, -117.4260) for _ in range(count)]
+        while not client.inflight:
+            threading.Event().wait(0.01)
+        threading.Event().wait(0.2)  # Let the other callers reach the fetch in flight.
+        stub.release.set()
+        return [future.result(timeout=5) for future in futures]
+
+
+def test_concurrent_calls_share_one_request(client, stub):
+    results = getConcurrently(client, stub)
+    assert stub.requests == 1
+    assert all(result == FORECAST for result in results)
+    assert client.getForecast(47.6588, -117.4260) == FORECAST
+    assert stub.requests == 1
+
+
+def test_failed_fetch_releases_every_caller_and_is_not_cached(client, stub):
+    stub.status = 500
+    results = getConcurrently(client, stub)
+    assert stub.requests == 1
+    assert all(result["error"] for result in results)
+    assert client.inflight == {}
+
+    stub.status = 200
+    assert client.getForecast(47.6588, -117.4260) == FORECAST
+    assert stub.requests == 2